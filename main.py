@@ -1,17 +1,39 @@
+import json
+import multiprocessing
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QComboBox, QSpinBox, QPushButton, QColorDialog, QTableWidget,
     QTableWidgetItem, QGroupBox, QMessageBox, QCheckBox, QSplitter, QTextEdit,
     QHeaderView, QFrame, QSizePolicy, QSlider, QToolTip, QAction, QMenu,QLineEdit, 
-    QShortcut, QStyle, QFileDialog, QScrollArea, QToolBar, QStatusBar
+    QShortcut, QStyle, QFileDialog, QScrollArea, QToolBar, QStatusBar, QProgressBar,
+    QTableView, QStyledItemDelegate, QTabWidget
 )
-from PyQt5.QtGui import QColor, QFont, QPalette, QKeySequence, QIcon, QPainter, QBrush,QIntValidator
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QColor, QFont, QPalette, QKeySequence, QIcon, QPainter, QBrush,QIntValidator, QRegExpValidator
+from PyQt5.QtCore import Qt, QSize, QThread, pyqtSignal, QAbstractTableModel, QModelIndex, QRegExp
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 import numpy as np
 
+from scheduler import Cancelled, run as run_algorithm
+from scheduler.engine import ALIASES, MLFQ_BOOST, MLFQ_LEVELS
+from scheduler.compare import compare as compare_algorithms
+from scheduler import gantt
+from scheduler.jobs import release_deadline
+from scheduler.cache import ResultCache, cached_run
+from scheduler.hyperperiod import SteadyState
+from scheduler.incremental import Simulation
+from scheduler.multicore import GLOBAL_POLICIES, run_multicore
+from scheduler.overhead import KINDS as OVERHEAD_KINDS, Overhead
+from scheduler.policies import MLFQ
+from scheduler.schedulability import check as check_schedulability
+from scheduler.stats import PROCESS_FIELDS, analyze
+from scheduler.store import Columns, ResultStore, save_result
+from scheduler.taskset import (
+    column_processes, load_columns, parse_processes, process_columns, save_taskset
+)
+
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 
@@ -25,6 +47,9 @@ for style in preferred_styles:
 else:
     print("Warning: No preferred style found. Using default matplotlib style.")
 
+# Largest value a QSpinBox holds; task-set files may ask for anything the engine runs
+SPIN_MAX = 2**31 - 1
+
 # Custom Colors scheme
 COLORS = {
     'primary': '#2c3e50',
@@ -91,7 +116,7 @@ QComboBox:focus, QSpinBox:focus {{
 }}
 
 
-QTableWidget {{
+QTableView {{
     alternate-background-color: #eaeaea;
     gridline-color: #d4d4d4;
     
@@ -170,6 +195,17 @@ class CustomCanvas(FigureCanvas):
         self.updateGeometry()
         fig.tight_layout()
 
+# Engine algorithm keys the GUI shows under their combo-box name
+DISPLAY_NAMES = {"ML": "Minimum Laxity"}
+
+def display_name(alg):
+    return DISPLAY_NAMES.get(alg, alg)
+
+# At most ``n`` lines of a message dialog, then how many were left out
+def limited_lines(lines, n=10):
+    more = [f"... and {len(lines) - n} more"] if len(lines) > n else []
+    return "\n".join(lines[:n] + more)
+
 # Custom horizontal line for separation
 class HorizontalLine(QFrame):
     def __init__(self):
@@ -177,6 +213,164 @@ class HorizontalLine(QFrame):
         self.setFrameShape(QFrame.HLine)
         self.setFrameShadow(QFrame.Sunken)
         self.setStyleSheet(f"background-color: {COLORS['secondary']};")
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """Process parameters held as NumPy columns.
+
+    Rows are inserted and exported in bulk, so a task set of thousands of
+    processes costs a few arrays rather than a widget per cell.
+    """
+    headers = ["Process", "r_i", "p_i", "e_i", "d_i", "Priority", "Color"]
+    tooltips = [
+        "Process ID", "Release/Arrival Time", "Period",
+        "Execution Time", "Deadline", "Priority (1=highest)", "Process Color"
+    ]
+    # Columns 1-5 map onto these value columns, with the largest accepted value
+    fields = ('arrival', 'period', 'execution', 'deadline', 'priority')
+    limits = (1000, 1000, 1000, 1000, 10)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.simple = False
+        self.names = []
+        self.values = np.empty((0, len(self.fields)), dtype=np.int64)
+        self.colors = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        disabled = self.simple and section in (1, 4)
+        if role == Qt.DisplayRole:
+            return self.headers[section]
+        if role == Qt.ToolTipRole:
+            tip = self.tooltips[section]
+            return f"{tip} (disabled in simple mode)" if disabled else tip
+        if role == Qt.ForegroundRole:
+            return QColor(Qt.gray) if disabled else QColor(Qt.white)
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if 1 <= index.column() <= 5:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if c == 0:
+                return self.names[r]
+            if c < 6:
+                return str(self.values[r, c - 1])
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if c == 6 and role == Qt.BackgroundRole:
+            return QColor(self.colors[r])
+        if c == 6 and role == Qt.ToolTipRole:
+            return "Click to change process color"
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        c = index.column()
+        if role != Qt.EditRole or not 1 <= c <= 5:
+            return False
+        try:
+            value = int(value)
+        except ValueError:
+            return False
+        if not 0 <= value <= self.limits[c - 1]:
+            return False
+        self.values[index.row(), c - 1] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def set_simple(self, simple):
+        self.simple = simple
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.headers) - 1)
+
+    def set_color(self, row, color):
+        self.colors[row] = color
+        index = self.index(row, 6)
+        self.dataChanged.emit(index, index)
+
+    def insert_processes(self, procs):
+        """Append process dicts in one step."""
+        if procs:
+            self.insert_columns(process_columns(procs))
+
+    def insert_columns(self, cols):
+        """Append ``process_columns`` columns (missing colors get random ones)."""
+        n, first = len(cols['period']), len(self.names)
+        if not n:
+            return
+        rgb = np.random.randint(0, 255, (n, 3)).tolist()
+        self.beginInsertRows(QModelIndex(), first, first + n - 1)
+        self.names.extend(cols['name'])
+        self.values = np.concatenate((self.values, np.column_stack([cols[k] for k in self.fields])))
+        self.colors.extend(c or "#{:02x}{:02x}{:02x}".format(*x) for c, x in zip(cols['color'], rgb))
+        self.endInsertRows()
+
+    def out_of_range(self, cols, first=None):
+        """Messages for the values of ``cols`` outside ``limits``, one per cell.
+
+        Rows are numbered as they would appear after row ``first`` (default:
+        appended after the existing rows).
+        """
+        first = len(self.names) if first is None else first
+        bad = [(i, k, cols[k][i], limit) for k, limit in zip(self.fields, self.limits)
+               for i in np.flatnonzero((cols[k] < 0) | (cols[k] > limit)).tolist()]
+        return [f"Row {first + i + 1}: {k} {value} is outside 0-{limit}"
+                for i, k, value, limit in sorted(bad, key=lambda b: b[0])]
+
+    def set_columns(self, cols):
+        self.beginResetModel()
+        self.names, self.colors = [], []
+        self.values = np.empty((0, len(self.fields)), dtype=np.int64)
+        self.endResetModel()
+        self.insert_columns(cols)
+
+    def remove_last(self):
+        n = len(self.names)
+        self.beginRemoveRows(QModelIndex(), n - 1, n - 1)
+        del self.names[-1], self.colors[-1]
+        self.values = self.values[:-1]
+        self.endRemoveRows()
+
+    def columns(self):
+        """Rows as ``process_columns`` columns; simple mode forces r_i = 0 and d_i = p_i."""
+        cols = {k: self.values[:, i].copy() for i, k in enumerate(self.fields)}
+        if self.simple:
+            cols['arrival'][:] = 0
+            cols['deadline'] = cols['period'].copy()
+        cols['name'] = list(self.names)
+        cols['color'] = list(self.colors)
+        return cols
+
+    def processes(self):
+        """Engine process dicts for every row."""
+        return column_processes(self.columns())
+
+
+class ProcessDelegate(QStyledItemDelegate):
+    """Integer editors for the process table, bounded like the model."""
+
+    def createEditor(self, parent, option, index):
+        le = QLineEdit(parent)
+        le.setValidator(QIntValidator(0, ProcessTableModel.limits[index.column() - 1], le))
+        le.setAlignment(Qt.AlignCenter)
+        return le
+
+
 class ProcessConfigPanel(QWidget):
     def __init__(self):
         super().__init__()
@@ -209,27 +403,22 @@ class ProcessConfigPanel(QWidget):
         table_label.setFont(QFont("Arial", 9, QFont.Bold))
         v.addWidget(table_label)
 
-        self.table = QTableWidget(0, 7)  
+        self.model = ProcessTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(ProcessDelegate(self.table))
         self.table.setAlternatingRowColors(True)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        headers = ["Process", "r_i", "p_i", "e_i", "d_i", "Priority", "Color"]
-        tooltips = [
-            "Process ID", "Release/Arrival Time", "Period", 
-            "Execution Time", "Deadline", "Priority (1=highest)", "Process Color"
-        ]
-
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-        for i, tip in enumerate(tooltips):
-            self.table.horizontalHeaderItem(i).setToolTip(tip)
+        self.table.clicked.connect(self.cell_clicked)
 
         hdr = self.table.horizontalHeader()
-        for i in range(len(headers)):
+        for i in range(len(self.model.headers)):
             if i == 0 or i == 6:
                 hdr.setSectionResizeMode(i, QHeaderView.ResizeToContents)
             else:
                 hdr.setSectionResizeMode(i, QHeaderView.Stretch)
 
+        self.table.verticalHeader().setDefaultSectionSize(30)
         self.table.verticalHeader().setVisible(False)
         self.table.setMinimumHeight(150)
         self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -249,8 +438,13 @@ class ProcessConfigPanel(QWidget):
         rem.setStyleSheet(f"background-color:{COLORS['danger']}; color: white;")
         # rem.setIcon(self.style().standardIcon(QStyle.SP_TrashIcon))
         rem.clicked.connect(self.remove_process)
+        paste = QPushButton("Paste CSV")
+        paste.setToolTip("Append processes from CSV on the clipboard (Ctrl+V in the table)")
+        paste.clicked.connect(self.paste_processes)
+        QShortcut(QKeySequence.Paste, self.table, self.paste_processes)
         ctrl.addWidget(add)
         ctrl.addWidget(rem)
+        ctrl.addWidget(paste)
         ctrl.addStretch()
         v.addLayout(ctrl)
 
@@ -266,14 +460,20 @@ class ProcessConfigPanel(QWidget):
 
         jobs_slider_layout = QHBoxLayout()
         self.jobs_spin = QSpinBox()
-        self.jobs_spin.setRange(1, 20)
+        self.jobs_spin.setRange(1, SPIN_MAX)
         self.jobs_spin.setValue(2)
         self.jobs_spin.valueChanged.connect(lambda v: jobs_value_label.setText(str(v)))
         jobs_slider = QSlider(Qt.Horizontal)
         jobs_slider.setRange(1, 20)
         jobs_slider.setValue(2)
         jobs_slider.valueChanged.connect(self.jobs_spin.setValue)
-        self.jobs_spin.valueChanged.connect(jobs_slider.setValue)
+
+        def follow(v):
+            # The slider covers 1-20; a larger count must not be clamped back through it
+            jobs_slider.blockSignals(True)
+            jobs_slider.setValue(v)
+            jobs_slider.blockSignals(False)
+        self.jobs_spin.valueChanged.connect(follow)
         jobs_slider_layout.addWidget(jobs_slider)
         jobs_slider_layout.addWidget(self.jobs_spin)
         jobs_layout.addLayout(jobs_slider_layout)
@@ -287,93 +487,54 @@ class ProcessConfigPanel(QWidget):
         simple = self.simple_mode.isChecked()
         self.table.setColumnHidden(1, simple)
         self.table.setColumnHidden(4, simple)
-        for col in (1, 4):
-            item = self.table.horizontalHeaderItem(col)
-            if simple:
-                item.setForeground(Qt.gray)
-                item.setToolTip(f"{item.toolTip()} (disabled in simple mode)")
-            else:
-                item.setForeground(Qt.white)
-                item.setToolTip(item.toolTip().replace(" (disabled in simple mode)", ""))
+        self.model.set_simple(simple)
 
     def add_process(self):
-        r = self.table.rowCount()
-        self.table.insertRow(r)
-
-        # Process ID
-        pid = QTableWidgetItem(f"P{r+1}")
-        pid.setFlags(pid.flags() & ~Qt.ItemIsEditable)
-        pid.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(r, 0, pid)
-
-        # Numeric input fields
-        def create_input(col, default, max_val=1000):
-            le = QLineEdit(str(default))
-            le.setValidator(QIntValidator(0, max_val))
-            le.setAlignment(Qt.AlignCenter)
-            # le.setStyleSheet("background: white; border: 1px solid #bdc3c7;")
-            self.table.setCellWidget(r, col, le)
-
-        # Arrival time
-        if not self.simple_mode.isChecked():
-            create_input(1, 0)
-
-        # Period, Execution, Deadline
-        create_input(2, 6)
-        create_input(3, 2)
-        if not self.simple_mode.isChecked():
-            create_input(4, 6)
-
-        # Priority
-        create_input(5, r+1, 10)
-
-        # Color picker
-
-        color = QColor(*[np.random.randint(0, 255) for _ in range(3)])
-        btn = QPushButton()
-        btn.setProperty('color', color)
-        btn.setStyleSheet(f"background-color:{color.name()}; border: 1px solid #999;")
-        btn.setToolTip("Click to change process color")
-        btn.setFixedWidth(40)
-        btn.clicked.connect(lambda _, row=r: self.choose_color(row))
-        self.table.setCellWidget(r, 6, btn)
-        self.table.setRowHeight(r, 30)
+        r = self.model.rowCount()
+        self.model.insert_processes([{'name': f"P{r+1}", 'arrival': 0, 'period': 6,
+                                      'execution': 2, 'deadline': 6, 'priority': r+1}])
 
     def remove_process(self):
-        if self.table.rowCount() > 1:
-            self.table.removeRow(self.table.rowCount() - 1)
+        if self.model.rowCount() > 1:
+            self.model.remove_last()
+
+    def set_processes(self, procs):
+        """Replace the table contents with engine process dicts."""
+        self.model.set_columns(process_columns(procs))
+
+    def set_columns(self, cols):
+        """Replace the table contents with ``process_columns`` columns."""
+        self.model.set_columns(cols)
+
+    def paste_processes(self):
+        try:
+            procs = parse_processes(QApplication.clipboard().text(), self.model.rowCount())
+        except ValueError as e:
+            QMessageBox.warning(self, "Paste Error", f"Could not read processes from the clipboard:\n{e}")
+            return
+        if not procs:
+            return
+        cols = process_columns(procs)
+        problems = self.model.out_of_range(cols)
+        if problems:
+            QMessageBox.warning(self, "Paste Error", "Some pasted values are out of range:\n"
+                                + limited_lines(problems))
+            return
+        self.model.insert_columns(cols)
+
+    def cell_clicked(self, index):
+        if index.column() == 6:
+            self.choose_color(index.row())
+
     # Choose color for process
     def choose_color(self, row):
-        btn = self.table.cellWidget(row, 6)
-        curr = btn.property('color')
+        curr = QColor(self.model.colors[row])
         c = QColorDialog.getColor(curr, self, "Choose Process Color")
         if c.isValid():
-            btn.setProperty('color', c)
-            btn.setStyleSheet(f"background-color:{c.name()}; border: 1px solid #999;")
+            self.model.set_color(row, c.name())
 
     def get_processes(self):
-        procs = []
-        simple = self.simple_mode.isChecked()
-        for r in range(self.table.rowCount()):
-            def get_val(col):
-                return int(self.table.cellWidget(r, col).text())
-
-            arrival = 0 if simple else get_val(1)
-            period = get_val(2)
-            execution = get_val(3)
-            deadline = period if simple else get_val(4)
-            
-            procs.append({
-                'id': r,
-                'name': self.table.item(r, 0).text(),
-                'arrival': arrival,
-                'period': period,
-                'execution': execution,
-                'deadline': deadline,
-                'priority': get_val(5),
-                'color': self.table.cellWidget(r, 6).property('color').name()
-            })
-        return procs, self.jobs_spin.value()
+        return self.model.processes(), self.jobs_spin.value()
 # Scheduler Algorithm Panel
 class AlgorithmPanel(QWidget):
     def __init__(self):
@@ -405,14 +566,10 @@ class AlgorithmPanel(QWidget):
 
         self.combo.addItem("-- Multilevel --")
         self.combo.model().item(6).setEnabled(False)
-        self.combo.addItem("Multilevel Queues")
+        self.combo.addItems(["Multilevel Queues", "MLFQ"])
         self.combo.addItem("-- Real-Time --")
-        self.combo.model().item(8).setEnabled(False)
+        self.combo.model().item(9).setEnabled(False)
         self.combo.addItems(["Minimum Laxity", "RMS", "EDF"])
-        # coming soon
-        self.combo.addItem("-- Coming Soon! --")
-        self.combo.model().item(11).setEnabled(False)
-        self.combo.addItem("MLFQ")
 
         # Set tooltips for algorithms
         tooltips = {
@@ -422,6 +579,8 @@ class AlgorithmPanel(QWidget):
             "Priority": "Preemptive priority scheduling", # Preemptive priority scheduling
             "Round Robin": "Time-sharing algorithm using time quantum", # Round Robin
             "Multilevel Queues": "Multiple queues with different priorities", # Multilevel Queues
+            "MLFQ": "Multilevel Feedback Queue - jobs drop a level when they use up its "
+                    "quantum (doubled per level) and are periodically boosted back", # MLFQ
             "Minimum Laxity": "Schedules based on slack time (deadline - remaining execution)", # Minimum Laxity
             "RMS": "Rate Monotonic Scheduling - Static priority based on period", # Rate Monotonic Scheduling
             "EDF": "Earliest Deadline First - Dynamic priority based on absolute deadline" # Earliest Deadline First
@@ -447,28 +606,121 @@ class AlgorithmPanel(QWidget):
         self.tq_label = QLabel("Time Quantum:")
         self.tq_label.setFont(QFont("Arial", 9))
         self.tq = QSpinBox()
-        self.tq.setRange(1, 50)
+        self.tq.setRange(1, SPIN_MAX)
         self.tq.setValue(2)
-        self.tq.setToolTip("Time slice for Round Robin scheduling")
+        self.tq.setToolTip("Time slice for Round Robin scheduling (MLFQ: top-level slice)")
         grid.addWidget(self.tq_label, 0, 0)
         grid.addWidget(self.tq, 0, 1)
 
+        # Laxity recheck interval (Minimum Laxity)
+        self.recheck_label = QLabel("Laxity Recheck:")
+        self.recheck_label.setFont(QFont("Arial", 9))
+        self.recheck = QSpinBox()
+        self.recheck.setRange(0, 50)
+        self.recheck.setSpecialValueText("Releases only")
+        self.recheck.setToolTip("Also re-evaluate laxities every this many time units "
+                                "(0: only when a job is released)")
+        grid.addWidget(self.recheck_label, 1, 0)
+        grid.addWidget(self.recheck, 1, 1)
+
+        # MLFQ levels, their quanta and the boost interval
+        self.levels_label = QLabel("MLFQ Levels:")
+        self.levels_label.setFont(QFont("Arial", 9))
+        self.levels = QSpinBox()
+        self.levels.setRange(1, 256)
+        self.levels.setValue(MLFQ_LEVELS)
+        self.levels.setToolTip("Number of MLFQ queue levels")
+        grid.addWidget(self.levels_label, 2, 0)
+        grid.addWidget(self.levels, 2, 1)
+
+        self.quanta_label = QLabel("Level Quanta:")
+        self.quanta_label.setFont(QFont("Arial", 9))
+        self.quanta = QLineEdit()
+        self.quanta.setPlaceholderText("Time Quantum × 2^level")
+        self.quanta.setValidator(QRegExpValidator(QRegExp(r"[0-9, ]*")))
+        self.quanta.setToolTip("Comma-separated quantum of each level, top first "
+                               "(sets the number of levels)")
+        grid.addWidget(self.quanta_label, 3, 0)
+        grid.addWidget(self.quanta, 3, 1)
+
+        self.boost_label = QLabel("Boost Every:")
+        self.boost_label.setFont(QFont("Arial", 9))
+        self.boost = QSpinBox()
+        self.boost.setRange(-1, SPIN_MAX)
+        self.boost.setValue(-1)
+        self.boost.setSpecialValueText(f"{MLFQ_BOOST} bottom quanta")
+        self.boost.setToolTip("Move every job back to the top level every this many time "
+                              "units (0: never)")
+        grid.addWidget(self.boost_label, 4, 0)
+        grid.addWidget(self.boost, 4, 1)
+
         # Max Time
         self.max_t_label = QLabel("Max Time:")
         self.max_t_label.setFont(QFont("Arial", 9))
         self.max_t = QSpinBox()
-        self.max_t.setRange(10, 1000)
+        self.max_t.setRange(10, SPIN_MAX)
         self.max_t.setValue(100) 
         self.max_t.setToolTip("Maximum simulation time")
-        grid.addWidget(self.max_t_label, 1, 0)
-        grid.addWidget(self.max_t, 1, 1)
+        grid.addWidget(self.max_t_label, 5, 0)
+        grid.addWidget(self.max_t, 5, 1)
+
+        # Cores
+        cores_label = QLabel("Cores:")
+        cores_label.setFont(QFont("Arial", 9))
+        self.cores = QSpinBox()
+        self.cores.setRange(1, 64)
+        self.cores.setValue(1)
+        self.cores.setToolTip("Number of identical cores to schedule on")
+        grid.addWidget(cores_label, 6, 0)
+        grid.addWidget(self.cores, 6, 1)
+
+        # Multicore scheduling: global queue or processes bin-packed onto cores
+        self.partition_label = QLabel("Multicore:")
+        self.partition_label.setFont(QFont("Arial", 9))
+        self.partition = QComboBox()
+        self.partition.addItems(["global", "first-fit", "worst-fit"])
+        self.partition.setToolTip("global: the best jobs run on any core (EDF, RMS, ML)\n"
+                                  "first-fit / worst-fit: each process is bound to one core")
+        grid.addWidget(self.partition_label, 7, 0)
+        grid.addWidget(self.partition, 7, 1)
+
+        # Scheduler overhead charged at every dispatch (scheduler.overhead)
+        self.costs = {}
+        tips = {
+            'switch': "Time charged for each context switch",
+            'dispatch': "Time charged each time the scheduler dispatches a job",
+            'reload': "Extra time charged when a preempted job resumes (cold cache)",
+        }
+        for row, kind in enumerate(('switch', 'dispatch', 'reload'), 8):
+            label = QLabel(f"{kind.capitalize()} Cost:")
+            label.setFont(QFont("Arial", 9))
+            spin = QSpinBox()
+            spin.setRange(0, 50)
+            spin.setToolTip(tips[kind])
+            grid.addWidget(label, row, 0)
+            grid.addWidget(spin, row, 1)
+            self.costs[kind] = spin
 
         # Show Missed
         self.show_miss = QCheckBox("Show Missed Deadlines")
         self.show_miss.setFont(QFont("Arial", 9))
         self.show_miss.setChecked(True)
         self.show_miss.setToolTip("Highlight missed deadlines on the Gantt chart")
-        grid.addWidget(self.show_miss, 2, 0, 1, 2)
+        grid.addWidget(self.show_miss, 11, 0, 1, 2)
+
+        # Steady State
+        self.steady = QCheckBox("Stop at Steady State")
+        self.steady.setFont(QFont("Arial", 9))
+        self.steady.setToolTip("Stop once the schedule repeats every hyperperiod and "
+                               "extrapolate the statistics to Max Time")
+        grid.addWidget(self.steady, 12, 0, 1, 2)
+
+        # Live re-run
+        self.live = QCheckBox("Re-run on Edit")
+        self.live.setFont(QFont("Arial", 9))
+        self.live.setToolTip("Re-simulate as soon as a process is edited, resuming from "
+                             "the last checkpoint before the first changed job")
+        grid.addWidget(self.live, 13, 0, 1, 2)
 
         g.addWidget(params_group)
 
@@ -497,10 +749,23 @@ class AlgorithmPanel(QWidget):
         self.run.setIconSize(QSize(16, 16))
         g.addWidget(self.run)
 
+        # Compare every algorithm on the same task set
+        self.compare = QPushButton("Compare All")
+        self.compare.setFont(QFont("Arial", 9, QFont.Bold))
+        self.compare.setToolTip("Run every algorithm in parallel and compare the results")
+        self.compare.setIcon(self.style().standardIcon(QStyle.SP_FileDialogDetailedView))
+        self.compare.setIconSize(QSize(16, 16))
+        g.addWidget(self.compare)
+
         v.addWidget(gb)
         v.addStretch()
 
         self.combo.currentTextChanged.connect(self.update_fields_visibility)
+        self.cores.valueChanged.connect(self.update_fields_visibility)
+        self.partition.currentTextChanged.connect(self.update_fields_visibility)
+        for spin in list(self.costs.values()) + [self.recheck, self.levels, self.boost]:
+            spin.valueChanged.connect(self.update_fields_visibility)
+        self.quanta.textChanged.connect(self.update_fields_visibility)
         self.update_fields_visibility()
 
     def update_fields_visibility(self):
@@ -511,7 +776,7 @@ class AlgorithmPanel(QWidget):
             self.combo.setCurrentIndex(self.combo.currentIndex() + 1)
             return
             
-        needs_quantum = (alg == "Round Robin")
+        needs_quantum = alg in ("Round Robin", "MLFQ")
         needs_maxt = (alg not in ["FCFS", "SJN"])
         
         self.tq.setVisible(needs_quantum)
@@ -520,6 +785,222 @@ class AlgorithmPanel(QWidget):
         self.max_t.setVisible(needs_maxt)
         self.max_t_label.setVisible(needs_maxt)
 
+        needs_recheck = alg == "Minimum Laxity"
+        self.recheck.setVisible(needs_recheck)
+        self.recheck_label.setVisible(needs_recheck)
+
+        needs_mlfq = alg == "MLFQ"
+        for widget in (self.levels, self.levels_label, self.quanta, self.quanta_label,
+                       self.boost, self.boost_label):
+            widget.setVisible(needs_mlfq)
+        # Explicit quanta set the number of levels
+        self.levels.setEnabled(not self.mlfq_quanta())
+
+        multicore = self.cores.value() > 1
+        self.partition.setVisible(multicore)
+        self.partition_label.setVisible(multicore)
+        # Global scheduling only runs GLOBAL_POLICIES, without options
+        global_only = multicore and self.partition.currentText() == "global"
+        model = self.combo.model()
+        for i in range(self.combo.count()):
+            name = self.combo.itemText(i)
+            if not name.startswith("--"):
+                model.item(i).setEnabled(
+                    not global_only or ALIASES.get(name, name) in GLOBAL_POLICIES)
+        if global_only and self.algorithm() not in GLOBAL_POLICIES:
+            self.combo.setCurrentText("EDF")
+            return
+        self.recheck.setEnabled(not global_only)
+        # Single-core-only options; overhead and option runs are neither extrapolated
+        # nor resumed
+        costly = self.overhead() is not None or bool(self.options())
+        for spin in self.costs.values():
+            spin.setEnabled(not multicore)
+        self.steady.setEnabled(not multicore and not costly)
+        self.live.setEnabled(not multicore and not costly)
+
+    def algorithm(self):
+        """Engine name of the selected algorithm."""
+        alg = self.combo.currentText()
+        return ALIASES.get(alg, alg)
+
+    def set_algorithm(self, alg):
+        """Select the engine algorithm ``alg`` by the name the combo shows for it."""
+        names = [name for name, target in ALIASES.items() if target == alg] + [alg]
+        for name in names:
+            if self.combo.findText(name) >= 0:
+                self.combo.setCurrentText(name)
+                return
+
+    def mlfq_quanta(self):
+        """The MLFQ quanta typed in, or an empty list for the default ones."""
+        return [int(q) for q in self.quanta.text().replace(' ', '').split(',') if q]
+
+    def options(self):
+        """Algorithm-specific options for the engine."""
+        if self.algorithm() == "ML" and self.recheck.isEnabled() and self.recheck.value():
+            return {'recheck': self.recheck.value()}
+        if self.algorithm() == "MLFQ":
+            options = {}
+            if self.mlfq_quanta():
+                options['quanta'] = self.mlfq_quanta()
+            elif self.levels.value() != MLFQ_LEVELS:
+                options['levels'] = self.levels.value()
+            if self.boost.value() >= 0:
+                options['boost'] = self.boost.value()
+            return options
+        return {}
+
+    def overhead(self):
+        """The configured scheduler overhead, or None if it costs nothing."""
+        costs = {kind: spin.value() for kind, spin in self.costs.items()}
+        return Overhead(**costs) or None
+
+
+class JobTableModel(QAbstractTableModel):
+    """Job analysis rows over the schedule arrays.
+
+    Cells are formatted only when the view asks for them, and sorting and the
+    "missed only" filter just reorder an index array, so the table costs the
+    same to open for ten slices or a million.
+    """
+    headers = ["Job", "Start", "End", "Deadline", "Missed", "Response Time", "Waiting Time"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.missed_only = False
+        self.sort_key = None
+        self.set_result([], [], [])
+
+    def set_result(self, sch, missed, procs):
+        self.beginResetModel()
+        job, start, end, pid = gantt.schedule_arrays(sch)
+        arrival, deadline = release_deadline(procs, job, pid)
+        if isinstance(sch, Columns):
+            missed_mask = sch.missed  # Precomputed by the result store
+        else:
+            # A slice is "missed" when its (job, pid) is in the missed list
+            mjob, _, mpid = gantt.missed_arrays(missed)
+            width = int(max(job.max(initial=0), mjob.max(initial=0))) + 1
+            missed_mask = np.isin(pid * width + job, mpid * width + mjob)
+        self.columns = [None, start, end, deadline, missed_mask, end - arrival, start - arrival]
+        self.job, self.pid = job, pid
+        self.order = np.arange(len(job))
+        self.apply_sort()
+        self.rows = self.filtered()
+        self.endResetModel()
+
+    def filtered(self):
+        if self.missed_only:
+            return self.order[self.columns[4][self.order]]
+        return self.order
+
+    def apply_sort(self):
+        if self.sort_key is None:
+            return
+        column, order = self.sort_key
+        if column < 0:
+            # No sort indicator: schedule order
+            self.order = np.arange(len(self.job))
+            return
+        # Descending sorts negate the keys, so equal rows keep schedule order
+        sign = -1 if order == Qt.DescendingOrder else 1
+        if column == 0:
+            self.order = np.lexsort((sign * self.job, sign * self.pid))
+        else:
+            key = sign * self.columns[column].astype(np.int64)
+            self.order = np.argsort(key, kind='stable')
+
+    def set_missed_only(self, missed_only):
+        self.beginResetModel()
+        self.missed_only = missed_only
+        self.rows = self.filtered()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        i, c = self.rows[index.row()], index.column()
+        if role == Qt.DisplayRole:
+            if c == 0:
+                return f"J{self.pid[i] + 1},{self.job[i] + 1}"
+            if c == 4:
+                return "Yes" if self.columns[4][i] else "No"
+            return str(self.columns[c][i])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        # Highlight missed deadlines
+        if c == 4 and self.columns[4][i]:
+            if role == Qt.ForegroundRole:
+                return QColor(COLORS['danger'])
+            if role == Qt.FontRole:
+                return QFont("Arial", 7, QFont.Bold)
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self.sort_key = (column, order)
+        self.apply_sort()
+        self.rows = self.filtered()
+        self.layoutChanged.emit()
+
+
+class ProcessStatsModel(QAbstractTableModel):
+    """Per-process rows of ``scheduler.stats.Analysis.per_process``."""
+    headers = ["Process", "Jobs", "Completed", "Missed", "Avg Response", "Max Response",
+               "Avg Waiting", "Max Tardiness", "Jitter", "p50", "p95", "p99"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.natural = self.rows = []
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.natural = [[r[k] for k in PROCESS_FIELDS] for r in rows]
+        self.rows = list(self.natural)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            v = self.rows[index.row()][index.column()]
+            return f"{v:.2f}" if isinstance(v, float) else str(v)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        if column < 0:
+            self.rows = list(self.natural)  # No sort indicator: process order
+        else:
+            self.rows.sort(key=lambda r: r[column], reverse=order == Qt.DescendingOrder)
+        self.layoutChanged.emit()
+
+
 class ResultPanel(QWidget):
     def __init__(self):
         super().__init__()
@@ -533,9 +1014,13 @@ class ResultPanel(QWidget):
         chart_layout = QVBoxLayout(gb)
         # chart_layout.setSpacing(2)
         
-        # Main Gantt chart
+        # Main Gantt chart (wheel zooms, toolbar pans/zooms; both charts share the x-range)
         self.canvas = CustomCanvas(height=2)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        self.toolbar.setIconSize(QSize(16, 16))
+        chart_layout.addWidget(self.toolbar)
         chart_layout.addWidget(self.canvas , stretch=8)
+        self.views = []
 
         # Horizontal line for separation
         chart_layout.addWidget(HorizontalLine())
@@ -551,6 +1036,8 @@ class ResultPanel(QWidget):
         self.canvas_contig = CustomCanvas(height=1)
         self.canvas_contig.setStyleSheet("background-color: #ecf0f1;")  # light background
         chart_layout.addWidget(self.canvas_contig, stretch=4)
+        for canvas in (self.canvas, self.canvas_contig):
+            canvas.mpl_connect('scroll_event', self.zoom)
         
         v.addWidget(gb)
 
@@ -568,60 +1055,73 @@ class ResultPanel(QWidget):
         self.text = QTextEdit()
         self.text.setReadOnly(True)
         self.text.setFont(QFont("Arial", 9))
-        self.text.setMaximumHeight(50)
+        self.text.setMaximumHeight(90)
         stats_layout.addWidget(self.text)
         
-        # Job analysis table
+        # Job analysis table and per-process statistics
+        job_header = QHBoxLayout()
         job_label = QLabel("Job Analysis:")
         job_label.setFont(QFont("Arial", 9, QFont.Bold))
-        stats_layout.addWidget(job_label)
+        job_header.addWidget(job_label)
+        job_header.addStretch()
+        self.missed_only = QCheckBox("Missed only")
+        job_header.addWidget(self.missed_only)
+        export = QPushButton("Export Stats")
+        export.setToolTip("Save per-process statistics as CSV, or everything as JSON")
+        export.clicked.connect(self.export_stats)
+        job_header.addWidget(export)
+        stats_layout.addLayout(job_header)
         
-        self.job_table = QTableWidget()
-        self.job_table.setFont(QFont("Arial", 9))
-        self.job_table.setAlternatingRowColors(True)
-        self.job_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.job_table.verticalHeader().setVisible(False)
-        stats_layout.addWidget(self.job_table)
+        self.job_model = JobTableModel(self)
+        self.missed_only.toggled.connect(self.job_model.set_missed_only)
+        self.job_table = QTableView()
+        self.job_table.setModel(self.job_model)
+        self.process_stats = ProcessStatsModel(self)
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_stats)
+        self.analysis = None
+        tabs = QTabWidget()
+        for table, title in ((self.job_table, "Jobs"), (self.process_table, "Processes")):
+            # Open unsorted; enabling sorting would apply the default indicator
+            table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+            table.setSortingEnabled(True)
+            table.setEditTriggers(QTableView.NoEditTriggers)
+            table.setFont(QFont("Arial", 9))
+            table.setAlternatingRowColors(True)
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            table.verticalHeader().setVisible(False)
+            tabs.addTab(table, title)
+        stats_layout.addWidget(tabs)
         
         v.addWidget(gb2)
 
     # def update(self, sch, procs, jc, missed, alg, show_missed):
-    def update(self, sch, procs, jc, missed, alg, show_missed):
+    def update(self, sch, procs, jc, missed, alg, show_missed, steady=None, maxt=None,
+               core=None, cores=1, overhead=None):
         self.show_missed = show_missed  # Store the flag
+        self.clear_views()
         ax = self.canvas.axes
         ax.clear()
         
-        # Draw Gantt chart
-        for j, s, e, pid in sch:
-            y = (len(procs) - pid) * 0.8
-            col = procs[pid]['color']
-            dl = procs[pid]['arrival'] + j * procs[pid]['period'] + procs[pid]['deadline']
-            opts = {}
-            if e > dl:
-                opts = {'edgecolor': 'red', 'linewidth': 2}
-            ax.barh(y, e - s, left=s, height=0.6, color=col, **opts)
-            if e - s >= 2:
-                ax.text(s + (e - s)/2, y, f"J{pid+1},{j+1}", 
-                        ha='center', va='center', color='black', fontweight='bold')
-
-        # Handle missed deadlines display
-        if self.show_missed:
-            for j, dl, pid in missed:
-                y = (len(procs) - pid) * 0.8
-                ax.plot([dl, dl], [y-0.4, y+0.4], 'r--', linewidth=2)
-                ax.plot(dl, y, 'rx', markersize=8)
+        # Draw Gantt chart (re-rendered for the visible range on zoom/pan)
+        self.views.append(gantt.draw_gantt(ax, sch, procs,
+                                           missed if self.show_missed else None))
 
         # Chart formatting
         ax.set_yticks([(len(procs)-i)*0.8 for i in range(len(procs))])
         ax.set_yticklabels([p['name'] for p in procs])
         ax.set_xlabel("Time")
-        ax.set_title(f"{alg} Gantt Chart",color=COLORS['main-title'], fontsize=10, fontweight='bold')
+        name = display_name(alg)
+        title = f"{name} Gantt Chart" if cores == 1 else f"{name} Gantt Chart ({cores} cores)"
+        ax.set_title(title, color=COLORS['main-title'], fontsize=10, fontweight='bold')
         ax.grid(True, linestyle='--', alpha=0.7)
         self.canvas.draw()
 
-        # Statistics calculation
-        total_jobs = len(sch)
-        missed_jobs = len(missed)
+        # Statistics calculation (vectorized, see scheduler.stats)
+        self.analysis = analyze(sch, missed, procs, steady, maxt, core, cores, overhead)
+        summary = self.analysis.summary()
+        total_jobs = int(self.analysis.weight.sum())
+        missed_jobs = summary['missed']
         
         # Prevent division by zero
         missed_percent = 0.0
@@ -629,33 +1129,109 @@ class ResultPanel(QWidget):
             missed_percent = (missed_jobs / total_jobs) * 100
 
         utilization = sum(p['execution']/p['period'] for p in procs) if procs else 0
+        # Analytical verdict for RMS/Priority/EDF (scheduler.schedulability); the
+        # tests are uniprocessor ones, so on several cores only overload is checked
+        verdict = check_schedulability(alg, procs) if cores == 1 else {'schedulable': None}
+        if verdict['schedulable'] is None:
+            feasibility = 'Overloaded ❌' if utilization > cores else 'Not analyzed'
+        elif verdict['schedulable']:
+            feasibility = f"Schedulable ✅ by {verdict['test']}"
+        else:
+            feasibility = f"Not schedulable ❌ by {verdict['test']}"
         
         stats_text = (
-            f"👉🏻 Algorithm Used: {alg}\t"
+            f"👉🏻 Algorithm Used: {display_name(alg)}\t"
             f"👉🏻 Total Jobs: {total_jobs}\t"
-            f"👉🏻 Completed: {total_jobs - missed_jobs}\t"
+            f"👉🏻 Completed: {summary['jobs']}\t"
             f"👉🏻 Missed: {missed_jobs} ({missed_percent:.1f}%)\t"
-            f"👉🏻 Utilization: {utilization:.2f} "
-            f"({'Schedulable ✅' if utilization <= 1 else 'Overloaded ❌'})"
+            f"👉🏻 Utilization: {utilization:.2f} ({feasibility})\n"
+            f"👉🏻 Response: avg {summary['avg_response']:.2f}, "
+            f"p50 {summary['p50_response']:.1f}, p95 {summary['p95_response']:.1f}, "
+            f"p99 {summary['p99_response']:.1f}\t"
+            f"👉🏻 Avg Waiting: {summary['avg_waiting']:.2f}\t"
+            f"👉🏻 Max Tardiness: {summary['max_tardiness']}\t"
+            f"👉🏻 CPU Idle: {summary['idle_time']}\t"
+            f"👉🏻 Context Switches: {summary['context_switches']}"
         )
+        if cores > 1:
+            stats_text += f"\t👉🏻 Cores: {cores}\t👉🏻 Migrations: {summary['migrations']}"
+        if overhead is not None:
+            parts = ", ".join(f"{kind} {int(time)}" for kind, time
+                              in zip(OVERHEAD_KINDS, self.analysis.overhead))
+            stats_text += f"\n👉🏻 Overhead: {summary['overhead_time']} ({parts})"
+        if steady is not None:
+            stats_text += (f"\n👉🏻 Steady State: repeats every {steady.period} from "
+                           f"t={steady.start}; simulated to t={steady.end}, "
+                           f"statistics extrapolated to t={maxt}")
         self.text.setPlainText(stats_text)
         
         # Update other components
-        self.draw_contiguous(sch, procs)
+        self.draw_contiguous(sch, procs, core, cores, overhead)
         self.populate_job_table(sch, missed, procs)
-    def draw_contiguous(self, sch, procs):
+        self.process_stats.set_rows(self.analysis.per_process())
+        self.toolbar.update()  # Reset the toolbar's view history to the new chart
+        ax.callbacks.connect('xlim_changed', self.sync_xlim)
+        self.sync_xlim(ax)
+
+    def export_stats(self):
+        """Write the last run's statistics to CSV (per process) or JSON."""
+        if self.analysis is None:
+            return
+        filename, selected = QFileDialog.getSaveFileName(
+            self, "Export Statistics", "", "Per-process CSV (*.csv);;All statistics (*.json)")
+        if filename:
+            if not filename.lower().endswith(('.csv', '.json')):
+                filename += '.json' if 'json' in selected else '.csv'
+            try:
+                if filename.lower().endswith('.json'):
+                    with open(filename, 'w') as f:
+                        json.dump(self.analysis.to_dict(), f, indent=1)
+                else:
+                    self.analysis.write_csv(filename)
+            except OSError as e:
+                QMessageBox.critical(self, "Export Error ❌", f"Error exporting statistics: {str(e)}")
+
+    def clear_views(self):
+        """Detach the Gantt views of the previous run from their axes."""
+        for view in self.views:
+            view.disconnect()
+        self.views = []
+
+    def sync_xlim(self, ax):
+        """Show the main chart's time range on the contiguous timeline too."""
+        self.canvas_contig.axes.set_xlim(ax.get_xlim())
+        self.canvas_contig.draw_idle()
+
+    def zoom(self, event):
+        """Zoom the time axis around the cursor with the mouse wheel."""
+        if event.inaxes is None or event.xdata is None:
+            return
+        ax = self.canvas.axes
+        x0, x1 = ax.get_xlim()
+        scale = 1 / 1.25 if event.button == 'up' else 1.25
+        ax.set_xlim(event.xdata - (event.xdata - x0) * scale,
+                    event.xdata + (x1 - event.xdata) * scale)
+        self.canvas.draw_idle()
+    def draw_contiguous(self, sch, procs, core=None, cores=1, overhead=None):
         ax = self.canvas_contig.axes
         ax.clear()
         ax.set_facecolor(COLORS['light'])
         
+        if core is not None:
+            # One lane per core
+            self.views.append(gantt.draw_cores(ax, sch, procs, core, cores))
+            ax.set_yticks([gantt.row_of(c, range(cores)) for c in range(cores)])
+            ax.set_yticklabels([f"CPU{c}" for c in range(cores)], fontsize=7)
+            ax.set_xlabel("Time", fontsize=8, fontweight='bold')
+            ax.set_title("Per-Core Gantt Chart", color=COLORS['main-title'], fontsize=10,
+                         fontweight='bold')
+            ax.grid(True, linestyle='--', alpha=0.7)
+            self.canvas_contig.draw()
+            return
+
         y = 0.2
-        for j, s, e, pid in sch:
-            col = procs[pid]['color']
-            ax.barh(y, e - s, left=s, height=0.2, color=col)
-            if e - s >= 2:
-                ax.text(s + (e - s) / 2, y, f"J{pid+1},{j+1}", ha='center', va='center', 
-                        color='black', fontweight='bold')
-                        
+        self.views.append(gantt.draw_timeline(ax, sch, procs, y, overhead=overhead))
+
         ax.set_yticks([y])
         # rotate y-ticks to avoid overlap
         # add margin bottom to y-ticks label
@@ -667,45 +1243,57 @@ class ResultPanel(QWidget):
         self.canvas_contig.draw()
 
     def populate_job_table(self, sch, missed, procs):
-        headers = ["Job", "Start", "End", "Deadline", "Missed", "Response Time", "Waiting Time"]
-        self.job_table.clear()
-        self.job_table.setColumnCount(len(headers))
-        self.job_table.setHorizontalHeaderLabels(headers)
-        self.job_table.setRowCount(len(sch))
-        
-        miss_map = {(j, pid): dl for j, dl, pid in missed}
-        
-        for i, (j, st, et, pid) in enumerate(sch):
-            arrival = procs[pid]['arrival'] + j * procs[pid]['period']
-            dl = arrival + procs[pid]['deadline']
-            is_miss = (j, pid) in miss_map
-            
-            response_time = et - arrival
-            waiting_time = st - arrival
-            
+        self.job_model.set_result(sch, missed, procs)
+
+class CompareDialog(QWidget):
+    """Side-by-side summary of every algorithm on one task set."""
+    headers = ["Algorithm", "Jobs", "Missed", "Miss Ratio", "Avg Response",
+               "Avg Waiting", "Context Switches", "Overhead"]
+
+    def __init__(self, rows, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("Algorithm Comparison")
+        self.setStyleSheet(STYLE_SHEET)
+        self.resize(760, 360)
+        layout = QVBoxLayout(self)
+
+        title = QLabel("Algorithm Comparison")
+        title.setFont(QFont("Arial", 12, QFont.Bold))
+        title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title)
+
+        table = QTableWidget(len(rows), len(self.headers))
+        table.setFont(QFont("Arial", 9))
+        table.setAlternatingRowColors(True)
+        table.setHorizontalHeaderLabels(self.headers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        best_miss = min((r['miss_ratio'] for r in rows), default=0)
+        for i, r in enumerate(rows):
             vals = [
-                f"J{pid+1},{j+1}", 
-                st, 
-                et, 
-                dl, 
-                "Yes" if is_miss else "No",
-                response_time,
-                waiting_time
+                display_name(r['algorithm']),
+                r['jobs'],
+                r['missed'],
+                f"{r['miss_ratio'] * 100:.1f}%",
+                f"{r['avg_response']:.2f}",
+                f"{r['avg_waiting']:.2f}",
+                r['context_switches'],
+                r['overhead_time']
             ]
-            
             for c, v in enumerate(vals):
                 item = QTableWidgetItem(str(v))
                 item.setTextAlignment(Qt.AlignCenter)
-                
-                # Highlight missed deadlines
-                if c == 4 and v == "Yes":
-                    item.setForeground(QColor(COLORS['danger']))
-                    item.setFont(QFont("Arial", 7, QFont.Bold))
-                    
-                self.job_table.setItem(i, c, item)
-                
-        # Resize columns to content
-        self.job_table.resizeColumnsToContents()
+                if c == 3 and r['miss_ratio'] == best_miss:
+                    item.setForeground(QColor(COLORS['success']))
+                    item.setFont(QFont("Arial", 9, QFont.Bold))
+                table.setItem(i, c, item)
+        layout.addWidget(table)
+
+        close = QPushButton("Close")
+        close.clicked.connect(self.close)
+        layout.addWidget(close)
 
 class AboutDialog(QWidget):
     def __init__(self, parent=None):
@@ -745,6 +1333,86 @@ class AboutDialog(QWidget):
         layout.addWidget(close)
         layout.addStretch()
 
+# Runs one simulation off the GUI thread
+class SimulationWorker(QThread):
+    progress = pyqtSignal(int)
+    done = pyqtSignal(object, object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, alg, procs, jc, maxt, tq, parent=None, steady=False, cache=None,
+                 simulation=None, overhead=None, options=None):
+        super().__init__(parent)
+        self.args = (alg, procs, jc, maxt, tq)
+        self.percent = -1
+        self.steady = steady
+        self.steady_state = None  # SteadyState found by a steady run
+        self.cache = cache
+        self.cached = False  # Result came from the cache
+        self.simulation = simulation  # Incremental simulation to update
+        self.overhead = overhead  # Overhead charged (not cached or resumed)
+        self.options = options or {}  # Algorithm options (likewise)
+
+    def run(self):
+        try:
+            if self.overhead is not None or self.options:
+                schedule, missed = run_algorithm(*self.args, progress=self.report,
+                                                 overhead=self.overhead, **self.options)
+                self.done.emit(schedule, missed)
+                return
+            hits = self.cache.hits if self.cache is not None else 0
+            schedule, missed, self.steady_state = cached_run(
+                self.cache, *self.args, progress=self.report, steady=self.steady,
+                simulation=self.simulation)
+            self.cached = self.cache is not None and self.cache.hits > hits
+        except Cancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.done.emit(schedule, missed)
+
+    def report(self, fraction):
+        """Engine progress callback; aborts the run once cancel was requested."""
+        if self.isInterruptionRequested():
+            raise Cancelled()
+        percent = int(fraction * 100)
+        if percent != self.percent:
+            self.percent = percent
+            self.progress.emit(percent)
+
+# Runs a multiprocessor simulation off the GUI thread (no cache or checkpoints)
+class MulticoreWorker(SimulationWorker):
+    def __init__(self, alg, procs, jc, maxt, tq, cores, mode, parent=None, options=None):
+        super().__init__(alg, procs, jc, maxt, tq, parent, options=options)
+        self.cores = cores
+        self.mode = mode
+        self.core = None  # Core of each slice
+
+    def run(self):
+        try:
+            schedule, missed, self.core = run_multicore(
+                *self.args, self.cores, self.mode, progress=self.report, **self.options)
+        except Cancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.done.emit(schedule, missed)
+
+# Runs the comparison of all algorithms off the GUI thread
+class CompareWorker(SimulationWorker):
+    def run(self):
+        try:
+            rows = compare_algorithms(*self.args[1:], progress=self.report,
+                                      overhead=self.overhead)
+        except Cancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.done.emit(rows, None)
+
 class SchedulerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -760,6 +1428,15 @@ class SchedulerGUI(QMainWindow):
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Ready")
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 100)
+        self.progress.setMaximumWidth(200)
+        self.progress.setVisible(False)
+        self.statusBar.addPermanentWidget(self.progress)
+        self.worker = None
+        self.result = None  # Settings and output of the last simulation
+        self.cache = ResultCache()  # Results of earlier runs, by settings
+        self.simulation = None  # Checkpointed last run, resumed after edits
         
         # Create menubar
         menubar = self.menuBar()
@@ -778,6 +1455,17 @@ class SchedulerGUI(QMainWindow):
         load_action.setShortcut("Ctrl+O")
         load_action.triggered.connect(self.load_config)
         
+        save_results_action = QAction("Save Results", self)
+        save_results_action.setShortcut("Ctrl+Shift+S")
+        save_results_action.triggered.connect(self.save_results)
+        
+        open_results_action = QAction("Open Results", self)
+        open_results_action.setShortcut("Ctrl+Shift+O")
+        open_results_action.triggered.connect(self.open_results)
+        
+        cache_action = QAction("Cache Results On Disk...", self)
+        cache_action.triggered.connect(self.choose_cache_dir)
+        
         exit_action = QAction("Exit", self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
@@ -786,6 +1474,10 @@ class SchedulerGUI(QMainWindow):
         file_menu.addAction(save_action)
         file_menu.addAction(load_action)
         file_menu.addSeparator()
+        file_menu.addAction(save_results_action)
+        file_menu.addAction(open_results_action)
+        file_menu.addAction(cache_action)
+        file_menu.addSeparator()
         file_menu.addAction(exit_action)
         
         # Help menu
@@ -807,6 +1499,15 @@ class SchedulerGUI(QMainWindow):
         run_action = QAction("Run", self)
         run_action.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
         toolbar.addAction(run_action)
+        self.run_action = run_action
+
+        self.cancel_action = QAction("Cancel", self)
+        self.cancel_action.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
+        self.cancel_action.setShortcut("Esc")
+        self.cancel_action.setToolTip("Cancel the running simulation (Esc)")
+        self.cancel_action.setEnabled(False)
+        self.cancel_action.triggered.connect(self.cancel_sim)
+        toolbar.addAction(self.cancel_action)
         
         # Create main widget and layout
         central_widget = QWidget()
@@ -846,6 +1547,9 @@ class SchedulerGUI(QMainWindow):
         
         # Connect signals
         self.alg_panel.run.clicked.connect(self.run_sim)
+        self.alg_panel.compare.clicked.connect(self.compare_all)
+        self.alg_panel.show_miss.toggled.connect(self.show_missed_changed)
+        self.proc_panel.model.dataChanged.connect(self.processes_edited)
         run_action.triggered.connect(self.run_sim)
         
         # Create keyboard shortcuts
@@ -859,14 +1563,14 @@ class SchedulerGUI(QMainWindow):
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             # Reset process panel
-            for _ in range(self.proc_panel.table.rowCount()):
-                self.proc_panel.remove_process()
+            self.proc_panel.set_processes([])
             for _ in range(3):
                 self.proc_panel.add_process()
             self.proc_panel.simple_mode.setChecked(False)
             self.proc_panel.jobs_spin.setValue(2)
             
-            # Reset algorithm panel
+            # Reset algorithm panel (after dropping the result it would redraw)
+            self.result = None
             self.alg_panel.combo.setCurrentIndex(1)  
             self.alg_panel.tq.setValue(2)
             self.alg_panel.max_t.setValue(100)
@@ -874,7 +1578,8 @@ class SchedulerGUI(QMainWindow):
             
             # Clear results
             self.result_panel.text.clear()
-            self.result_panel.job_table.setRowCount(0)
+            self.result_panel.job_model.set_result([], [], [])
+            self.result_panel.clear_views()
             self.result_panel.canvas.axes.clear()
             self.result_panel.canvas.draw()
             self.result_panel.canvas_contig.axes.clear()
@@ -883,71 +1588,243 @@ class SchedulerGUI(QMainWindow):
             self.statusBar.showMessage("Created new simulation", 3000)
     
     def save_config(self):
-        """Save current configuration to a file."""
-        filename, _ = QFileDialog.getSaveFileName(self, "Save Configuration", 
-                                                 "", "Config Files (*.cfg)")
+        """Save the processes and simulation settings to a task-set file."""
+        filename, selected = QFileDialog.getSaveFileName(
+            self, "Save Configuration", "", "Task Sets (*.json);;Compact Task Sets (*.npz)")
         if filename:
-            if not filename.endswith('.cfg'):
-                filename += '.cfg'
+            if not filename.lower().endswith(('.json', '.npz')):
+                filename += '.npz' if 'npz' in selected else '.json'
             try:
-                # Implement actual save logic here
-                # For example, save process settings, algorithm choice, etc.
+                settings = {
+                    'jobs': self.proc_panel.jobs_spin.value(),
+                    'algorithm': self.alg_panel.algorithm(),
+                    'quantum': self.alg_panel.tq.value(),
+                    'max_time': self.alg_panel.max_t.value(),
+                }
+                save_taskset(filename, self.proc_panel.model.columns(), settings)
                 self.statusBar.showMessage(f"Configuration saved to {filename}", 3000)
             except Exception as e:
                 QMessageBox.critical(self, "Save Error ❌", f"Error saving configuration: {str(e)} ")
     
+    def set_run_settings(self, jobs, quantum, max_time):
+        """Show loaded run settings, warning about any the spinboxes had to clamp."""
+        clamped = []
+        for name, spin, value in (("Jobs per process", self.proc_panel.jobs_spin, jobs),
+                                  ("Time quantum", self.alg_panel.tq, quantum),
+                                  ("Max time", self.alg_panel.max_t, max_time)):
+            spin.setValue(value)
+            if spin.value() != value:
+                clamped.append(f"{name}: {value} → {spin.value()}")
+        if clamped:
+            QMessageBox.warning(self, "Settings Adjusted ⚠️",
+                                "These settings are outside the range the form accepts and "
+                                "were adjusted:\n" + "\n".join(clamped))
+
     def load_config(self):
-        """Load configuration from a file."""
-        filename, _ = QFileDialog.getOpenFileName(self, "Load Configuration", 
-                                                 "", "Config Files (*.cfg)")
+        """Load processes and simulation settings from a task-set file."""
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Load Configuration", "", "Task Sets (*.json *.npz *.csv)")
         if filename:
             try:
-                # Implement actual load logic here
-                # For example, restore process settings, algorithm choice, etc.
+                cols, settings = load_columns(filename)
+                # Loaded sets carry arrival/deadline, so show those columns
+                self.proc_panel.simple_mode.setChecked(False)
+                self.proc_panel.set_columns(cols)
+                problems = self.proc_panel.model.out_of_range(cols, 0)
+                if problems:
+                    # Kept as loaded (the engine runs them); only table edits are bounded
+                    QMessageBox.warning(self, "Load Warning ⚠️",
+                                        "Some values are outside what the table lets you "
+                                        "edit:\n" + limited_lines(problems))
+                self.alg_panel.set_algorithm(settings['algorithm'])
+                self.set_run_settings(settings['jobs'], settings['quantum'],
+                                      settings['max_time'])
                 self.statusBar.showMessage(f"Configuration loaded from {filename}", 3000)
             except Exception as e:
                 QMessageBox.critical(self, "Load Error ❌", f"Error loading configuration: {str(e)}")
     
+    def save_results(self):
+        """Save the last simulation as a memory-mapped result store."""
+        if self.result is None:
+            self.statusBar.showMessage("Run a simulation first", 3000)
+            return
+        directory, _ = QFileDialog.getSaveFileName(self, "Save Results", "", "Result Stores (*)")
+        if directory:
+            try:
+                result = dict(self.result)
+                store = save_result(directory, result.pop('schedule'), result.pop('missed'),
+                                    **result)
+                self.statusBar.showMessage(f"Saved {len(store)} slices to {directory}", 3000)
+            except Exception as e:
+                QMessageBox.critical(self, "Save Error ❌", f"Error saving results: {str(e)}")
+    
+    def open_results(self):
+        """Show a saved result store without re-running the simulation."""
+        directory = QFileDialog.getExistingDirectory(self, "Open Results")
+        if directory:
+            try:
+                store = ResultStore(directory)
+                meta = store.meta
+                self.proc_panel.simple_mode.setChecked(False)
+                self.proc_panel.set_processes(meta['processes'])
+                self.alg_panel.set_algorithm(meta['algorithm'])
+                self.set_run_settings(meta['jobs'], meta['quantum'], meta['max_time'])
+                steady = meta.get('steady')
+                self.sim_done(store.schedule, store.missed, meta['processes'], meta['jobs'],
+                              meta['algorithm'], self.alg_panel.show_miss.isChecked(),
+                              meta['max_time'], meta['quantum'],
+                              SteadyState(**steady) if steady else None,
+                              meta.get('core'), meta.get('cores', 1), meta.get('overhead'))
+            except Exception as e:
+                QMessageBox.critical(self, "Load Error ❌", f"Error opening results: {str(e)}")
+    
+    def choose_cache_dir(self):
+        """Also keep simulation results on disk, where later sessions find them."""
+        directory = QFileDialog.getExistingDirectory(self, "Cache Results On Disk")
+        if directory:
+            self.cache.directory = directory
+            self.statusBar.showMessage(f"Caching results in {directory}", 3000)
+    
     def show_about(self):
         """Show the about dialog."""
         dialog = AboutDialog(self)
         dialog.show()
     
-    def run_sim(self):
-        """Run the simulation with current settings"""
+    def get_settings(self):
+        """Read and validate the current settings; None if they are unusable."""
+        if self.worker is not None:
+            self.statusBar.showMessage("A simulation is already running", 3000)
+            return None
         try:
             # Get configurations
             procs, jc = self.proc_panel.get_processes()
-            alg = self.alg_panel.combo.currentText()
+            alg = self.alg_panel.algorithm()
             maxt = self.alg_panel.max_t.value()
             tq = self.alg_panel.tq.value()
             show_missed = self.alg_panel.show_miss.isChecked()
-            # Validate input
-            if not procs:
-                QMessageBox.warning(self, "Error ❌", "Add at least one process!")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Simulation failed: {str(e)}")
+            self.statusBar.showMessage("Simulation error", 5000)
+            return None
+        # Validate input
+        if not procs:
+            QMessageBox.warning(self, "Error ❌", "Add at least one process!")
+            return None
+        return procs, jc, alg, maxt, tq, show_missed
+
+    def start_worker(self, worker, message):
+        self.worker = worker
+        worker.progress.connect(self.progress.setValue)
+        worker.cancelled.connect(self.sim_cancelled)
+        worker.failed.connect(self.sim_failed)
+        worker.finished.connect(self.sim_finished)
+        self.set_running(True)
+        self.statusBar.showMessage(message)
+        worker.start()
+
+    def run_sim(self):
+        """Run the simulation with current settings in a background thread"""
+        settings = self.get_settings()
+        if settings is None:
+            return
+        procs, jc, alg, maxt, tq, show_missed = settings
+        if alg.startswith("--"):
+            QMessageBox.warning(self, "Error ❌", "Select a valid algorithm!")
+            return
+        options = self.alg_panel.options()
+        if alg == "MLFQ":
+            try:
+                MLFQ.check(options.get('quanta') or [tq], options.get('boost'))
+            except ValueError as e:
+                QMessageBox.warning(self, "Error ❌", f"{e}!")
                 return
-            if alg.startswith("--"):
-                QMessageBox.warning(self, "Error ❌", "Select a valid algorithm!")
+
+        cores = self.alg_panel.cores.value()
+        if cores > 1:
+            mode = self.alg_panel.partition.currentText()
+            if mode == "global" and alg not in GLOBAL_POLICIES:
+                QMessageBox.warning(self, "Error ❌", "Global multicore scheduling supports "
+                                    "EDF, RMS and Minimum Laxity only!")
                 return
+            worker = MulticoreWorker(alg, procs, jc, maxt, tq, cores, mode, self, options)
+            worker.done.connect(lambda schedule, missed: self.sim_done(
+                schedule, missed, procs, jc, alg, show_missed, maxt, tq,
+                core=worker.core, cores=cores))
+            self.start_worker(worker, f"Running {mode} {display_name(alg)} on {cores} cores...")
+            return
 
-            # Run selected algorithm
-            alg_methods = {
-                "FCFS": self.run_fcfs,
-                "SJN": self.run_sjn,
-                "SRT": self.run_srt,
-                "Priority": self.run_priority,
-                "Round Robin": self.run_round_robin,
-                "Multilevel Queues": self.run_multilevel_queues,
-                "ML": self.run_minimum_laxity,
-                "RMS": self.run_rms,
-                "EDF": self.run_edf
-            }
-            
-            if alg not in alg_methods:
-                raise ValueError(f"Unsupported algorithm: {alg} ❌❌❌")
-                
-            schedule, missed_deadlines = alg_methods[alg](procs, jc, maxt, tq)
+        overhead = self.alg_panel.overhead()
+        if overhead is not None or options:
+            worker = SimulationWorker(alg, procs, jc, maxt, tq, self, overhead=overhead,
+                                      options=options)
+            worker.done.connect(lambda schedule, missed: self.sim_done(
+                schedule, missed, procs, jc, alg, show_missed, maxt, tq,
+                overhead=overhead and overhead.slices))
+            self.start_worker(worker, f"Running {display_name(alg)}...")
+            return
 
+        # Run selected algorithm, resuming the last run of the same settings
+        steady = self.alg_panel.steady.isChecked()
+        simulation = None
+        if not steady:
+            if self.simulation is None or not self.simulation.matches(alg, jc, maxt, tq):
+                self.simulation = Simulation(alg, procs, jc, maxt, tq)
+            simulation = self.simulation
+        worker = SimulationWorker(alg, procs, jc, maxt, tq, self,
+                                  steady=steady, cache=self.cache, simulation=simulation)
+
+        def done(schedule, missed):
+            self.sim_done(schedule, missed, procs, jc, alg, show_missed, maxt, tq,
+                          worker.steady_state)
+            if worker.cached:
+                self.statusBar.showMessage(f"Reused the cached {display_name(alg)} result", 5000)
+            elif simulation is not None and simulation.resumed_at:
+                self.statusBar.showMessage(
+                    f"Re-simulated {display_name(alg)} from t={simulation.resumed_at}", 5000)
+        worker.done.connect(done)
+        self.start_worker(worker, f"Running {display_name(alg)}...")
+
+    def compare_all(self):
+        """Run every algorithm on the current task set and compare them"""
+        settings = self.get_settings()
+        if settings is None:
+            return
+        procs, jc, _, maxt, tq, _ = settings
+        worker = CompareWorker(None, procs, jc, maxt, tq, self,
+                               overhead=self.alg_panel.overhead())
+        worker.done.connect(lambda rows, _: self.compare_done(rows))
+        self.start_worker(worker, "Comparing all algorithms...")
+
+    def compare_done(self, rows):
+        self.compare_dialog = CompareDialog(rows, self)
+        self.compare_dialog.show()
+        self.statusBar.showMessage(f"Compared {len(rows)} algorithms", 5000)
+
+    def cancel_sim(self):
+        """Ask the running simulation to stop."""
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.statusBar.showMessage("Cancelling simulation...")
+
+    def set_running(self, running):
+        self.alg_panel.run.setEnabled(not running)
+        self.alg_panel.compare.setEnabled(not running)
+        self.run_action.setEnabled(not running)
+        self.cancel_action.setEnabled(running)
+        self.progress.setValue(0)
+        self.progress.setVisible(running)
+
+    def sim_done(self, schedule, missed_deadlines, procs, jc, alg, show_missed, maxt, tq,
+                 steady=None, core=None, cores=1, overhead=None):
+        self.result = {'schedule': schedule, 'missed': missed_deadlines, 'processes': procs,
+                       'jobs': jc, 'algorithm': alg, 'max_time': maxt, 'quantum': tq}
+        if steady is not None:
+            self.result['steady'] = steady.to_dict()
+        if core is not None:
+            self.result.update(core=list(core), cores=cores)
+        if overhead is not None:
+            self.result['overhead'] = [list(o) for o in overhead]
+        try:
             # Update results with actual data
             self.result_panel.update(
                 schedule, 
@@ -955,341 +1832,56 @@ class SchedulerGUI(QMainWindow):
                 jc, 
                 missed_deadlines, 
                 alg, 
-                show_missed
+                show_missed,
+                steady,
+                maxt,
+                core,
+                cores,
+                overhead
             )
-            self.statusBar.showMessage(f"Simulation completed using {alg}", 5000)
+            self.statusBar.showMessage(f"Simulation completed using {display_name(alg)}", 5000)
+        except Exception as e:
+            self.sim_failed(str(e))
+
+    def processes_edited(self):
+        """Re-run after a process edit when live re-runs are on."""
+        if self.alg_panel.live.isChecked() and self.worker is None and self.result is not None:
+            self.run_sim()
 
+    def show_missed_changed(self, show_missed):
+        """Redraw the last result with or without missed deadlines, without re-simulating."""
+        if self.result is None:
+            return
+        r = self.result
+        steady = r.get('steady')
+        try:
+            self.result_panel.update(r['schedule'], r['processes'], r['jobs'], r['missed'],
+                                     r['algorithm'], show_missed,
+                                     steady and SteadyState(**steady), r['max_time'],
+                                     r.get('core'), r.get('cores', 1), r.get('overhead'))
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Simulation failed: {str(e)}")
-            self.statusBar.showMessage("Simulation error", 5000)
-    # Job generation
-    def _generate_jobs(self, procs, jc, maxt):
-        jobs = []
-        for p in procs:
-            for j in range(jc):
-                arr = p['arrival'] + j * p['period']
-                if arr < maxt:
-                    jobs.append({
-                        'job': j,
-                        'pid': p['id'],
-                        'r': arr,
-                        'e': p['execution'],
-                        'rem': p['execution'],
-                        'dl': arr + p['deadline'],
-                        'pr': p['priority']
-                    })
-        return jobs
-
-    # FCFS
-    def run_fcfs(self, procs, jc, maxt, tq):
-        jobs = self._generate_jobs(procs, jc, maxt)
-        jobs.sort(key=lambda x: x['r'])
-        t = 0
-        sch = []
-        miss = []
-        
-        for job in jobs:
-            if t < job['r']:
-                t = job['r']
-            st = t
-            en = st + job['e']
-            sch.append((job['job'], st, en, job['pid']))
-            if en > job['dl']:
-                miss.append((job['job'], job['dl'], job['pid']))
-            t = en
-            
-        return sch, miss
-
-    # SJN
-    def run_sjn(self, procs, jc, maxt, tq):
-        jobs = self._generate_jobs(procs, jc, maxt)
-        rem = sorted(jobs, key=lambda x: x['r'])
-        ready = []
-        t = 0
-        sch = []
-        miss = []
-        
-        while rem or ready:
-            while rem and rem[0]['r'] <= t:
-                ready.append(rem.pop(0))
-            if not ready:
-                t = rem[0]['r']
-                continue
-                
-            job = min(ready, key=lambda x: x['e'])
-            ready.remove(job)
-            st = t
-            en = st + job['e'] 
-            sch.append((job['job'], st, en, job['pid']))
-            if en > job['dl']:
-                miss.append((job['job'], job['dl'], job['pid']))
-            t = en
-            
-        return sch, miss
-
-    # SRT
-    def run_srt(self, procs, jc, maxt, tq):
-        jobs = self._generate_jobs(procs, jc, maxt)
-        rem = sorted(jobs, key=lambda x: x['r'])
-        ready = []
-        t = 0
-        sch = []
-        miss = []
-        current = None
-        start = 0
-        
-        while rem or ready or current:
-            while rem and rem[0]['r'] <= t:
-                ready.append(rem.pop(0))
-                
-            if current and ready and min(ready, key=lambda x: x['rem'])['rem'] < current['rem']:
-                sch.append((current['job'], start, t, current['pid']))
-                ready.append(current)
-                current = None
-                
-            if not current and ready:
-                current = min(ready, key=lambda x: x['rem'])
-                ready.remove(current)
-                start = t
-                
-            if not current:
-                t = rem[0]['r'] if rem else maxt
-                continue
-                
-            next_arrival = rem[0]['r'] if rem else maxt
-            step = min(current['rem'], next_arrival - t if next_arrival > t else maxt)
-            current['rem'] -= step
-            t += step
-            
-            if current['rem'] == 0:
-                sch.append((current['job'], start, t, current['pid']))
-                if t > current['dl']:
-                    miss.append((current['job'], current['dl'], current['pid']))
-                current = None
-                
-            if t >= maxt:
-                break
-                
-        return sch, miss
-
-    # Priority (preemptive)
-    def run_priority(self, procs, jc, maxt, tq):
-        jobs = self._generate_jobs(procs, jc, maxt)
-        rem = sorted(jobs, key=lambda x: x['r'])
-        ready = []
-        t = 0
-        current = None
-        start = 0
-        sch = []
-        miss = []
-        
-        while rem or ready or current:
-            while rem and rem[0]['r'] <= t:
-                ready.append(rem.pop(0))
-                
-            ready.sort(key=lambda x: -x['pr'])  # Higher priority value = higher priority
-            
-            if current and ready and ready[0]['pr'] > current['pr']:
-                sch.append((current['job'], start, t, current['pid']))
-                ready.append(current)
-                current = None
-                
-            if not current and ready:
-                current = ready.pop(0)
-                start = t
-                
-            if not current:
-                t = rem[0]['r'] if rem else maxt
-                continue
-                
-            next_arrival = rem[0]['r'] if rem else maxt
-            step = min(current['rem'], next_arrival - t if next_arrival > t else current['rem'])
-            current['rem'] -= step
-            t += step
-            
-            if current['rem'] == 0:
-                sch.append((current['job'], start, t, current['pid']))
-                if t > current['dl']:
-                    miss.append((current['job'], current['dl'], current['pid']))
-                current = None
-                
-            if t >= maxt:
-                break
-                
-        return sch, miss
-
-    # Round Robin
-    def run_round_robin(self, procs, jc, maxt, tq):
-        jobs = self._generate_jobs(procs, jc, maxt)
-        ready = []
-        rem = sorted(jobs, key=lambda x: x['r'])
-        t = 0
-        sch = []
-        miss = []
-        
-        while rem or ready:
-            while rem and rem[0]['r'] <= t:
-                ready.append(rem.pop(0))
-                
-            if not ready:
-                t = rem[0]['r']
-                continue
-                
-            job = ready.pop(0)
-            st = t
-            run = min(tq, job['rem'])
-            job['rem'] -= run
-            t += run
-            
-            sch.append((job['job'], st, t, job['pid']))
-            
-            if job['rem'] > 0:
-                ready.append(job)
-            else:
-                if t > job['dl']:
-                    miss.append((job['job'], job['dl'], job['pid']))
-                    
-            if t >= maxt:
-                break
-                
-        return sch, miss
+            self.sim_failed(str(e))
 
-    # Multilevel queues
-    def run_multilevel_queues(self, procs, jc, maxt, tq):
-        jobs = self._generate_jobs(procs, jc, maxt)
-        
-        # Find median priority to split into queues
-        priorities = [p['priority'] for p in procs]
-        med = np.median(priorities) if priorities else 5
-        
-        # Split jobs into high and low priority queues
-        high = [j for j in jobs if j['pr'] > med]
-        low = [j for j in jobs if j['pr'] <= med]
-        
-        sch = []
-        miss = []
-        t = 0
-        
-        # Process high priority queue first, then low priority
-        for q in [sorted(high, key=lambda x: x['r']), sorted(low, key=lambda x: x['r'])]:
-            for job in q:
-                if t < job['r']:
-                    t = job['r']
-                st = t
-                en = st + job['e']
-                sch.append((job['job'], st, en, job['pid']))
-                if en > job['dl']:
-                    miss.append((job['job'], job['dl'], job['pid']))
-                t = en
-                
-        return sch, miss
-
-    # Minimum Laxity
-    def run_minimum_laxity(self, procs, jc, maxt, tq):
-        jobs = self._generate_jobs(procs, jc, maxt)
-        rem = sorted(jobs, key=lambda x: x['r'])
-        ready = []
-        t = 0
-        current = None
-        start = 0
-        sch = []
-        miss = []
-        
-        while rem or ready or current:
-            while rem and rem[0]['r'] <= t:
-                ready.append(rem.pop(0))
-                
-            if current:
-                ready.append(current)
-                current = None
-                
-            if ready:
-                # Calculate laxity (slack time) for each job
-                laxities = [(j['dl'] - (t + j['rem']), j) for j in ready]
-                # Select job with minimum laxity
-                current = min(laxities, key=lambda x: x[0])[1]
-                ready.remove(current)
-                start = t
-                
-            if not current:
-                t = rem[0]['r'] if rem else maxt
-                continue
-                
-            next_arrival = rem[0]['r'] if rem else maxt
-            step = min(current['rem'], next_arrival - t if next_arrival > t else current['rem'])
-            current['rem'] -= step
-            t += step
-            
-            if current['rem'] == 0:
-                sch.append((current['job'], start, t, current['pid']))
-                if t > current['dl']:
-                    miss.append((current['job'], current['dl'], current['pid']))
-                current = None
-                
-            if t >= maxt:
-                break
-                
-        return sch, miss
+    def sim_cancelled(self):
+        self.statusBar.showMessage("Simulation cancelled", 5000)
 
-    # RMS
-    def run_rms(self, procs, jc, maxt, tq):
-        # Rate Monotonic Scheduling (static priority based on shortest period)
-        rms_procs = []
-        
-        # Assign RMS priorities - lower period = higher priority
-        for p in procs:
-            p_copy = p.copy()
-            p_copy['priority'] = 10000 / p['period']  # Invert for correct priority direction
-            rms_procs.append(p_copy)
-            
-        return self.run_priority(rms_procs, jc, maxt, tq)
-
-    # EDF
-    def run_edf(self, procs, jc, maxt, tq):
-        # Earliest Deadline First (dynamic priority by nearest deadline)
-        jobs = self._generate_jobs(procs, jc, maxt)
-        rem = sorted(jobs, key=lambda x: x['r'])
-        ready = []
-        t = 0
-        sch = []
-        miss = []
-        current = None
-        start = 0
-        
-        while rem or ready or current:
-            while rem and rem[0]['r'] <= t:
-                ready.append(rem.pop(0))
-                
-            if current:
-                ready.append(current)
-                current = None
-                
-            if ready:
-                # Select job with earliest absolute deadline
-                current = min(ready, key=lambda x: x['dl'])
-                ready.remove(current)
-                start = t
-                
-            if not current:
-                t = rem[0]['r'] if rem else maxt
-                continue
-                
-            next_arrival = rem[0]['r'] if rem else maxt
-            step = min(current['rem'], next_arrival - t if next_arrival > t else current['rem'])
-            current['rem'] -= step
-            t += step
-            
-            if current['rem'] == 0:
-                sch.append((current['job'], start, t, current['pid']))
-                if t > current['dl']:
-                    miss.append((current['job'], current['dl'], current['pid']))
-                current = None
-                
-            if t >= maxt:
-                break
-                
-        return sch, miss
+    def sim_failed(self, message):
+        QMessageBox.critical(self, "Error", f"Simulation failed: {message}")
+        self.statusBar.showMessage("Simulation error", 5000)
+
+    def sim_finished(self):
+        self.worker.deleteLater()
+        self.worker = None
+        self.set_running(False)
+
+    def closeEvent(self, event):
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.worker.wait()
+        super().closeEvent(event)
 if __name__ == "__main__":
+    # Needed by the compare worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = SchedulerGUI()
     window.show()
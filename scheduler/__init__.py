@@ -0,0 +1,7 @@
+"""Headless scheduling engine used by the Scheduler Simulator GUI."""
+from .engine import (
+    ALGORITHMS, run, generate_jobs, run_fcfs, run_sjn, run_srt, run_priority,
+    run_round_robin, run_multilevel_queues, run_mlfq, run_minimum_laxity, run_rms, run_edf
+)
+from .kernel import Cancelled
+from .taskset import load_taskset, save_taskset
@@ -0,0 +1,331 @@
+"""Batch command line interface: ``python -m scheduler TASKSET [TASKSET ...]``.
+
+Runs one algorithm over each task-set file and writes the resulting schedule
+and missed deadlines as JSON (one document per line, per task set) or CSV.
+With ``--compare`` every algorithm is run in parallel and only summary rows
+are written.  With ``--stream DIR`` each schedule is written to disk while it
+is simulated (a ``scheduler.store`` result store, or CSV with ``-f csv``) and
+only a summary line per task set goes to the output.  With ``--steady`` a
+run stops as soon as its schedule repeats every hyperperiod (see
+``scheduler.hyperperiod``); JSON output then records where it repeats and the
+summary statistics extrapolated to the full horizon.  ``--analyze`` answers
+whether any deadline can be missed from the schedulability tests in
+``scheduler.schedulability`` and only simulates when they are inconclusive.
+``--cache DIR`` keeps every result in DIR (see ``scheduler.cache``), so
+re-running unchanged task sets, in this or a later invocation, reads them
+back instead of simulating.  ``--cores N`` simulates N identical cores with
+global scheduling, or ``--partition first-fit``/``worst-fit`` to bind each
+process to one core (see ``scheduler.multicore``); every slice then records
+the core it ran on.  ``--switch-cost``, ``--dispatch-cost`` and
+``--reload-cost`` charge scheduler overhead at every dispatch (see
+``scheduler.overhead``); the overhead slices are written alongside the
+schedule, and compared algorithms all pay the same costs.
+``--laxity-recheck N`` makes Minimum Laxity re-evaluate laxities every N time
+units as well as at releases.  ``--mlfq-levels``, ``--mlfq-quanta`` and
+``--mlfq-boost`` configure MLFQ's queue levels, their quanta and how often
+every job is boosted back to the top level.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from .engine import ALGORITHMS, ALIASES, MLFQ_LEVELS, run
+from .overhead import KINDS, Overhead
+from .policies import MLFQ
+from .taskset import load_taskset
+
+
+COMPARE_FIELDS = ['jobs', 'missed', 'miss_ratio', 'avg_response', 'avg_waiting',
+                  'context_switches', 'overhead_time']
+ANALYZE_FIELDS = ['test', 'schedulable', 'utilization', 'simulated', 'missed']
+
+
+def int_list(text):
+    """Comma-separated integers, e.g. ``2,4,8``."""
+    try:
+        return [int(x) for x in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected comma-separated integers, got {text!r}") from None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m scheduler",
+        description="Run a scheduling algorithm over task-set files without the GUI.")
+    parser.add_argument('tasksets', nargs='+', metavar='TASKSET',
+                        help="task-set file (.json, .csv or .npz)")
+    parser.add_argument('-a', '--algorithm', choices=sorted(ALGORITHMS) + sorted(ALIASES),
+                        help="algorithm to run (default: from file, else FCFS)")
+    parser.add_argument('-j', '--jobs', type=int, help="jobs per process")
+    parser.add_argument('-t', '--max-time', type=int, help="simulation horizon")
+    parser.add_argument('-q', '--quantum', type=int, help="Round Robin time quantum")
+    parser.add_argument('--compare', action='store_true',
+                        help="run every algorithm in parallel and emit summary rows")
+    parser.add_argument('-f', '--format', choices=('json', 'csv'), default='json',
+                        help="output format (default: json)")
+    parser.add_argument('-o', '--output', help="output file (default: stdout)")
+    parser.add_argument('--stream', metavar='DIR',
+                        help="stream each schedule to DIR/<taskset name> instead of "
+                             "holding it in memory")
+    parser.add_argument('--steady', action='store_true',
+                        help="stop once the schedule repeats every hyperperiod and "
+                             "extrapolate the statistics")
+    parser.add_argument('--analyze', action='store_true',
+                        help="emit schedulability verdicts, simulating only when the "
+                             "analytical tests are inconclusive")
+    parser.add_argument('--cache', metavar='DIR',
+                        help="reuse results of identical earlier runs stored in DIR")
+    parser.add_argument('--cores', type=int, default=1,
+                        help="number of cores to schedule on (default: 1)")
+    parser.add_argument('--partition', choices=('global', 'first-fit', 'worst-fit'),
+                        default='global',
+                        help="multicore scheduling: one global ready queue, or processes "
+                             "bin-packed onto cores (default: global)")
+    parser.add_argument('--switch-cost', type=int, default=0,
+                        help="time charged for each context switch (default: 0)")
+    parser.add_argument('--dispatch-cost', type=int, default=0,
+                        help="time charged for each dispatch (default: 0)")
+    parser.add_argument('--reload-cost', type=int, default=0,
+                        help="extra time charged when a preempted job resumes (default: 0)")
+    parser.add_argument('--laxity-recheck', type=int, metavar='N',
+                        help="Minimum Laxity: also re-evaluate laxities every N time units")
+    parser.add_argument('--mlfq-levels', type=int, metavar='N',
+                        help=f"MLFQ: number of queue levels (default: {MLFQ_LEVELS})")
+    parser.add_argument('--mlfq-quanta', type=int_list, metavar='Q1,Q2,...',
+                        help="MLFQ: quantum of each level (default: the quantum, doubled "
+                             "per level)")
+    parser.add_argument('--mlfq-boost', type=int, metavar='N',
+                        help="MLFQ: boost every job back to the top level every N time "
+                             "units, 0 never (default: every 10 bottom-level quanta)")
+    return parser
+
+
+def algorithm(args, settings):
+    """Engine name of the algorithm to run (``-a``, else the task set's)."""
+    alg = args.algorithm or settings['algorithm']
+    return ALIASES.get(alg, alg)
+
+
+def options(args, alg):
+    """Algorithm-specific keyword arguments given on the command line."""
+    if alg == "ML" and args.laxity_recheck:
+        return {'recheck': args.laxity_recheck}
+    if alg == "MLFQ":
+        given = (('levels', args.mlfq_levels), ('quanta', args.mlfq_quanta),
+                 ('boost', args.mlfq_boost))
+        return {key: value for key, value in given if value is not None}
+    return {}
+
+
+def overhead(args):
+    """The ``Overhead`` given on the command line, or None if it costs nothing."""
+    return Overhead(args.switch_cost, args.dispatch_cost, args.reload_cost) or None
+
+
+def simulate(path, args, cache=None):
+    from .cache import cached_run
+    procs, settings = load_taskset(path)
+    alg = algorithm(args, settings)
+    jc = args.jobs if args.jobs is not None else settings['jobs']
+    maxt = args.max_time if args.max_time is not None else settings['max_time']
+    tq = args.quantum if args.quantum is not None else settings['quantum']
+    if args.cores > 1:
+        from .multicore import run_multicore
+        sch, miss, core = run_multicore(alg, procs, jc, maxt, tq, args.cores, args.partition,
+                                        **options(args, alg))
+        return procs, alg, sch, miss, {'cores': args.cores, 'partition': args.partition,
+                                       'core': core}
+    costs = overhead(args)
+    if costs is not None:
+        sch, miss = run(alg, procs, jc, maxt, tq, overhead=costs, **options(args, alg))
+        return procs, alg, sch, miss, {
+            'overhead': dict(costs.to_dict(), slices=[
+                {'start': s, 'end': e, 'kind': KINDS[k]} for s, e, k in costs.slices])}
+    sch, miss, steady = cached_run(cache, alg, procs, jc, maxt, tq, steady=args.steady,
+                                   options=options(args, alg))
+    extra = {}
+    if args.steady:
+        from .stats import summarize
+        extra = {'steady': steady and steady.to_dict(),
+                 'summary': summarize(sch, miss, procs, steady, maxt)}
+    return procs, alg, sch, miss, extra
+
+
+def stream_taskset(path, args):
+    from .sinks import CsvSink
+    from .store import ResultSink
+    procs, settings = load_taskset(path)
+    alg = algorithm(args, settings)
+    jc = args.jobs if args.jobs is not None else settings['jobs']
+    maxt = args.max_time if args.max_time is not None else settings['max_time']
+    tq = args.quantum if args.quantum is not None else settings['quantum']
+    target = os.path.join(args.stream, os.path.splitext(os.path.basename(path))[0])
+    if args.format == 'csv':
+        sink = CsvSink(target + '.csv')
+    else:
+        sink = ResultSink(target, algorithm=alg, processes=procs, jobs=jc,
+                          max_time=maxt, quantum=tq)
+    with sink:
+        run(alg, procs, jc, maxt, tq, sink=sink, **options(args, alg))
+    return {'taskset': path, 'algorithm': alg, 'output': target,
+            'slices': sink.slices, 'missed': sink.missed}
+
+
+def analyze_taskset(path, args):
+    from .schedulability import check
+    procs, settings = load_taskset(path)
+    alg = algorithm(args, settings)
+    result = dict(taskset=path, **check(alg, procs), simulated=False)
+    if result['schedulable'] is None:
+        jc = args.jobs if args.jobs is not None else settings['jobs']
+        maxt = args.max_time if args.max_time is not None else settings['max_time']
+        tq = args.quantum if args.quantum is not None else settings['quantum']
+        _, miss = run(alg, procs, jc, maxt, tq, **options(args, alg))
+        result.update(simulated=True, missed=len(miss))
+    return result
+
+
+def compare_taskset(path, args):
+    from .compare import compare  # process pool machinery only when needed
+    procs, settings = load_taskset(path)
+    jc = args.jobs if args.jobs is not None else settings['jobs']
+    maxt = args.max_time if args.max_time is not None else settings['max_time']
+    tq = args.quantum if args.quantum is not None else settings['quantum']
+    return compare(procs, jc, maxt, tq, overhead=overhead(args))
+
+
+def write_json(out, path, procs, alg, sch, miss, extra):
+    doc = {
+        'taskset': path,
+        'algorithm': alg,
+        'processes': [p['name'] for p in procs],
+        'schedule': [{'job': j, 'start': s, 'end': e, 'pid': pid} for j, s, e, pid in sch],
+        'missed': [{'job': j, 'deadline': dl, 'pid': pid} for j, dl, pid in miss],
+        **extra,
+    }
+    out.write(json.dumps(doc, separators=(',', ':')) + '\n')
+
+
+def write_csv(writer, path, procs, alg, sch, miss, extra):
+    missed = {(j, pid) for j, _, pid in miss}
+    core = extra.get('core')
+    for k, (j, s, e, pid) in enumerate(sch):
+        p = procs[pid]
+        dl = p['arrival'] + j * p['period'] + p['deadline']
+        row = [path, alg, p['name'], j, s, e, dl, int((j, pid) in missed)]
+        writer.writerow(row if core is None else row + [core[k]])
+    # Overhead slices, named after their kind
+    for o in extra.get('overhead', {}).get('slices', []):
+        writer.writerow([path, alg, f"({o['kind']})", '', o['start'], o['end'], '', ''])
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.quantum is not None and args.quantum < 1:
+        parser.error("--quantum must be positive")
+    if args.cores < 1:
+        parser.error("--cores must be at least 1")
+    if sum(map(bool, (args.analyze, args.compare, args.stream))) > 1:
+        parser.error("--analyze, --compare and --stream cannot be combined")
+    if args.steady and (args.analyze or args.compare or args.stream):
+        parser.error("--steady cannot be combined with --analyze, --compare or --stream")
+    if args.cache and (args.analyze or args.compare or args.stream or args.cores > 1):
+        parser.error("--cache cannot be combined with --analyze, --compare, --stream "
+                     "or --cores")
+    if args.cores > 1 and (args.compare or args.stream or args.steady or args.analyze):
+        parser.error("--cores cannot be combined with --compare, --stream, --steady "
+                     "or --analyze")
+    if min(args.switch_cost, args.dispatch_cost, args.reload_cost) < 0:
+        parser.error("overhead costs cannot be negative")
+    if args.laxity_recheck is not None and args.laxity_recheck <= 0:
+        parser.error("--laxity-recheck must be positive")
+    if args.laxity_recheck and (args.steady or args.compare):
+        parser.error("--laxity-recheck cannot be combined with --steady or --compare")
+    if args.laxity_recheck and args.cores > 1 and args.partition == 'global':
+        parser.error("--laxity-recheck needs --partition first-fit or worst-fit with --cores")
+    mlfq = (args.mlfq_levels, args.mlfq_quanta, args.mlfq_boost)
+    if any(value is not None for value in mlfq):
+        if args.mlfq_levels is not None and args.mlfq_quanta is not None:
+            parser.error("--mlfq-quanta already sets the number of levels; "
+                         "drop --mlfq-levels")
+        try:
+            levels = MLFQ_LEVELS if args.mlfq_levels is None else args.mlfq_levels
+            MLFQ.check(args.mlfq_quanta or [1] * levels, args.mlfq_boost)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.steady or args.compare:
+            parser.error("--mlfq-levels, --mlfq-quanta and --mlfq-boost cannot be "
+                         "combined with --steady or --compare")
+    if overhead(args) is not None and (args.cores > 1 or args.stream or args.steady
+                                       or args.analyze or args.cache):
+        parser.error("overhead costs cannot be combined with --cores, --stream, --steady, "
+                     "--analyze or --cache")
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        writer = None
+        if args.format == 'csv' and not (args.stream and not args.compare):
+            writer = csv.writer(out)
+            if args.analyze:
+                writer.writerow(['taskset', 'algorithm'] + ANALYZE_FIELDS)
+            elif args.compare:
+                writer.writerow(['taskset', 'algorithm'] + COMPARE_FIELDS)
+            else:
+                writer.writerow(['taskset', 'algorithm', 'process', 'job', 'start', 'end',
+                                 'deadline', 'missed'] + (['core'] if args.cores > 1 else []))
+        if args.stream:
+            os.makedirs(args.stream, exist_ok=True)
+        cache = None
+        if args.cache:
+            from .cache import ResultCache
+            os.makedirs(args.cache, exist_ok=True)
+            cache = ResultCache(directory=args.cache)
+        for path in args.tasksets:
+            if args.analyze:
+                try:
+                    result = analyze_taskset(path, args)
+                except (OSError, ValueError) as e:
+                    print(f"{path}: {e}", file=sys.stderr)
+                    return 1
+                if writer:
+                    writer.writerow([path, result['algorithm']]
+                                    + [result.get(k) for k in ANALYZE_FIELDS])
+                else:
+                    out.write(json.dumps(result, separators=(',', ':')) + '\n')
+                continue
+            if args.stream and not args.compare:
+                try:
+                    summary = stream_taskset(path, args)
+                except (OSError, ValueError) as e:
+                    print(f"{path}: {e}", file=sys.stderr)
+                    return 1
+                out.write(json.dumps(summary, separators=(',', ':')) + '\n')
+                continue
+            try:
+                result = (compare_taskset(path, args) if args.compare
+                          else simulate(path, args, cache))
+            except (OSError, ValueError) as e:
+                print(f"{path}: {e}", file=sys.stderr)
+                return 1
+            if args.compare:
+                if writer:
+                    writer.writerows([path, r['algorithm']] + [r[k] for k in COMPARE_FIELDS]
+                                     for r in result)
+                else:
+                    out.write(json.dumps({'taskset': path, 'comparison': result},
+                                         separators=(',', ':')) + '\n')
+            elif writer:
+                write_csv(writer, path, *result)
+            else:
+                write_json(out, path, *result)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""Benchmark the engine against the original list-based loops.
+
+``python -m scheduler.bench`` first checks that every algorithm produces the
+same schedule and missed deadlines as ``scheduler.reference`` on a batch of
+random task sets, then times both implementations on one large task set.
+
+Two known differences are factored out of the comparison: the reference
+loops drop the slice a job is running at ``maxt`` (so algorithms bounded by
+the horizon are checked with a horizon no job reaches), and the reference
+EDF/Minimum Laxity loops drop the slice a job ran before being re-dispatched
+(so only completion times are compared for them).  The reference Minimum
+Laxity loop also hands the CPU to a job of equal laxity, which the engine
+only does when asked to (``yield_ties``).
+
+``python -m scheduler.bench --suite`` instead times every algorithm on
+synthetic task sets of ``SIZES`` jobs, Gantt rendering (headless Agg) and,
+when PyQt5 is installed, filling the GUI's job table and result panel on an
+offscreen Qt platform.  ``--json`` writes the timings as a report and
+``--baseline`` compares them with an earlier report, failing on any
+benchmark that got more than ``--tolerance`` slower::
+
+    python -m scheduler.bench --suite --json new.json --baseline old.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from . import engine, reference
+
+
+def random_taskset(rng, n):
+    """Random process list in the engine's dict format."""
+    procs = []
+    for i in range(n):
+        period = rng.randint(2, 50)
+        execution = rng.randint(1, max(1, period // 2))
+        procs.append({
+            'id': i,
+            'name': f"P{i + 1}",
+            'arrival': rng.randint(0, period),
+            'period': period,
+            'execution': execution,
+            'deadline': rng.randint(execution, period),
+            'priority': rng.randint(1, 10),
+            'color': None
+        })
+    return procs
+
+
+# Algorithms that run every released job to completion regardless of maxt
+UNBOUNDED = {"FCFS", "SJN", "Multilevel Queues"}
+# Reference loops that lose slices when re-dispatching the running job
+RESLICED = {"EDF", "ML"}
+# Engine options that reproduce the reference loops' tie-breaking
+LEGACY = {"ML": {'yield_ties': True}}
+
+
+def completions(sch):
+    """Map ``(pid, job)`` to the end of the job's last slice."""
+    return {(pid, j): e for j, s, e, pid in sch}
+
+
+def check_equivalence(sets, rng, algorithms):
+    """Return a list of ``(alg, seed)`` task sets where the engine disagrees."""
+    failures = []
+    for _ in range(sets):
+        seed = rng.randrange(2 ** 32)
+        r = random.Random(seed)
+        procs = random_taskset(r, r.randint(1, 12))
+        jc, maxt, tq = r.randint(1, 20), r.randint(10, 1000), r.randint(1, 10)
+        for alg in algorithms:
+            t = maxt if alg in UNBOUNDED else 10 ** 9
+            got = engine.ALGORITHMS[alg](procs, jc, t, tq, **LEGACY.get(alg, {}))
+            want = reference.ALGORITHMS[alg](procs, jc, t, tq)
+            if alg in RESLICED:
+                got = completions(got[0]), got[1]
+                want = completions(want[0]), want[1]
+            if got != want:
+                failures.append((alg, seed))
+    return failures
+
+
+def time_call(fn, *args):
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+
+# Job counts of the synthetic task sets timed by the suite
+SIZES = (10, 1000, 100_000, 1_000_000)
+# Report format version, bumped when benchmark names or meanings change
+REPORT_VERSION = 1
+# Timings below this are too noisy to flag as regressions
+MIN_SECONDS = 0.005
+
+
+def synthetic_taskset(jobs, seed=0):
+    """``(procs, jc)`` releasing about ``jobs`` jobs before a horizon of ``10**9``."""
+    n = max(1, min(1000, round(jobs ** 0.5)))
+    return random_taskset(random.Random(seed), n), max(1, jobs // n)
+
+
+def best_time(repeat, fn, *args):
+    """Fastest of ``repeat`` calls of ``fn(*args)`` and the last call's result."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _render(sch, miss, procs):
+    # Both charts of the result panel on a headless figure, then a zoom
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from . import gantt
+    fig = Figure(figsize=(12, 5), dpi=100)
+    FigureCanvasAgg(fig)
+    ax, timeline = fig.subplots(2, 1)
+    views = [gantt.draw_gantt(ax, sch, procs, miss), gantt.draw_timeline(timeline, sch, procs)]
+    fig.canvas.draw()
+    return fig, views
+
+
+def _zoom(fig, views):
+    # Re-render a window of a tenth of the chart
+    ax = views[0].ax
+    x0, x1 = ax.get_xlim()
+    ax.set_xlim(x0 + (x1 - x0) * 0.45, x0 + (x1 - x0) * 0.55)
+    fig.canvas.draw()
+
+
+def gui_panels():
+    """``(JobTableModel, ResultPanel)`` factories from main.py, or None without PyQt5."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        from PyQt5.QtWidgets import QApplication
+        import main as gui
+    except ImportError:
+        return None
+    # Keep the application alive for as long as the panels
+    gui_panels.app = QApplication.instance() or QApplication([])
+    return gui.JobTableModel, gui.ResultPanel
+
+
+def _warm_up(algorithms, panels, tq):
+    # Run every case once, untimed, on a tiny set so lazy imports (matplotlib,
+    # Qt) and first-call setup are not charged to the first timed size
+    procs, jc = synthetic_taskset(10)
+    for alg in algorithms:
+        engine.run(alg, procs, jc, 10 ** 9, tq)
+    sch, miss = engine.run("EDF", procs, jc, 10 ** 9, tq)
+    fig, views = _render(sch, miss, procs)
+    _zoom(fig, views)
+    for view in views:
+        view.disconnect()
+    if panels is not None:
+        JobTableModel, ResultPanel = panels
+        panel = ResultPanel()
+        JobTableModel().set_result(sch, miss, procs)
+        panel.update(sch, procs, jc, miss, "EDF", True)
+        panel.clear_views()
+        panel.deleteLater()
+
+
+def suite(sizes=SIZES, repeat=3, algorithms=None, gui=True, tq=4, report=print):
+    """Run the benchmark suite; returns ``{name: {'seconds', 'jobs', 'slices'}}``.
+
+    Benchmarks are named ``engine/<algorithm>/<jobs>``, ``render/<what>/<jobs>``
+    and ``gui/<what>/<jobs>``, where ``<jobs>`` is the requested size.  Rendering
+    and GUI benchmarks use the EDF schedule of each size.  Every case runs
+    once untimed first, so the first size does not pay for lazy imports.
+    """
+    algorithms = list(algorithms or engine.ALGORITHMS)
+    panels = gui_panels() if gui else None
+    if gui and panels is None:
+        report("PyQt5 is not available: skipping the GUI benchmarks")
+    _warm_up(algorithms, panels, tq)
+    results = {}
+
+    def record(name, seconds, jobs, slices):
+        results[name] = {'seconds': seconds, 'jobs': jobs, 'slices': slices}
+        report(f"{name:<40}{seconds:>12.4f}")
+
+    for size in sizes:
+        procs, jc = synthetic_taskset(size)
+        jobs = len(engine.generate_jobs(procs, jc, 10 ** 9))
+        # One run of the largest sets is enough (and keeps memory in check)
+        n = repeat if size < 1_000_000 else 1
+        edf = None
+        for alg in algorithms:
+            seconds, (sch, miss) = best_time(n, engine.run, alg, procs, jc, 10 ** 9, tq)
+            record(f"engine/{alg}/{size}", seconds, jobs, len(sch))
+            if alg == "EDF":
+                edf = sch, miss
+            del sch, miss
+        if edf is None:
+            edf = engine.run("EDF", procs, jc, 10 ** 9, tq)
+        sch, miss = edf
+
+        seconds, (fig, views) = best_time(n, _render, sch, miss, procs)
+        record(f"render/gantt/{size}", seconds, jobs, len(sch))
+        seconds, _ = best_time(n, _zoom, fig, views)
+        record(f"render/zoom/{size}", seconds, jobs, len(sch))
+        for view in views:
+            view.disconnect()
+
+        if panels is not None:
+            JobTableModel, ResultPanel = panels
+            model, panel = JobTableModel(), ResultPanel()
+            seconds, _ = best_time(n, model.set_result, sch, miss, procs)
+            record(f"gui/job_table/{size}", seconds, jobs, len(sch))
+            seconds, _ = best_time(n, panel.update, sch, procs, jc, miss, "EDF", True)
+            record(f"gui/result_panel/{size}", seconds, jobs, len(sch))
+            panel.clear_views()
+            panel.deleteLater()
+        del sch, miss, edf
+    return results
+
+
+def write_report(path, results):
+    """Write suite ``results`` as a JSON report, keyed by benchmark name."""
+    import numpy as np
+    doc = {
+        'version': REPORT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(doc, f, indent=1, sort_keys=True)
+
+
+def regressions(baseline, results, tolerance):
+    """``(name, old, new)`` of benchmarks more than ``tolerance`` slower than ``baseline``."""
+    if baseline.get('version') != REPORT_VERSION:
+        raise ValueError(f"Baseline report version {baseline.get('version')} is not "
+                         f"{REPORT_VERSION}")
+    slower = []
+    for name, new in results.items():
+        old = baseline['results'].get(name)
+        if old is None or max(old['seconds'], new['seconds']) < MIN_SECONDS:
+            continue
+        if new['seconds'] > old['seconds'] * (1 + tolerance):
+            slower.append((name, old['seconds'], new['seconds']))
+    return slower
+
+
+def run_suite(args):
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(f"{'Benchmark':<40}{'seconds':>12}")
+    results = suite(args.sizes, args.repeat, args.algorithms, not args.no_gui)
+    if args.json:
+        write_report(args.json, results)
+    if baseline is None:
+        return 0
+    slower = regressions(baseline, results, args.tolerance)
+    for name, old, new in slower:
+        print(f"REGRESSION {name}: {old:.4f}s -> {new:.4f}s ({new / old - 1:+.0%})")
+    missing = len(set(baseline['results']) - set(results))
+    if missing:
+        print(f"{missing} benchmarks of the baseline were not run")
+    print(f"{len(slower)} of {len(results)} benchmarks more than "
+          f"{args.tolerance:.0%} slower than {args.baseline}")
+    return 1 if slower else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m scheduler.bench", description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sets', type=int, default=200, help="random task sets to cross-check")
+    parser.add_argument('--processes', type=int, default=100, help="processes in the timed task set")
+    parser.add_argument('--jobs', type=int, default=100, help="jobs per process in the timed task set")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-reference', action='store_true',
+                        help="only time the engine (the reference is O(n^2))")
+    suite_args = parser.add_argument_group("benchmark suite")
+    suite_args.add_argument('--suite', action='store_true',
+                            help="time every algorithm, rendering and the GUI tables instead")
+    suite_args.add_argument('--sizes', type=int, nargs='+', default=list(SIZES),
+                            help="job counts of the synthetic task sets (default: %(default)s)")
+    suite_args.add_argument('-a', '--algorithms', nargs='+', choices=list(engine.ALGORITHMS),
+                            help="algorithms to time (default: all)")
+    suite_args.add_argument('--repeat', type=int, default=3,
+                            help="best of this many runs per benchmark (default: 3)")
+    suite_args.add_argument('--no-gui', action='store_true', help="skip the Qt benchmarks")
+    suite_args.add_argument('--json', metavar='FILE', help="write the timings as a JSON report")
+    suite_args.add_argument('--baseline', metavar='FILE',
+                            help="JSON report to compare with; exit 1 on regressions")
+    suite_args.add_argument('--tolerance', type=float, default=0.25,
+                            help="slowdown allowed against the baseline (default: 0.25)")
+    args = parser.parse_args(argv)
+    if args.suite:
+        return run_suite(args)
+
+    rng = random.Random(args.seed)
+    algorithms = list(engine.ALGORITHMS)
+    # Algorithms added since the reference loops have nothing to check against
+    checked = [alg for alg in algorithms if alg in reference.ALGORITHMS]
+
+    failures = check_equivalence(args.sets, rng, checked)
+    for alg, seed in failures:
+        print(f"MISMATCH {alg} (task-set seed {seed})")
+    print(f"Equivalence: {args.sets} task sets x {len(checked)} algorithms, "
+          f"{len(failures)} mismatches")
+
+    procs = random_taskset(rng, args.processes)
+    jc, maxt, tq = args.jobs, 10 ** 9, 4
+    print(f"\nTiming {args.processes} processes x {jc} jobs = {args.processes * jc} jobs")
+    print(f"{'Algorithm':<20}{'engine (s)':>12}{'reference (s)':>15}{'speedup':>10}")
+    for alg in algorithms:
+        fast = time_call(engine.ALGORITHMS[alg], procs, jc, maxt, tq)
+        if args.no_reference or alg not in reference.ALGORITHMS:
+            print(f"{alg:<20}{fast:>12.3f}")
+            continue
+        slow = time_call(reference.ALGORITHMS[alg], procs, jc, maxt, tq)
+        print(f"{alg:<20}{fast:>12.3f}{slow:>15.3f}{slow / fast:>9.1f}x")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Memoized simulation results.
+
+A schedule depends only on the algorithm and its options, the processes'
+timing fields and ``jc``, ``maxt`` and ``tq``; ``fingerprint`` hashes exactly
+those, so renaming or recoloring a process still hits the cache.  ``ResultCache``
+keeps the most recently used results in memory, bounded by entry count and
+total slices, and with a ``directory`` also keeps every result on disk as a
+``scheduler.store`` result store named after its fingerprint::
+
+    cache = ResultCache(directory="~/.cache/scheduler")
+    sch, miss, steady = cached_run(cache, "EDF", procs, jc, maxt, tq)
+
+Cached results are shared between callers and must be treated as read-only.
+Results read back from disk are memory-mapped ``Columns``.
+"""
+import hashlib
+import json
+import os
+import shutil
+from collections import OrderedDict
+
+from .engine import run
+from .hyperperiod import SteadyState, run_steady
+from .store import ResultStore, save_result
+
+# Process fields that affect the schedule (name and color do not)
+SIM_FIELDS = ('arrival', 'period', 'execution', 'deadline', 'priority')
+
+
+def fingerprint(alg, procs, jc, maxt, tq, steady=False, options=None):
+    """Canonical hash of everything that determines a simulation's result.
+
+    ``options`` are the algorithm's keyword arguments (see ``engine.run``).
+    """
+    doc = [alg, [[int(p[k]) for k in SIM_FIELDS] for p in procs],
+           int(jc), int(maxt), int(tq), bool(steady)]
+    if options:
+        # Only then, so results cached without options keep their keys
+        doc.append(sorted(options.items()))
+    return hashlib.sha256(json.dumps(doc, separators=(',', ':')).encode()).hexdigest()
+
+
+class ResultCache:
+    """LRU cache of ``(sch, miss, steady)`` results keyed by ``fingerprint``.
+
+    At most ``maxsize`` results and ``max_slices`` slices are kept in memory
+    (the newest result always is).  With a ``directory`` results are also
+    written there and found again by later sessions.
+    """
+
+    def __init__(self, maxsize=16, max_slices=5_000_000, directory=None):
+        self.maxsize = maxsize
+        self.max_slices = max_slices
+        self.directory = directory and os.path.expanduser(directory)
+        self.entries = OrderedDict()
+        self.slices = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key) if self.directory else None
+
+    def get(self, key):
+        """The cached result, or ``None``."""
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        elif self.directory and os.path.isdir(self._path(key)):
+            store = ResultStore(self._path(key))
+            steady = store.meta.get('steady')
+            value = (store.schedule, store.missed, steady and SteadyState(**steady))
+            self._remember(key, value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, sch, miss, steady=None, **meta):
+        """Cache a result; ``meta`` (the run's settings) goes into the disk copy."""
+        if self.directory and not os.path.isdir(self._path(key)):
+            # Write aside and rename, so a crash never leaves half a store behind
+            tmp = self._path(key) + '.tmp'
+            shutil.rmtree(tmp, ignore_errors=True)
+            save_result(tmp, sch, miss, steady=steady and steady.to_dict(), **meta)
+            os.replace(tmp, self._path(key))
+        self._remember(key, (sch, miss, steady))
+
+    def _remember(self, key, value):
+        if key in self.entries:
+            self.slices -= len(self.entries.pop(key)[0])
+        self.entries[key] = value
+        self.slices += len(value[0])
+        while len(self.entries) > 1 and (len(self.entries) > self.maxsize
+                                         or self.slices > self.max_slices):
+            _, old = self.entries.popitem(last=False)
+            self.slices -= len(old[0])
+
+    def clear(self):
+        """Forget the in-memory results (the disk copies stay)."""
+        self.entries.clear()
+        self.slices = 0
+
+
+def cached_run(cache, alg, procs, jc, maxt, tq, progress=None, steady=False,
+               simulation=None, options=None):
+    """``(sch, miss, steady)`` from ``cache``, simulating (and caching) on a miss.
+
+    ``steady=True`` runs ``scheduler.hyperperiod.run_steady``; otherwise the
+    third item is ``None``.  ``cache`` may be ``None`` to just simulate.  A
+    ``scheduler.incremental.Simulation`` with the same settings re-simulates
+    only what changed since its last run (not with ``steady``).  ``options``
+    go to the algorithm and are part of the key (neither with ``steady`` nor
+    with a ``simulation``).
+    """
+    if options and (steady or simulation is not None):
+        raise ValueError("Algorithm options cannot be combined with steady or "
+                         "incremental runs")
+    key = fingerprint(alg, procs, jc, maxt, tq, steady, options)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+    if steady:
+        result = run_steady(alg, procs, jc, maxt, tq, progress)
+    elif simulation is not None:
+        result = simulation.update(procs, progress) + (None,)
+    else:
+        result = run(alg, procs, jc, maxt, tq, progress, **(options or {})) + (None,)
+    if cache is not None:
+        cache.put(key, *result, algorithm=alg, processes=procs, jobs=jc, max_time=maxt,
+                  quantum=tq, **({'options': options} if options else {}))
+    return result
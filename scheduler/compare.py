@@ -0,0 +1,50 @@
+"""Run every algorithm on the same task set in parallel worker processes.
+
+Each worker simulates one algorithm and sends back only its summary, so the
+cost of a full comparison is roughly that of the slowest algorithm.  With an
+``Overhead`` (see ``scheduler.overhead``) every algorithm pays the same
+dispatch and context-switch costs.
+
+Workers are spawned rather than forked: the GUI compares from a worker
+thread, and forking a multithreaded process can deadlock on locks other
+threads hold.
+"""
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .engine import ALGORITHMS, run
+from .stats import summarize
+
+
+def evaluate(alg, procs, jc, maxt, tq, overhead=None):
+    """Simulate ``alg`` and return its summary row (runs in a worker process)."""
+    overhead = overhead and overhead.fresh()
+    sch, miss = run(alg, procs, jc, maxt, tq, overhead=overhead)
+    return dict(summarize(sch, miss, procs, overhead=overhead and overhead.slices),
+                algorithm=alg)
+
+
+def compare(procs, jc, maxt, tq, algorithms=None, max_workers=None, progress=None, poll=0.1,
+            overhead=None):
+    """Summary rows for ``algorithms`` (default: all), in that order.
+
+    ``progress(fraction)`` is called as algorithms finish (and at least every
+    ``poll`` seconds) and may raise ``Cancelled``; queued work is then dropped.
+    """
+    algorithms = list(algorithms or ALGORITHMS)
+    rows = {}
+    ex = ProcessPoolExecutor(max_workers or len(algorithms),
+                             mp_context=multiprocessing.get_context("spawn"))
+    try:
+        futures = {ex.submit(evaluate, alg, procs, jc, maxt, tq, overhead): alg
+                   for alg in algorithms}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+            for fut in done:
+                rows[futures[fut]] = fut.result()
+            if progress is not None:
+                progress(len(rows) / len(algorithms))
+    finally:
+        ex.shutdown(wait=len(rows) == len(algorithms), cancel_futures=True)
+    return [rows[alg] for alg in algorithms]
@@ -0,0 +1,211 @@
+"""Headless scheduling engine.
+
+Every algorithm takes the process list produced by the GUI (or loaded from a
+task-set file), the number of jobs per process ``jc``, the simulation horizon
+``maxt`` and the Round Robin quantum ``tq``, and returns ``(sch, miss)``:
+
+* ``sch``  - list of ``(job, start, end, pid)`` execution slices
+* ``miss`` - list of ``(job, deadline, pid)`` missed deadlines
+
+Passing a ``sink`` (see ``scheduler.sinks``) streams both to disk instead and
+returns the sink.  An ``observer`` (see ``scheduler.hyperperiod``) can end a
+run early and ``resume`` continues one from a checkpoint (see
+``scheduler.incremental``); Multilevel Queues, which is not event-driven,
+supports neither.  An ``overhead`` (see ``scheduler.overhead``) charges
+dispatch, context-switch and cache-reload costs at every dispatch.
+
+Apart from Multilevel Queues, each algorithm is a policy object from
+``scheduler.policies`` driven by the event loop in ``scheduler.kernel``.
+Ready sets are binary heaps (or deques) and releases are consumed through a
+cursor over the release-sorted job list, so each run is O(n log n) in the
+number of generated jobs.  ``scheduler.bench`` checks the results against the
+original list-based loops kept in ``scheduler.reference``.
+
+This module deliberately imports nothing from PyQt5 or matplotlib so that it
+can be used from scripts, CI jobs and the ``python -m scheduler`` CLI.
+"""
+from statistics import median
+
+from .jobs import JobTable
+from .kernel import PROGRESS_EVERY, simulate
+from .policies import FCFS, SJN, SRT, PriorityPolicy, RoundRobin, RMS, EDF, LeastLaxity, MLFQ
+
+# MLFQ defaults: number of levels, and the boost interval in bottom-level quanta
+MLFQ_LEVELS = 3
+MLFQ_BOOST = 10
+
+
+# Job generation
+def generate_jobs(procs, jc, maxt):
+    """Return the release-sorted ``JobTable`` of all jobs released before ``maxt``."""
+    return JobTable.generate(procs, jc, maxt)
+
+
+def _run(policy, procs, jc, maxt, progress, sink, observer, resume, overhead, *args):
+    jobs = generate_jobs(procs, jc, maxt)
+    return simulate(jobs, policy(jobs, *args), maxt, progress, sink, observer, resume,
+                    overhead or None)
+
+
+# FCFS
+def run_fcfs(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+             overhead=None):
+    return _run(FCFS, procs, jc, maxt, progress, sink, observer, resume, overhead)
+
+
+# SJN
+def run_sjn(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+            overhead=None):
+    return _run(SJN, procs, jc, maxt, progress, sink, observer, resume, overhead)
+
+
+# SRT
+def run_srt(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+            overhead=None):
+    return _run(SRT, procs, jc, maxt, progress, sink, observer, resume, overhead)
+
+
+# Priority (preemptive)
+def run_priority(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+                 overhead=None):
+    return _run(PriorityPolicy, procs, jc, maxt, progress, sink, observer, resume, overhead)
+
+
+# Round Robin
+def run_round_robin(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+                    overhead=None):
+    return _run(RoundRobin, procs, jc, maxt, progress, sink, observer, resume, overhead, tq)
+
+
+# Multilevel queues
+def run_multilevel_queues(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+                          overhead=None):
+    jobs = generate_jobs(procs, jc, maxt)
+    r, e, dl, pr, pid, jobno = jobs.r, jobs.e, jobs.dl, jobs.pr, jobs.pid, jobs.job
+
+    # Find median priority to split into queues
+    priorities = [p['priority'] for p in procs]
+    med = median(priorities) if priorities else 5
+
+    # Split jobs into high and low priority queues (already in release order)
+    high = [i for i in range(len(jobs)) if pr[i] > med]
+    low = [i for i in range(len(jobs)) if pr[i] <= med]
+
+    sch = []
+    miss = []
+    t = 0
+    # Every job is dispatched once, always after another job
+    cost = overhead and overhead.dispatch + overhead.switch
+
+    # Process high priority queue first, then low priority
+    done = 0
+    for q in (high, low):
+        for i in q:
+            done += 1
+            if not done % PROGRESS_EVERY:
+                if progress is not None:
+                    progress(done / len(jobs))
+                if sink is not None:
+                    sink.write(sch, miss)
+                    sch.clear()
+                    miss.clear()
+            if t < r[i]:
+                t = r[i]
+            if cost:
+                if overhead.dispatch:
+                    overhead.slices.append((t, t + overhead.dispatch, 0))
+                if overhead.switch:
+                    overhead.slices.append((t + overhead.dispatch, t + cost, 1))
+                t += cost
+            st = t
+            en = st + e[i]
+            sch.append((jobno[i], st, en, pid[i]))
+            if en > dl[i]:
+                miss.append((jobno[i], dl[i], pid[i]))
+            t = en
+
+    if sink is not None:
+        sink.write(sch, miss)
+        return sink
+    return sch, miss
+
+
+# Multilevel feedback queue
+def run_mlfq(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+             overhead=None, levels=MLFQ_LEVELS, quanta=None, boost=None):
+    """MLFQ with ``levels`` levels; level k's quantum defaults to ``tq * 2**k``.
+
+    ``quanta`` gives the quantum of each level instead (and so the number of
+    levels).  All jobs are boosted back to the top level every ``boost`` time
+    units, by default ``MLFQ_BOOST`` bottom-level quanta; 0 disables it.
+    """
+    quanta = list(quanta) if quanta else [tq * 2 ** k for k in range(levels)]
+    MLFQ.check(quanta, boost)
+    if boost is None:
+        boost = MLFQ_BOOST * quanta[-1]
+    return _run(MLFQ, procs, jc, maxt, progress, sink, observer, resume, overhead, quanta,
+                boost)
+
+
+# Minimum Laxity
+def run_minimum_laxity(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+                       overhead=None, recheck=None, yield_ties=False):
+    """Least Laxity First, re-evaluating laxity at releases and every ``recheck``.
+
+    The running job keeps the CPU when another job's laxity only equals its
+    own, unless ``yield_ties`` is set.
+    """
+    return _run(LeastLaxity, procs, jc, maxt, progress, sink, observer, resume, overhead,
+                recheck, yield_ties)
+
+
+# RMS
+def run_rms(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+            overhead=None):
+    # Rate Monotonic Scheduling (static priority based on shortest period)
+    return _run(RMS, procs, jc, maxt, progress, sink, observer, resume, overhead, procs)
+
+
+# EDF
+def run_edf(procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+            overhead=None):
+    # Earliest Deadline First (dynamic priority by nearest deadline)
+    return _run(EDF, procs, jc, maxt, progress, sink, observer, resume, overhead)
+
+# Algorithms keyed by the names shown in AlgorithmPanel.combo
+ALGORITHMS = {
+    "FCFS": run_fcfs,
+    "SJN": run_sjn,
+    "SRT": run_srt,
+    "Priority": run_priority,
+    "Round Robin": run_round_robin,
+    "Multilevel Queues": run_multilevel_queues,
+    "MLFQ": run_mlfq,
+    "ML": run_minimum_laxity,
+    "RMS": run_rms,
+    "EDF": run_edf
+}
+# Other names accepted for an algorithm (AlgorithmPanel.combo shows these)
+ALIASES = {
+    "Minimum Laxity": "ML",
+    "LLF": "ML",
+}
+
+
+def run(alg, procs, jc, maxt, tq, progress=None, sink=None, observer=None, resume=None,
+        overhead=None, **options):
+    """Run algorithm ``alg`` (a key of ``ALGORITHMS`` or ``ALIASES``) and return ``(sch, miss)``.
+
+    ``progress(fraction)`` is called periodically during long runs and may
+    raise ``Cancelled`` to stop the simulation.  With a ``sink`` the results
+    are written to it as they are produced and the sink is returned.
+    ``observer``, ``resume`` and ``overhead`` are passed to the kernel (see
+    ``scheduler.kernel`` and ``scheduler.overhead``).  Any other keyword
+    ``options`` go to the algorithm (e.g. ``quanta`` for MLFQ or ``recheck``
+    for Minimum Laxity).
+    """
+    alg = ALIASES.get(alg, alg)
+    if alg not in ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm: {alg} ❌❌❌")
+    return ALGORITHMS[alg](procs, jc, maxt, tq, progress, sink, observer, resume, overhead,
+                           **options)
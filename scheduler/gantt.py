@@ -0,0 +1,286 @@
+"""Gantt chart drawing on matplotlib axes.
+
+``GanttView`` renders a schedule for the current x-range only.  Slices are
+kept per chart row in start-sorted arrays (with cumulative busy time), so the
+slices intersecting the view are found with two binary searches.  When a row
+has more visible slices than the axes has pixel columns, they are aggregated
+into per-bin density bars (opacity = fraction of the bin the row is busy)
+instead of being drawn one by one.  Everything is drawn through one reused
+``PolyCollection`` and re-rendered whenever the x-limits change (zoom, pan)
+or the canvas is resized.
+
+Scheduler overhead (see ``scheduler.overhead``) can be drawn on the
+timeline as gray slices of its own, one shade per kind.  Job labels are only
+added to slices that are wide enough on screen to hold them.  Nothing here depends on Qt, so the same code renders charts headless
+with the Agg backend.
+"""
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
+
+from .jobs import release_deadline, tuple_columns
+from .store import Columns
+
+# On-screen width (pixels) a slice needs before it gets a "J<p>,<j>" label
+LABEL_MIN_PX = 36
+# Width (pixels) of a density bar when slices are aggregated
+BIN_PX = 2
+# Row spacing of the per-process chart
+ROW = 0.8
+# Colors of dispatch, context-switch and cache-reload overhead slices
+OVERHEAD_COLORS = ('silver', 'dimgray', 'gray')
+
+_RED = to_rgba_array(['red'])[0]
+_NONE = to_rgba_array(['none'])[0]
+
+
+def schedule_arrays(sch):
+    """Split ``(job, start, end, pid)`` slices into four int64 arrays.
+
+    ``sch`` may also be a result store's ``schedule`` columns (not copied).
+    """
+    if isinstance(sch, Columns):
+        return sch.job, sch.start, sch.end, sch.pid
+    return tuple_columns(sch, 4)
+
+
+def missed_arrays(miss):
+    """``(job, deadline, pid)`` arrays of a missed list or store columns."""
+    if isinstance(miss, Columns):
+        return miss.job, miss.deadline, miss.pid
+    return tuple_columns(miss, 3)
+
+
+def process_colors(procs):
+    """Process colors, falling back to the matplotlib cycle when unset."""
+    return [p.get('color') or f"C{i % 10}" for i, p in enumerate(procs)]
+
+
+def row_of(pid, procs):
+    """y coordinate of a process row (first process at the top)."""
+    return (len(procs) - pid) * ROW
+
+
+def _rects(x0, x1, y, height):
+    # (n, 4, 2) vertex array of axis-aligned rectangles
+    x0, x1 = np.asarray(x0, dtype=float), np.asarray(x1, dtype=float)
+    y0 = np.broadcast_to(y - height / 2, x0.shape)
+    y1 = np.broadcast_to(y + height / 2, x0.shape)
+    return np.stack((np.column_stack((x0, y0)), np.column_stack((x0, y1)),
+                     np.column_stack((x1, y1)), np.column_stack((x1, y0))), axis=1)
+
+
+class _Row:
+    """Start-sorted slices of one chart row.
+
+    Slices may overlap (a process's jobs on several cores, or a multicore
+    timeline), so ``end`` need not be sorted; ``visible`` searches its
+    running maximum instead.  ``busy`` assumes no overlap; overlapping time
+    counts twice there, which at most makes an aggregated bar more opaque
+    (its density is capped at 1).
+    """
+
+    def __init__(self, idx, start, end, late, y):
+        self.idx = idx
+        self.start = start
+        self.end = end
+        # reach[i] = latest end among slices up to i, sorted even when slices overlap
+        self.reach = np.maximum.accumulate(end) if len(end) else end
+        self.y = y
+        # cum[i] = busy time of slices before i; late_cum likewise for late slices
+        self.cum = np.concatenate(([0], np.cumsum(end - start)))
+        self.late_cum = np.concatenate(([0], np.cumsum(late)))
+
+    def visible(self, x0, x1):
+        """Index range of slices intersecting ``(x0, x1)``."""
+        return (np.searchsorted(self.reach, x0, side='right'),
+                np.searchsorted(self.start, x1, side='left'))
+
+    def busy(self, x):
+        """Busy time of the row before each time in ``x``."""
+        k = np.searchsorted(self.start, x, side='right')
+        last = np.maximum(k - 1, 0)
+        over = np.where(k > 0, np.maximum(self.end[last] - x, 0), 0)
+        return self.cum[k] - over
+
+
+class GanttView:
+    """Viewport-aware Gantt renderer for one axes.
+
+    With ``timeline=True`` every slice goes on a single row at ``y``; with a
+    per-slice ``core`` (see ``scheduler.multicore``) each of the ``cores``
+    cores gets a row (``row_of(c, cores)``); otherwise each process gets its
+    own row.  Slices ending after their
+    deadline get a red edge (aggregated bars get a red strip if they contain one).
+    ``overhead`` slices ``(start, end, kind)`` are added to a timeline.
+    """
+
+    def __init__(self, ax, sch, procs, timeline=False, y=0.2, height=0.6, missed=None,
+                 core=None, cores=None, overhead=None):
+        self.ax = ax
+        self.procs = procs
+        self.height = height
+        self.job, self.start, self.end, self.pid = schedule_arrays(sch)
+        _, deadline = release_deadline(procs, self.job, self.pid)
+        self.late = self.end > deadline
+        rgba = to_rgba_array(process_colors(procs)) if procs else np.empty((0, 4))
+        self.rgba = rgba[self.pid]
+        if timeline and overhead is not None and len(overhead):
+            # Overhead slices join the job slices with job -1 and their own colors
+            ostart, oend, kind = tuple_columns(overhead, 3)
+            none = np.zeros(len(kind), dtype=np.int64)
+            self.job = np.concatenate((self.job, none - 1))
+            self.start = np.concatenate((self.start, ostart))
+            self.end = np.concatenate((self.end, oend))
+            self.pid = np.concatenate((self.pid, none))
+            self.late = np.concatenate((self.late, none.astype(bool)))
+            self.rgba = np.concatenate((self.rgba, to_rgba_array(OVERHEAD_COLORS)[kind]))
+
+        # Interval index: slices grouped by row, start-sorted within a row
+        self.rows = []
+        if timeline:
+            order = np.argsort(self.start, kind='stable')
+            self.rows.append(_Row(order, self.start[order], self.end[order],
+                                  self.late[order], y))
+        else:
+            lane = self.pid if core is None else np.asarray(core, dtype=np.int64)
+            lanes = len(procs) if core is None else cores
+            order = np.lexsort((self.start, lane))
+            bounds = np.searchsorted(lane[order], np.arange(lanes + 1))
+            for p in range(lanes):
+                sel = order[bounds[p]:bounds[p + 1]]
+                if len(sel):
+                    self.rows.append(_Row(sel, self.start[sel], self.end[sel],
+                                          self.late[sel], row_of(p, range(lanes))))
+        self.y = np.empty(len(self.start))
+        for row in self.rows:
+            self.y[row.idx] = row.y
+
+        # Missed deadlines, sorted by deadline for culling
+        self.missed = None
+        if missed is not None and len(missed):
+            _, deadline, pid = missed_arrays(missed)
+            order = np.argsort(deadline, kind='stable')
+            self.missed = (deadline[order].astype(float), row_of(pid[order], procs))
+            self.miss_lines, = ax.plot([], [], 'r--', linewidth=2)
+            self.miss_marks, = ax.plot([], [], 'rx', markersize=8, linestyle='none')
+
+        # Antialiasing thousands of axis-aligned rectangles costs more than it shows
+        self.coll = PolyCollection(np.empty((0, 4, 2)), antialiaseds=False)
+        ax.add_collection(self.coll, autolim=False)
+        self.labels = []
+
+        if len(self.start):
+            lo, hi = self.start.min(), self.end.max()
+            pad = max((hi - lo) * 0.05, 0.5)
+            ax.set_xlim(lo - pad, hi + pad)
+        ys = [r.y for r in self.rows] or [y]
+        ax.set_ylim(min(ys) - 0.6, max(ys) + 0.6)
+
+        self.cids = [ax.callbacks.connect('xlim_changed', lambda _: self.render())]
+        self.canvas = ax.figure.canvas
+        self.canvas_cid = self.canvas.mpl_connect('resize_event', lambda _: self.render())
+        self.render()
+
+    def disconnect(self):
+        """Stop following the axes (call before dropping the view)."""
+        for cid in self.cids:
+            self.ax.callbacks.disconnect(cid)
+        self.canvas.mpl_disconnect(self.canvas_cid)
+
+    def render(self):
+        ax = self.ax
+        if self.coll.axes is None:
+            return  # Axes were cleared under us
+        x0, x1 = ax.get_xlim()
+        width_px = max(ax.get_window_extent().width, 1)
+        per_px = (x1 - x0) / width_px
+
+        verts, faces, edges, exact = [], [], [], []
+        for row in self.rows:
+            lo, hi = row.visible(x0, x1)
+            if hi - lo <= width_px:
+                sel = row.idx[lo:hi]
+                exact.append(sel)
+                verts.append(_rects(self.start[sel], self.end[sel], row.y, self.height))
+                faces.append(self.rgba[sel])
+                edges.append(self.late[sel])
+            else:
+                v, f, e = self._aggregate(row, x0, x1, per_px * BIN_PX)
+                verts.append(v)
+                faces.append(f)
+                edges.append(e)
+
+        if verts:
+            late = np.concatenate(edges)
+            self.coll.set_verts(np.concatenate(verts))
+            self.coll.set_facecolor(np.concatenate(faces))
+            self.coll.set_edgecolor(np.where(late[:, None], _RED, _NONE))
+            self.coll.set_linewidth(np.where(late, 2, 0))
+
+        for t in self.labels:
+            t.remove()
+        self.labels = []
+        if exact:
+            self._label(np.concatenate(exact), per_px)
+
+        if self.missed is not None:
+            dl, y = self.missed
+            lo, hi = np.searchsorted(dl, x0), np.searchsorted(dl, x1, side='right')
+            dl, y = dl[lo:hi], y[lo:hi]
+            if len(dl) > width_px:
+                # At most one marker per pixel column and row
+                _, keep = np.unique(np.column_stack(((dl - x0) // per_px, y)),
+                                    axis=0, return_index=True)
+                dl, y = dl[keep], y[keep]
+            nan = np.full(len(dl), np.nan)
+            self.miss_lines.set_data(np.column_stack((dl, dl, nan)).ravel(),
+                                     np.column_stack((y - 0.4, y + 0.4, nan)).ravel())
+            self.miss_marks.set_data(dl, y)
+
+    def _aggregate(self, row, x0, x1, bin_width):
+        # Density bars: busy fraction per bin, colored like the last slice
+        # starting in (or before) the bin.  Bins holding a late slice get a
+        # red strip along the bottom of the row, since edges would swamp them
+        edges = np.arange(x0, x1 + bin_width, bin_width)
+        a, b = edges[:-1], edges[1:]
+        density = np.diff(row.busy(edges)) / bin_width
+        k = np.searchsorted(row.start, b, side='left') - 1
+        keep = (density > 0) & (k >= 0)
+        a, b, density, k = a[keep], b[keep], density[keep], k[keep]
+
+        faces = self.rgba[row.idx[k]].copy()
+        faces[:, 3] *= 0.25 + 0.75 * np.minimum(density, 1)
+        first = np.searchsorted(row.reach, a, side='right')
+        last = np.searchsorted(row.start, b, side='left')
+        late = row.late_cum[last] - row.late_cum[first] > 0
+        strip = self.height / 4
+        return (np.concatenate((_rects(a, b, row.y, self.height),
+                                _rects(a[late], b[late], row.y - (self.height - strip) / 2, strip))),
+                np.concatenate((faces, np.broadcast_to(_RED, (late.sum(), 4)))),
+                np.zeros(len(a) + late.sum(), dtype=bool))
+
+    def _label(self, sel, per_px):
+        # Label only slices at least LABEL_MIN_PX wide (and 2 time units, as before)
+        width = self.end[sel] - self.start[sel]
+        sel = sel[(width >= 2) & (width >= LABEL_MIN_PX * per_px) & (self.job[sel] >= 0)]
+        for i in sel.tolist():
+            self.labels.append(self.ax.text(
+                (self.start[i] + self.end[i]) / 2, self.y[i],
+                f"J{self.pid[i] + 1},{self.job[i] + 1}",
+                ha='center', va='center', color='black', fontweight='bold', clip_on=True))
+
+
+def draw_gantt(ax, sch, procs, missed=None):
+    """Per-process Gantt rows; returns the ``GanttView`` following the axes."""
+    return GanttView(ax, sch, procs, missed=missed)
+
+
+def draw_timeline(ax, sch, procs, y=0.2, height=0.2, overhead=None):
+    """All slices, plus any ``overhead`` slices, on one row; returns the ``GanttView``."""
+    return GanttView(ax, sch, procs, timeline=True, y=y, height=height, overhead=overhead)
+
+
+def draw_cores(ax, sch, procs, core, cores, height=0.6):
+    """One row per core of a multiprocessor schedule; returns the ``GanttView``."""
+    return GanttView(ax, sch, procs, height=height, core=core, cores=cores)
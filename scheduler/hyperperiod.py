@@ -0,0 +1,147 @@
+"""Hyperperiod-aware simulation that stops once the schedule repeats.
+
+A periodic task set releases the same pattern of jobs every hyperperiod
+``H`` (the LCM of the periods) once every process has arrived.  If the
+scheduler's state - the running job and the ordered ready set, with times
+taken relative to "now" - is the same at ``t`` and ``t + H``, everything
+after ``t`` repeats with period ``H`` and the rest of the run adds nothing
+new.  ``run_steady`` simulates only up to that point::
+
+    sch, miss, steady = run_steady("EDF", procs, jc, 10**9, tq)
+    analyze(sch, miss, procs, steady, 10**9).summary()   # figures for the full horizon
+
+States are compared at ``max(arrival) + k*H``.  A match only counts when
+every process either releases jobs up to ``maxt`` or has released its last
+job before the repeating part starts, so ``jc`` limits are honoured.
+Overloaded sets (utilization above 1) never settle, Multilevel Queues is
+not event-driven, MLFQ's queue levels are not part of the compared state
+and SJN reorders the jobs still queued at ``maxt`` once releases stop, so
+its tail is no copy of the window; all of them are simulated in full.
+"""
+from functools import reduce
+from math import gcd
+
+from .engine import run
+from .jobs import job_counts
+
+# Hyperperiods simulated before the first look for a repeat (doubled after)
+FIRST_SPAN = 4
+# Algorithms driven by scheduler.kernel whose full run the repeating window
+# reproduces exactly (FCFS finishes the jobs queued at maxt in release order)
+STEADY_ALGORITHMS = {"FCFS", "SRT", "Priority", "Round Robin", "ML", "RMS", "EDF"}
+
+
+class SteadyState:
+    """The schedule repeats every ``period`` from ``start``; simulated up to ``end``.
+
+    ``bounded`` is False for run-to-completion policies, whose full run goes
+    on past ``maxt`` until every job released before it has finished.
+    """
+
+    def __init__(self, start, period, end, bounded=True):
+        self.start = start
+        self.period = period
+        self.end = end
+        self.bounded = bounded
+
+    def copies(self, t, maxt):
+        """How many times something happening at time(s) ``t`` recurs up to ``maxt``."""
+        return (maxt - t) // self.period + 1
+
+    def to_dict(self):
+        return {'start': self.start, 'period': self.period, 'end': self.end,
+                'bounded': self.bounded}
+
+    def __repr__(self):
+        return (f"SteadyState(start={self.start}, period={self.period}, end={self.end}, "
+                f"bounded={self.bounded})")
+
+
+def hyperperiod(procs):
+    """LCM of the positive periods, or ``None`` if no process is periodic."""
+    periods = [p['period'] for p in procs if p['period'] > 0]
+    return reduce(lambda a, b: a * b // gcd(a, b), periods) if periods else None
+
+
+def utilization(procs):
+    """Processor utilization of the periodic processes."""
+    return sum(p['execution'] / p['period'] for p in procs if p['period'] > 0)
+
+
+class SteadyStateDetector:
+    """Kernel observer comparing the scheduler state one hyperperiod apart.
+
+    Observations start at the last arrival and stop before ``limit``; on a
+    match ``found`` holds the ``SteadyState`` and the simulation ends.
+    ``ongoing`` is False when every process stops releasing before ``maxt``.
+    """
+
+    def __init__(self, procs, jc, maxt, limit=None):
+        self.period = hyperperiod(procs)
+        self.limit = maxt if limit is None else limit
+        # Last release of each process that stops releasing before maxt (jc reached)
+        self.last = []
+        arrivals = []
+        for p, n in zip(procs, job_counts(procs, jc, maxt)):
+            if not n:
+                continue
+            a, period = p['arrival'], p['period']
+            arrivals.append(a)
+            if period <= 0 or a + n * period < maxt:
+                self.last.append(a + (n - 1) * period)
+        self.ongoing = len(self.last) < len(arrivals)
+        first = max(arrivals, default=0)
+        self.at = first if self.period and first < self.limit else None
+        self.previous = None
+        self.found = None
+        self.stop = False
+
+    def __call__(self, t, current, start, expiry, policy, sch, miss):
+        jobs = policy.jobs
+        rem, dl, release, pid = jobs.rem, jobs.dl, jobs.r, jobs.pid
+
+        def describe(j):
+            return pid[j], rem[j], dl[j] - t, release[j] - t
+
+        running = None
+        if current is not None:
+            running = describe(current) + (start - t, None if expiry is None else expiry - t)
+        # Observed at the first event at or after ``at``, so the lag is part of the state
+        state = (t - self.at, running, tuple(describe(j) for j in policy.pending()))
+
+        if self.previous is not None:
+            since, before = self.previous
+            if before == state and all(last < since for last in self.last):
+                bounded = policy.preemptive or policy.quantum is not None
+                self.found = SteadyState(since, self.period, t, bounded)
+                self.stop = True
+                return None
+        self.previous = (t, state)
+        self.at += self.period
+        return self.at if self.at < self.limit else None
+
+
+def run_steady(alg, procs, jc, maxt, tq, progress=None):
+    """Run ``alg`` until its schedule repeats; returns ``(sch, miss, steady)``.
+
+    ``steady`` is a ``SteadyState``, or ``None`` when the run went all the way
+    to ``maxt`` (no repeat found, or not applicable), in which case ``sch``
+    and ``miss`` are exactly what ``run`` returns.  The search horizon starts
+    at ``FIRST_SPAN`` hyperperiods past the last arrival and doubles until a
+    repeat is found or it reaches ``maxt``.
+    """
+    period = hyperperiod(procs)
+    if alg not in STEADY_ALGORITHMS or period is None or utilization(procs) > 1:
+        return run(alg, procs, jc, maxt, tq, progress) + (None,)
+    span = FIRST_SPAN * period
+    while True:
+        detector = SteadyStateDetector(procs, jc, maxt)
+        if not detector.ongoing or detector.at is None:
+            # Finite job set: nothing to extrapolate
+            return run(alg, procs, jc, maxt, tq, progress) + (None,)
+        detector.limit = limit = min(maxt, detector.at + span)
+        # Jobs released after ``limit`` cannot affect the schedule before it
+        sch, miss = run(alg, procs, jc, limit, tq, progress, observer=detector)
+        if detector.found is not None or limit >= maxt:
+            return sch, miss, detector.found
+        span *= 2
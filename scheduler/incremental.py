@@ -0,0 +1,187 @@
+"""Incremental re-simulation after an edit of the task set.
+
+``Simulation`` runs an algorithm once while checkpointing the kernel state
+(time, running job, ready set in service order and remaining execution
+times) every ``maxt / CHECKPOINTS`` time units.  Editing a process only
+changes jobs released from some time ``T`` on (``first_affected``), and
+everything the kernel did before ``T`` depends on earlier jobs alone, so
+``update`` resumes from the last checkpoint before ``T`` and re-simulates
+only the rest::
+
+    sim = Simulation("EDF", procs, jc, maxt, tq)
+    sch, miss = sim.run()
+    procs[3]['execution'] += 1
+    sch, miss = sim.update(procs)      # same result as a full run
+
+A change of ``jc``, ``maxt``, ``tq`` or the algorithm needs a new
+``Simulation``.  Multilevel Queues (not event-driven) and MLFQ (whose
+queue levels are not checkpointed) are always simulated in full.
+"""
+from bisect import bisect_left
+from itertools import zip_longest
+
+from .engine import run
+
+# Checkpoints taken over a full run
+CHECKPOINTS = 64
+# Algorithms driven by scheduler.kernel, which can be resumed
+RESUMABLE = {"FCFS", "SJN", "SRT", "Priority", "Round Robin", "ML", "RMS", "EDF"}
+# Process fields every schedule depends on (priority only matters to some)
+_TIMING = ('arrival', 'period', 'execution', 'deadline')
+_BY_PRIORITY = {"Priority", "Multilevel Queues", None}
+
+
+class Checkpoint:
+    """Kernel state at time ``t``, after the releases of that instant.
+
+    Jobs are stored as ``(pid, job, release, rem)`` so they can be found in
+    the job table of an edited task set; ``slices`` and ``missed`` are how
+    many results had been produced by then.
+    """
+    __slots__ = ('t', 'slices', 'missed', 'current', 'start', 'expiry', 'ready')
+
+    def __init__(self, t, slices, missed, current, start, expiry, ready):
+        self.t = t
+        self.slices = slices
+        self.missed = missed
+        self.current = current
+        self.start = start
+        self.expiry = expiry
+        self.ready = ready
+
+    def restore(self, jobs, policy):
+        """Refill ``policy`` from this checkpoint; returns ``(t, current, start, expiry)``."""
+        r, pid, jobno, rem = jobs.r, jobs.pid, jobs.job, jobs.rem
+
+        def index(p, j, release, left):
+            # Jobs with equal release are contiguous in the release-sorted table
+            i = bisect_left(r, release)
+            while pid[i] != p or jobno[i] != j:
+                i += 1
+            rem[i] = left
+            return i
+
+        for job in self.ready:
+            policy.push(index(*job))
+        current = index(*self.current) if self.current is not None else None
+        return self.t, current, self.start, self.expiry
+
+    def __repr__(self):
+        return f"Checkpoint(t={self.t}, slices={self.slices}, ready={len(self.ready)})"
+
+
+class Checkpointer:
+    """Kernel observer taking a ``Checkpoint`` every ``interval`` time units.
+
+    ``offset`` is the ``(slices, missed)`` count already produced before the
+    run it observes (the prefix kept by a resumed run).
+    """
+    stop = False
+
+    def __init__(self, interval, at=0, offset=(0, 0)):
+        self.interval = interval
+        self.at = at
+        self.offset = offset
+        self.checkpoints = []
+
+    def __call__(self, t, current, start, expiry, policy, sch, miss):
+        jobs = policy.jobs
+        rem, release, pid, jobno = jobs.rem, jobs.r, jobs.pid, jobs.job
+
+        def describe(j):
+            return pid[j], jobno[j], release[j], rem[j]
+
+        self.checkpoints.append(Checkpoint(
+            t, self.offset[0] + len(sch), self.offset[1] + len(miss),
+            describe(current) if current is not None else None, start, expiry,
+            [describe(j) for j in policy.pending()]))
+        self.at = (t // self.interval + 1) * self.interval
+        return self.at
+
+
+def first_affected(old, new, alg=None):
+    """Earliest release time at which ``new`` generates a different job than ``old``.
+
+    ``None`` if every job is the same for ``alg`` (e.g. only names or colors
+    changed).  Processes are compared by position, as ``pid`` is the index.
+    """
+    first = None
+    for p, q in zip_longest(old, new):
+        if p is None or q is None:
+            t = (p or q)['arrival']
+        else:
+            fields = _TIMING + (('priority',) if alg in _BY_PRIORITY else ())
+            changed = [k for k in fields if p[k] != q[k]]
+            if not changed:
+                continue
+            if changed == ['period'] and alg != "RMS" and min(p['period'], q['period']) > 0:
+                # The first job keeps its release (RMS ranks every job by period)
+                t = p['arrival'] + min(p['period'], q['period'])
+            else:
+                t = min(p['arrival'], q['arrival'])
+        first = t if first is None else min(first, t)
+    return first
+
+
+class Simulation:
+    """One algorithm and set of settings, re-simulated incrementally as ``procs`` change."""
+
+    def __init__(self, alg, procs, jc, maxt, tq, interval=None):
+        self.alg = alg
+        self.procs = [dict(p) for p in procs]
+        self.jc = jc
+        self.maxt = maxt
+        self.tq = tq
+        self.interval = interval or max(1, maxt // CHECKPOINTS)
+        self.sch = None
+        self.miss = None
+        self.checkpoints = []
+        # Start time of the last re-simulation (0 for a full run)
+        self.resumed_at = None
+
+    def matches(self, alg, jc, maxt, tq):
+        """True if this simulation can be updated for these settings."""
+        return (alg, jc, maxt, tq) == (self.alg, self.jc, self.maxt, self.tq)
+
+    def run(self, progress=None):
+        """Simulate from scratch; returns ``(sch, miss)``."""
+        return self._simulate(self.procs, None, progress)
+
+    def update(self, procs, progress=None):
+        """``(sch, miss)`` for the edited ``procs``, re-simulating only what changed."""
+        if self.sch is None:
+            return self._simulate(procs, None, progress)
+        t = first_affected(self.procs, procs, self.alg)
+        if t is None:
+            self.procs = [dict(p) for p in procs]
+            return self.sch, self.miss
+        base = None
+        for checkpoint in self.checkpoints:
+            if checkpoint.t >= t:
+                break
+            base = checkpoint
+        return self._simulate(procs, base, progress)
+
+    def _simulate(self, procs, base, progress):
+        if self.alg not in RESUMABLE:
+            sch, miss = run(self.alg, procs, self.jc, self.maxt, self.tq, progress)
+            keep, observer = [], None
+        elif base is None:
+            observer = Checkpointer(self.interval)
+            sch, miss = run(self.alg, procs, self.jc, self.maxt, self.tq, progress,
+                            observer=observer)
+            keep = []
+        else:
+            observer = Checkpointer(self.interval, (base.t // self.interval + 1) * self.interval,
+                                    (base.slices, base.missed))
+            sch, miss = run(self.alg, procs, self.jc, self.maxt, self.tq, progress,
+                            observer=observer, resume=base)
+            sch = self.sch[:base.slices] + sch
+            miss = self.miss[:base.missed] + miss
+            keep = self.checkpoints[:self.checkpoints.index(base) + 1]
+        # Only commit once the run went through (it may be cancelled)
+        self.procs = [dict(p) for p in procs]
+        self.sch, self.miss = sch, miss
+        self.checkpoints = keep + (observer.checkpoints if observer is not None else [])
+        self.resumed_at = base.t if base is not None else 0
+        return sch, miss
@@ -0,0 +1,140 @@
+"""Compact job table used by the engine.
+
+Jobs are stored column-wise in ``array.array`` buffers (8 bytes per value)
+instead of one dict per job, and the kernel and policies refer to a job by its
+integer index into the columns:
+
+* ``r``   - release time
+* ``e``   - execution time
+* ``rem`` - remaining execution time (mutated by the simulation)
+* ``dl``  - absolute deadline
+* ``pr``  - priority
+* ``pid`` - process id
+* ``job`` - job number within its process
+
+Large job sets are generated with NumPy (``release_times``); NumPy is only
+imported when needed so that small command line runs start quickly.
+"""
+from array import array
+
+# Job count above which NumPy generation beats paying its import cost
+NUMPY_THRESHOLD = 20000
+
+
+def job_counts(procs, jc, maxt):
+    """Number of jobs each process releases: the first ``jc`` arriving before ``maxt``.
+
+    That is ``min(jc, (maxt - arrival - 1) // period + 1)`` for a periodic
+    process, so with a large ``jc`` the job table grows with the horizon.
+    """
+    counts = []
+    for p in procs:
+        a, period = p['arrival'], p['period']
+        if a >= maxt:
+            counts.append(0)
+        elif period > 0:
+            counts.append(min(jc, (maxt - a - 1) // period + 1))
+        else:
+            counts.append(jc)
+    return counts
+
+
+def _proc_columns(procs):
+    import numpy as np
+    return tuple(np.array([p[k] for p in procs], dtype=np.int64)
+                 for k in ('arrival', 'period', 'deadline'))
+
+
+def release_times(procs, jc, maxt):
+    """Vectorized job generation for all processes at once.
+
+    Returns NumPy arrays ``(pid, job, release, deadline)`` for every job
+    released before ``maxt``, stably sorted by release time so equal releases
+    keep (process, job) order.  ``pid`` is the index into ``procs``.
+    """
+    import numpy as np
+    arrival, period, deadline = _proc_columns(procs)
+    counts = np.array(job_counts(procs, jc, maxt), dtype=np.int64)
+
+    # Job numbers restart at 0 for each process: global index minus process offset
+    pid = np.repeat(np.arange(len(procs), dtype=np.int64), counts)
+    offsets = np.cumsum(counts) - counts
+    job = np.arange(len(pid), dtype=np.int64) - np.repeat(offsets, counts)
+    release = arrival[pid] + job * period[pid]
+
+    order = np.argsort(release, kind='stable')
+    pid, job, release = pid[order], job[order], release[order]
+    return pid, job, release, release + deadline[pid]
+
+
+def tuple_columns(rows, width):
+    """Columns of a list of equal-length int tuples (e.g. ``sch``) as int64 arrays."""
+    import numpy as np
+    from itertools import chain
+    # fromiter over the flattened tuples is ~2x faster than np.asarray(rows)
+    a = np.fromiter(chain.from_iterable(rows), dtype=np.int64,
+                    count=width * len(rows)).reshape(-1, width)
+    return tuple(a[:, i] for i in range(width))
+
+
+def release_deadline(procs, job, pid):
+    """Release times and absolute deadlines of job numbers ``job`` of processes ``pid``."""
+    import numpy as np
+    arrival, period, deadline = _proc_columns(procs)
+    pid = np.asarray(pid, dtype=np.int64)
+    release = arrival[pid] + np.asarray(job, dtype=np.int64) * period[pid]
+    return release, release + deadline[pid]
+
+
+class JobTable:
+    """Structure-of-arrays job set, sorted by release time."""
+    __slots__ = ('r', 'e', 'rem', 'dl', 'pr', 'pid', 'job')
+
+    def __init__(self, r, e, dl, pr, pid, job):
+        self.r = r
+        self.e = e
+        self.rem = array('q', e)
+        self.dl = dl
+        self.pr = pr
+        self.pid = pid
+        self.job = job
+
+    def __len__(self):
+        return len(self.r)
+
+    @classmethod
+    def generate(cls, procs, jc, maxt):
+        """Release the first ``jc`` jobs of every process that arrive before ``maxt``."""
+        counts = job_counts(procs, jc, maxt)
+        if sum(counts) >= NUMPY_THRESHOLD:
+            return cls._generate_numpy(procs, jc, maxt)
+
+        # Small sets: fill the columns one process at a time from range objects
+        r, e, dl, pr, pid, job = (array('q'), array('q'), array('q'),
+                                  array('d'), array('q'), array('q'))
+        for p, k in zip(procs, counts):
+            a, period, d = p['arrival'], p['period'], p['deadline']
+            r.extend(range(a, a + k * period, period) if period > 0 else array('q', [a]) * k)
+            dl.extend(range(a + d, a + d + k * period, period) if period > 0
+                      else array('q', [a + d]) * k)
+            e.extend(array('q', [p['execution']]) * k)
+            pr.extend(array('d', [p['priority']]) * k)
+            pid.extend(array('q', [p['id']]) * k)
+            job.extend(range(k))
+
+        if any(r[i] > r[i + 1] for i in range(len(r) - 1)):
+            order = sorted(range(len(r)), key=r.__getitem__)
+            r, e, dl, pr, pid, job = (array(col.typecode, [col[i] for i in order])
+                                      for col in (r, e, dl, pr, pid, job))
+        return cls(r, e, dl, pr, pid, job)
+
+    @classmethod
+    def _generate_numpy(cls, procs, jc, maxt):
+        import numpy as np
+        idx, job, r, dl = release_times(procs, jc, maxt)
+        ids = np.array([p['id'] for p in procs], dtype=np.int64)
+        e = np.array([p['execution'] for p in procs], dtype=np.int64)
+        pr = np.array([p['priority'] for p in procs], dtype=np.float64)
+        return cls(array('q', r.tobytes()), array('q', e[idx].tobytes()),
+                   array('q', dl.tobytes()), array('d', pr[idx].tobytes()),
+                   array('q', ids[idx].tobytes()), array('q', job.tobytes()))
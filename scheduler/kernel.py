@@ -0,0 +1,177 @@
+"""Discrete-event simulation kernel shared by every policy-based algorithm.
+
+Jobs are integer indices into a release-sorted ``JobTable``.  The only
+events are job releases, the running job's completion and its
+quantum expiry.  Releases come from a cursor over the release-sorted job list
+and the other two are derived from the running job, so the next event is the
+minimum of (at most) three candidates and time jumps straight to it.
+
+``progress``, if given, is called with the fraction of jobs released so far
+every ``PROGRESS_EVERY`` events; it may raise ``Cancelled`` to abort the run.
+
+``sink``, if given, receives the slices and missed deadlines in batches of at
+most a few thousand (see ``scheduler.sinks``) instead of them being collected
+in lists, so the output of arbitrarily long runs never sits in memory.
+
+``observer``, if given, is called as ``observer(t, current, start, expiry,
+policy, sch, miss)`` at the first event at or after time ``observer.at``,
+once the releases and preemption of that instant are handled and before a
+job is dispatched (``sch`` and ``miss`` are the results so far, or the
+current batch with a sink).  It returns its next observation time, or
+``None`` for no more; once it sets ``observer.stop`` the simulation ends
+right there (see ``scheduler.hyperperiod``).
+
+``resume``, if given, continues from a state captured that way:
+``resume.restore(jobs, policy)`` refills the ready set and remaining times
+and returns ``(t, current, start, expiry)``, and only what happens from
+``t`` on is returned (see ``scheduler.incremental``).
+
+Time-sliced policies may vary the slice per job (``policy.timeslice``) and
+decide where a job whose slice ran out goes (``policy.expired``).  A policy
+with a ``timer`` gets ``policy.tick(t, current)`` called once time reaches
+it, before that instant's releases; ``tick`` returns the next timer time.
+
+``overhead``, if given, is a ``scheduler.overhead.Overhead`` whose
+dispatch, context-switch and cache-reload costs are charged each time a job
+is dispatched, before it runs; the charged time goes to ``overhead.slices``.
+It cannot be combined with ``observer`` or ``resume``, whose states do not
+include the last job that ran.
+
+Run-to-completion policies (non-preemptive, no quantum) finish every released
+job.  All other policies stop the clock at ``maxt``; a job still running
+there is recorded up to ``maxt`` and not counted as completed.
+"""
+from bisect import bisect_right
+
+# Events between two calls of the progress callback
+PROGRESS_EVERY = 4096
+
+
+class Cancelled(Exception):
+    """Raised from a progress callback to abort a simulation."""
+
+
+def simulate(jobs, policy, maxt, progress=None, sink=None, observer=None, resume=None,
+             overhead=None):
+    """Simulate the ``JobTable`` ``jobs`` under ``policy``.
+
+    Returns ``(sch, miss)``, or ``sink`` after writing everything to it.
+    """
+    n = len(jobs)
+    release, rem, dl, jobno, pid = jobs.r, jobs.rem, jobs.dl, jobs.job, jobs.pid
+    push, pop, preempts = policy.push, policy.pop, policy.preempts
+    preemptive = policy.preemptive
+    quantum = policy.quantum
+    timeslice, expired = policy.timeslice, policy.expired
+    timer = policy.timer
+    bounded = preemptive or quantum is not None
+    if overhead is not None:
+        if observer is not None or resume is not None:
+            raise ValueError("Overhead cannot be combined with an observer or resume")
+        charged = overhead.slices
+        costs = (overhead.dispatch, overhead.switch, overhead.reload)
+        e = jobs.e
+    last = None  # Job that last ran, for context switches
+    i = 0
+    t = 0
+    current = None
+    start = 0
+    expiry = None
+    if resume is not None:
+        t, current, start, expiry = resume.restore(jobs, policy)
+        i = bisect_right(release, t)
+    sch = []
+    miss = []
+    tick = PROGRESS_EVERY
+    obs = observer.at if observer is not None else None
+
+    while True:
+        tick -= 1
+        if not tick:
+            tick = PROGRESS_EVERY
+            if progress is not None:
+                progress(i / n)
+            if sink is not None:
+                sink.write(sch, miss)
+                sch.clear()
+                miss.clear()
+
+        if timer is not None and t >= timer:
+            timer = policy.tick(t, current)
+
+        # Release event(s)
+        while i < n and release[i] <= t:
+            push(i)
+            i += 1
+
+        if current is not None and preemptive and preempts(current):
+            if start < t:
+                sch.append((jobno[current], start, t, pid[current]))
+            push(current)
+            current = None
+
+        if obs is not None and t >= obs:
+            obs = observer(t, current, start, expiry, policy, sch, miss)
+            if observer.stop:
+                if current is not None:
+                    sch.append((jobno[current], start, t, pid[current]))
+                break
+
+        if current is None:
+            if not policy:
+                if i == n:
+                    break
+                t = release[i]
+                continue
+            current = pop()
+            if overhead is not None:
+                # Dispatch, then context switch and cache reload for another job
+                other = current != last
+                was = t
+                for kind, cost in enumerate((costs[0], other and costs[1],
+                                             other and rem[current] < e[current] and costs[2])):
+                    if cost and not (bounded and t >= maxt):
+                        end = min(t + cost, maxt) if bounded else t + cost
+                        charged.append((t, end, kind))
+                        t = end
+                last = current
+                if t > was:
+                    # Releases during the overhead are handled before the job runs
+                    start = t
+                    expiry = t + timeslice(current) if quantum else None
+                    continue
+            start = t
+            expiry = t + timeslice(current) if quantum else None
+
+        # Jump to the next event
+        nxt = t + rem[current]
+        if preemptive and i < n and release[i] < nxt:
+            nxt = release[i]
+        if expiry is not None and expiry < nxt:
+            nxt = expiry
+        if timer is not None and timer < nxt:
+            nxt = timer
+        if bounded and maxt < nxt:
+            nxt = maxt
+        rem[current] -= nxt - t
+        t = nxt
+
+        if rem[current] == 0:
+            sch.append((jobno[current], start, t, pid[current]))
+            if t > dl[current]:
+                miss.append((jobno[current], dl[current], pid[current]))
+            current = None
+        elif t == expiry:
+            sch.append((jobno[current], start, t, pid[current]))
+            expired(current)
+            current = None
+
+        if bounded and t >= maxt:
+            if current is not None and start < t:
+                sch.append((jobno[current], start, t, pid[current]))
+            break
+
+    if sink is not None:
+        sink.write(sch, miss)
+        return sink
+    return sch, miss
@@ -0,0 +1,225 @@
+"""Multiprocessor scheduling on ``cores`` identical cores.
+
+Two approaches are simulated:
+
+* global - one ready heap shared by all cores; at any time the ``cores``
+  best jobs run (global EDF, RMS or Minimum Laxity).  A release that beats
+  the worst running job preempts it, and a preempted job may resume on
+  another core (migration).
+* partitioned - each process is bound to one core by bin-packing its
+  utilization (first-fit or worst-fit, largest first) and every core runs
+  the chosen algorithm on its own processes with the single-core kernel.
+
+Both return ``(sch, miss, core)``: the usual slices and missed deadlines
+plus the core each slice ran on (a list parallel to ``sch``)::
+
+    sch, miss, core = run_multicore("EDF", procs, jc, maxt, tq, cores=64)
+    analyze(sch, miss, procs, core=core, cores=64).summary()
+"""
+from heapq import heapify, heappop, heappush
+
+from .engine import ALIASES, run
+from .jobs import JobTable
+from .kernel import PROGRESS_EVERY
+from .policies import EDF, RMS, LeastLaxity
+from .schedulability import liu_layland_bound
+
+# Global scheduling policies, by algorithm name
+GLOBAL_POLICIES = {"EDF": EDF, "RMS": RMS, "ML": LeastLaxity}
+# Ways of spreading the task set over the cores
+MODES = ("global", "first-fit", "worst-fit")
+
+
+def _utilization(p):
+    return p['execution'] / p['period'] if p['period'] > 0 else 1.0
+
+
+def partition(procs, cores, fit="first", alg=None):
+    """Core index of each process, bin-packing utilizations onto ``cores`` cores.
+
+    Processes are placed largest utilization first, on the first core they
+    fit on (``fit="first"``) or on the least loaded one (``fit="worst"``).
+    A core fits while its utilization stays at most 1, or for RMS within the
+    Liu & Layland bound of its process count.  A process that fits nowhere
+    goes to the least loaded core, where the simulation shows its misses.
+    """
+    if fit not in ("first", "worst"):
+        raise ValueError(f"Unknown fit: {fit}")
+    load = [0.0] * cores
+    count = [0] * cores
+    core_of = [0] * len(procs)
+
+    def fits(c, u):
+        bound = liu_layland_bound(count[c] + 1) if alg == "RMS" else 1.0
+        return load[c] + u <= bound + 1e-12
+
+    order = sorted(range(len(procs)), key=lambda k: -_utilization(procs[k]))
+    for k in order:
+        u = _utilization(procs[k])
+        least = min(range(cores), key=load.__getitem__)
+        if fit == "worst":
+            c = least
+        else:
+            c = next((c for c in range(cores) if fits(c, u)), least)
+        core_of[k] = c
+        load[c] += u
+        count[c] += 1
+    return core_of
+
+
+def simulate_global(jobs, policy, cores, maxt, progress=None):
+    """Global scheduling of the ``JobTable`` ``jobs`` on ``cores`` cores.
+
+    ``policy`` is a preemptive ``HeapPolicy``; the ``cores`` jobs with the
+    lowest keys run.  Returns ``(sch, miss, core)``.  With one core this is
+    exactly ``scheduler.kernel.simulate``.
+    """
+    n = len(jobs)
+    release, rem, dl, jobno, pid = jobs.r, jobs.rem, jobs.dl, jobs.job, jobs.pid
+    push, pop, key, ready = policy.push, policy.pop, policy.key, policy.ready
+    yield_ties = policy.yield_ties
+    running = [None] * cores
+    began = [0] * cores  # Start of the running slice
+    mark = [0] * cores   # Time the running job's rem was last brought up to date
+    ends = [0] * cores
+    idle = list(range(cores))
+    heapify(idle)
+    finish = []  # (end, core, job); stale once the core runs something else
+    sch = []
+    miss = []
+    core = []
+    i = 0
+    t = 0
+    tick = PROGRESS_EVERY
+
+    while True:
+        tick -= 1
+        if not tick:
+            tick = PROGRESS_EVERY
+            if progress is not None:
+                progress(i / n)
+
+        # Release event(s)
+        released = i < n and release[i] <= t
+        while i < n and release[i] <= t:
+            push(i)
+            i += 1
+
+        # Fill idle cores first; a job dispatched now is not preempted again now
+        swapped = set()
+        while idle and ready:
+            c = heappop(idle)
+            j = pop()
+            running[c], began[c], mark[c], ends[c] = j, t, t, t + rem[j]
+            heappush(finish, (ends[c], c, j))
+            swapped.add(c)
+
+        # Then released jobs displace the worst running jobs while they beat them.
+        # Like the single-core kernel, a core is preempted at most once per event
+        while released and ready:
+            worst = None
+            for c in range(cores):
+                if c in swapped or running[c] is None:
+                    continue
+                j = running[c]
+                rem[j] -= t - mark[c]
+                mark[c] = t
+                k = key(j)
+                if worst is None or k > worst_key:
+                    worst, worst_key = c, k
+            best = ready[0][0]
+            if worst is None or not (best <= worst_key if yield_ties else best < worst_key):
+                break
+            swapped.add(worst)
+            j = running[worst]
+            sch.append((jobno[j], began[worst], t, pid[j]))
+            core.append(worst)
+            push(j)
+            j = pop()
+            running[worst], began[worst], mark[worst], ends[worst] = j, t, t, t + rem[j]
+            heappush(finish, (ends[worst], worst, j))
+
+        # Jump to the next event
+        while finish and (running[finish[0][1]] != finish[0][2]
+                          or ends[finish[0][1]] != finish[0][0]):
+            heappop(finish)
+        nxt = finish[0][0] if finish else None
+        if i < n and (nxt is None or release[i] < nxt):
+            nxt = release[i]
+        if nxt is None:
+            break
+        if maxt < nxt:
+            nxt = maxt
+        t = nxt
+
+        # Completions
+        while finish and finish[0][0] <= t:
+            end, c, j = heappop(finish)
+            if running[c] != j or ends[c] != end:
+                continue
+            rem[j] = 0
+            sch.append((jobno[j], began[c], t, pid[j]))
+            core.append(c)
+            if t > dl[j]:
+                miss.append((jobno[j], dl[j], pid[j]))
+            running[c] = None
+            heappush(idle, c)
+
+        if t >= maxt:
+            for c in range(cores):
+                j = running[c]
+                if j is not None:
+                    rem[j] -= t - mark[c]
+                    sch.append((jobno[j], began[c], t, pid[j]))
+                    core.append(c)
+            break
+
+    return sch, miss, core
+
+
+def run_global(alg, procs, jc, maxt, cores, progress=None, **options):
+    """Global ``alg`` (one of ``GLOBAL_POLICIES``) on ``cores`` cores.
+
+    Global scheduling has no algorithm options (such as Minimum Laxity's
+    ``recheck``); passing any raises ``ValueError``.
+    """
+    if alg not in GLOBAL_POLICIES:
+        raise ValueError(f"Global scheduling supports {', '.join(GLOBAL_POLICIES)}, not {alg}")
+    if options:
+        raise ValueError(f"Global scheduling does not support {', '.join(options)}")
+    jobs = JobTable.generate(procs, jc, maxt)
+    policy = GLOBAL_POLICIES[alg]
+    policy = policy(jobs, procs) if policy is RMS else policy(jobs)
+    return simulate_global(jobs, policy, cores, maxt, progress)
+
+
+def run_partitioned(alg, procs, jc, maxt, tq, cores, fit="first", progress=None, **options):
+    """``alg`` (with its ``options``) on each core for the processes ``partition`` bound to it."""
+    core_of = partition(procs, cores, fit, alg)
+    sch, miss, core = [], [], []
+    for c in range(cores):
+        ids = [k for k, owner in enumerate(core_of) if owner == c]
+        if not ids:
+            continue
+        # Each core's run sees its processes renumbered from 0
+        sub = [dict(procs[k], id=local) for local, k in enumerate(ids)]
+        part = None if progress is None else (lambda f, c=c: progress((c + f) / cores))
+        s, m = run(alg, sub, jc, maxt, tq, part, **options)
+        sch.extend((j, st, en, ids[p]) for j, st, en, p in s)
+        core.extend([c] * len(s))
+        miss.extend((j, d, ids[p]) for j, d, p in m)
+    # Slices in end-time order, as from the kernel
+    order = sorted(range(len(sch)), key=lambda k: sch[k][2])
+    miss.sort(key=lambda m: m[1])
+    return [sch[k] for k in order], miss, [core[k] for k in order]
+
+
+def run_multicore(alg, procs, jc, maxt, tq, cores, mode="global", progress=None, **options):
+    """``(sch, miss, core)`` of ``alg`` on ``cores`` cores (``mode`` from ``MODES``)."""
+    alg = ALIASES.get(alg, alg)
+    if mode == "global":
+        return run_global(alg, procs, jc, maxt, cores, progress, **options)
+    if mode in ("first-fit", "worst-fit"):
+        return run_partitioned(alg, procs, jc, maxt, tq, cores, mode.split('-')[0], progress,
+                               **options)
+    raise ValueError(f"Unknown multicore mode: {mode}")
@@ -0,0 +1,50 @@
+"""Scheduler overhead: time the CPU spends switching between jobs.
+
+By default every algorithm treats dispatching a job as free.  An
+``Overhead`` passed to ``scheduler.engine.run`` makes the kernel charge, each
+time it dispatches a job and before that job runs:
+
+* ``dispatch`` - always (running the scheduler itself)
+* ``switch``   - when the job is not the one that last ran (context switch)
+* ``reload``   - when, in addition, the job already ran before, i.e. it
+  resumes after a preemption or an expired quantum with a cold cache
+
+The charged time is recorded as ``(start, end, kind)`` slices on the
+``Overhead`` (``kind`` indexes ``KINDS``), separate from the job slices, so
+every schedule statistic already includes the delay and ``scheduler.stats``
+reports the time lost::
+
+    overhead = Overhead(switch=1, reload=2)
+    sch, miss = run("Round Robin", procs, jc, maxt, tq=2, overhead=overhead)
+    analyze(sch, miss, procs, overhead=overhead.slices).summary()['overhead_time']
+
+Overhead is not preempted and, like a job, is cut off at ``maxt``.
+"""
+
+# Overhead slice kinds, in the order they are charged
+KINDS = ('dispatch', 'switch', 'reload')
+
+
+class Overhead:
+    """Dispatch, context-switch and cache-reload costs and the slices they produce."""
+
+    def __init__(self, switch=0, dispatch=0, reload=0):
+        if min(switch, dispatch, reload) < 0:
+            raise ValueError("Overhead costs cannot be negative")
+        self.switch = switch
+        self.dispatch = dispatch
+        self.reload = reload
+        self.slices = []
+
+    def __bool__(self):
+        return bool(self.switch or self.dispatch or self.reload)
+
+    def __repr__(self):
+        return f"Overhead(switch={self.switch}, dispatch={self.dispatch}, reload={self.reload})"
+
+    def fresh(self):
+        """Same costs, no slices (for another run)."""
+        return Overhead(self.switch, self.dispatch, self.reload)
+
+    def to_dict(self):
+        return {'switch': self.switch, 'dispatch': self.dispatch, 'reload': self.reload}
@@ -0,0 +1,270 @@
+"""Scheduling policies plugged into ``scheduler.kernel.simulate``.
+
+A policy owns the ready set of job indices into a ``JobTable``.  The kernel pushes jobs onto it as they are
+released (or preempted), pops the next job to run when the CPU is free and,
+for preemptive policies, asks ``preempts(current)`` at every release whether
+the best ready job should displace the running one.
+"""
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+from numbers import Integral
+
+
+class Policy:
+    """Base policy: run-to-completion, no quantum."""
+    # Re-evaluate the running job at every release
+    preemptive = False
+    # Time slice after which the running job goes back to the ready set
+    quantum = None
+    # Time of the next ``tick`` call, None for no timer
+    timer = None
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    def push(self, job):
+        raise NotImplementedError
+
+    def pop(self):
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def pending(self):
+        """Ready jobs in the order they would be popped."""
+        raise NotImplementedError
+
+    def preempts(self, job):
+        return False
+
+    def timeslice(self, job):
+        """Time slice of ``job`` when it is dispatched (only used with a quantum)."""
+        return self.quantum
+
+    def expired(self, job):
+        """Put back a job whose time slice ran out."""
+        self.push(job)
+
+    def tick(self, t, current):
+        """Timer event at time ``t``; returns the next timer time or None."""
+        return None
+
+
+class FifoPolicy(Policy):
+    """Ready jobs run in the order they became ready."""
+
+    def __init__(self, jobs, quantum=None):
+        super().__init__(jobs)
+        self.ready = deque()
+        self.quantum = quantum
+
+    def push(self, job):
+        self.ready.append(job)
+
+    def pop(self):
+        return self.ready.popleft()
+
+    def __len__(self):
+        return len(self.ready)
+
+    def pending(self):
+        return list(self.ready)
+
+
+class HeapPolicy(Policy):
+    """Ready jobs ordered by ``key(job)``, ties broken by insertion order."""
+    # When True a running job gives way to a ready job with an equal key
+    yield_ties = False
+
+    def __init__(self, jobs):
+        super().__init__(jobs)
+        self.ready = []
+        self.seq = count()
+
+    def key(self, job):
+        raise NotImplementedError
+
+    def push(self, job):
+        heappush(self.ready, (self.key(job), next(self.seq), job))
+
+    def pop(self):
+        return heappop(self.ready)[2]
+
+    def __len__(self):
+        return len(self.ready)
+
+    def pending(self):
+        return [job for _, _, job in sorted(self.ready)]
+
+    def preempts(self, job):
+        if not self.ready:
+            return False
+        best, cur = self.ready[0][0], self.key(job)
+        return best <= cur if self.yield_ties else best < cur
+
+
+class FCFS(FifoPolicy):
+    """First Come First Served."""
+
+
+class RoundRobin(FifoPolicy):
+    """FIFO with a time quantum; an expired job rejoins the back of the queue."""
+
+    def __init__(self, jobs, quantum):
+        super().__init__(jobs, quantum)
+
+
+class SJN(HeapPolicy):
+    """Shortest Job Next (non-preemptive, by execution time)."""
+
+    def key(self, job):
+        return self.jobs.e[job]
+
+
+class SRT(HeapPolicy):
+    """Shortest Remaining Time."""
+    preemptive = True
+
+    def key(self, job):
+        return self.jobs.rem[job]
+
+
+class PriorityPolicy(HeapPolicy):
+    """Preemptive priority, higher value = higher priority."""
+    preemptive = True
+
+    def key(self, job):
+        return -self.jobs.pr[job]
+
+
+class RMS(HeapPolicy):
+    """Rate Monotonic: static priority, shorter period = higher priority."""
+    preemptive = True
+
+    def __init__(self, jobs, procs):
+        super().__init__(jobs)
+        self.periods = {p['id']: p['period'] for p in procs}
+
+    def key(self, job):
+        return self.periods[self.jobs.pid[job]]
+
+
+class EDF(HeapPolicy):
+    """Earliest Deadline First."""
+    preemptive = True
+    yield_ties = True
+
+    def key(self, job):
+        return self.jobs.dl[job]
+
+
+class LeastLaxity(HeapPolicy):
+    """Minimum Laxity First.
+
+    Laxity ``dl - (t + rem)`` is always compared at a common ``t``, so the heap
+    is keyed on ``dl - rem``.  A waiting job's key is fixed while the running
+    job's grows as it runs, so the order can change between events: laxity is
+    re-evaluated at releases and, with ``recheck``, at every multiple of
+    ``recheck`` time units.  Ready jobs with equal laxity run in the order they
+    became ready, and the running job keeps the CPU against an equal laxity,
+    so equal-laxity jobs do not take turns at every re-evaluation (pass
+    ``yield_ties=True`` to make it give way, as the original loop did).
+    """
+    preemptive = True
+
+    def __init__(self, jobs, recheck=None, yield_ties=False):
+        super().__init__(jobs)
+        if recheck is not None and recheck <= 0:
+            raise ValueError("Laxity recheck interval must be positive")
+        self.recheck = recheck
+        self.timer = recheck
+        self.yield_ties = yield_ties
+
+    def key(self, job):
+        return self.jobs.dl[job] - self.jobs.rem[job]
+
+    def tick(self, t, current):
+        # Nothing to do: the kernel compares the running job after every event
+        return (t // self.recheck + 1) * self.recheck
+
+
+class MLFQ(Policy):
+    """Multilevel feedback queue.
+
+    Released jobs enter level 0 and a job that uses up the quantum of its
+    level drops one level.  A level only runs when all levels above it are
+    empty, and a job arriving in a higher level preempts the running one
+    (which keeps its level).  Every ``boost`` time units all jobs move back
+    to level 0, so long jobs cannot starve.  Each level is a deque, so every
+    operation is O(number of levels).
+    """
+    preemptive = True
+
+    def __init__(self, jobs, quanta, boost=None):
+        super().__init__(jobs)
+        self.check(quanta, boost)
+        self.quanta = list(quanta)
+        self.quantum = self.quanta[0]
+        self.levels = [deque() for _ in self.quanta]
+        self.level = array('B', bytes(len(jobs)))
+        self.size = 0
+        self.boost = boost
+        self.timer = boost or None
+
+    @staticmethod
+    def check(quanta, boost=None):
+        """Raise ``ValueError`` unless ``quanta`` and ``boost`` make a valid MLFQ."""
+        if not 0 < len(quanta) <= 256:
+            raise ValueError("MLFQ needs between 1 and 256 levels")
+        # A zero-length slice never advances time
+        if not all(isinstance(q, Integral) and q > 0 for q in quanta):
+            raise ValueError(f"MLFQ quanta must be positive integers, got {list(quanta)}")
+        if boost is not None and not (isinstance(boost, Integral) and boost >= 0):
+            raise ValueError(f"MLFQ boost must be a non-negative integer, got {boost}")
+
+    def push(self, job):
+        self.levels[self.level[job]].append(job)
+        self.size += 1
+
+    def pop(self):
+        for queue in self.levels:
+            if queue:
+                self.size -= 1
+                return queue.popleft()
+        raise IndexError("pop from an empty MLFQ")
+
+    def __len__(self):
+        return self.size
+
+    def pending(self):
+        return [job for queue in self.levels for job in queue]
+
+    def preempts(self, job):
+        levels = self.levels
+        for k in range(self.level[job]):
+            if levels[k]:
+                return True
+        return False
+
+    def timeslice(self, job):
+        return self.quanta[self.level[job]]
+
+    def expired(self, job):
+        if self.level[job] < len(self.levels) - 1:
+            self.level[job] += 1
+        self.push(job)
+
+    def tick(self, t, current):
+        # Priority boost: every job goes back to the top level, in level order
+        top, level = self.levels[0], self.level
+        for queue in self.levels[1:]:
+            for job in queue:
+                level[job] = 0
+            top.extend(queue)
+            queue.clear()
+        if current is not None:
+            level[current] = 0
+        return (t // self.boost + 1) * self.boost
@@ -0,0 +1,360 @@
+"""Original list-based scheduling loops.
+
+These are the O(n^2) implementations the engine started from (``min`` over
+the ready list, ``list.remove``, ``pop(0)``).  They are kept unchanged as the
+oracle ``scheduler.bench`` checks the optimized engine against; do not use
+them for real simulations.
+"""
+from statistics import median
+
+
+# Job generation
+def generate_jobs(procs, jc, maxt):
+    jobs = []
+    for p in procs:
+        for j in range(jc):
+            arr = p['arrival'] + j * p['period']
+            if arr < maxt:
+                jobs.append({
+                    'job': j,
+                    'pid': p['id'],
+                    'r': arr,
+                    'e': p['execution'],
+                    'rem': p['execution'],
+                    'dl': arr + p['deadline'],
+                    'pr': p['priority']
+                })
+    return jobs
+
+
+# FCFS
+def run_fcfs(procs, jc, maxt, tq):
+    jobs = generate_jobs(procs, jc, maxt)
+    jobs.sort(key=lambda x: x['r'])
+    t = 0
+    sch = []
+    miss = []
+
+    for job in jobs:
+        if t < job['r']:
+            t = job['r']
+        st = t
+        en = st + job['e']
+        sch.append((job['job'], st, en, job['pid']))
+        if en > job['dl']:
+            miss.append((job['job'], job['dl'], job['pid']))
+        t = en
+
+    return sch, miss
+
+
+# SJN
+def run_sjn(procs, jc, maxt, tq):
+    jobs = generate_jobs(procs, jc, maxt)
+    rem = sorted(jobs, key=lambda x: x['r'])
+    ready = []
+    t = 0
+    sch = []
+    miss = []
+
+    while rem or ready:
+        while rem and rem[0]['r'] <= t:
+            ready.append(rem.pop(0))
+        if not ready:
+            t = rem[0]['r']
+            continue
+
+        job = min(ready, key=lambda x: x['e'])
+        ready.remove(job)
+        st = t
+        en = st + job['e'] 
+        sch.append((job['job'], st, en, job['pid']))
+        if en > job['dl']:
+            miss.append((job['job'], job['dl'], job['pid']))
+        t = en
+
+    return sch, miss
+
+
+# SRT
+def run_srt(procs, jc, maxt, tq):
+    jobs = generate_jobs(procs, jc, maxt)
+    rem = sorted(jobs, key=lambda x: x['r'])
+    ready = []
+    t = 0
+    sch = []
+    miss = []
+    current = None
+    start = 0
+
+    while rem or ready or current:
+        while rem and rem[0]['r'] <= t:
+            ready.append(rem.pop(0))
+
+        if current and ready and min(ready, key=lambda x: x['rem'])['rem'] < current['rem']:
+            sch.append((current['job'], start, t, current['pid']))
+            ready.append(current)
+            current = None
+
+        if not current and ready:
+            current = min(ready, key=lambda x: x['rem'])
+            ready.remove(current)
+            start = t
+
+        if not current:
+            t = rem[0]['r'] if rem else maxt
+            continue
+
+        next_arrival = rem[0]['r'] if rem else maxt
+        step = min(current['rem'], next_arrival - t if next_arrival > t else maxt)
+        current['rem'] -= step
+        t += step
+
+        if current['rem'] == 0:
+            sch.append((current['job'], start, t, current['pid']))
+            if t > current['dl']:
+                miss.append((current['job'], current['dl'], current['pid']))
+            current = None
+
+        if t >= maxt:
+            break
+
+    return sch, miss
+
+
+# Priority (preemptive)
+def run_priority(procs, jc, maxt, tq):
+    jobs = generate_jobs(procs, jc, maxt)
+    rem = sorted(jobs, key=lambda x: x['r'])
+    ready = []
+    t = 0
+    current = None
+    start = 0
+    sch = []
+    miss = []
+
+    while rem or ready or current:
+        while rem and rem[0]['r'] <= t:
+            ready.append(rem.pop(0))
+
+        ready.sort(key=lambda x: -x['pr'])  # Higher priority value = higher priority
+
+        if current and ready and ready[0]['pr'] > current['pr']:
+            sch.append((current['job'], start, t, current['pid']))
+            ready.append(current)
+            current = None
+
+        if not current and ready:
+            current = ready.pop(0)
+            start = t
+
+        if not current:
+            t = rem[0]['r'] if rem else maxt
+            continue
+
+        next_arrival = rem[0]['r'] if rem else maxt
+        step = min(current['rem'], next_arrival - t if next_arrival > t else current['rem'])
+        current['rem'] -= step
+        t += step
+
+        if current['rem'] == 0:
+            sch.append((current['job'], start, t, current['pid']))
+            if t > current['dl']:
+                miss.append((current['job'], current['dl'], current['pid']))
+            current = None
+
+        if t >= maxt:
+            break
+
+    return sch, miss
+
+
+# Round Robin
+def run_round_robin(procs, jc, maxt, tq):
+    jobs = generate_jobs(procs, jc, maxt)
+    ready = []
+    rem = sorted(jobs, key=lambda x: x['r'])
+    t = 0
+    sch = []
+    miss = []
+
+    while rem or ready:
+        while rem and rem[0]['r'] <= t:
+            ready.append(rem.pop(0))
+
+        if not ready:
+            t = rem[0]['r']
+            continue
+
+        job = ready.pop(0)
+        st = t
+        run = min(tq, job['rem'])
+        job['rem'] -= run
+        t += run
+
+        sch.append((job['job'], st, t, job['pid']))
+
+        if job['rem'] > 0:
+            ready.append(job)
+        else:
+            if t > job['dl']:
+                miss.append((job['job'], job['dl'], job['pid']))
+
+        if t >= maxt:
+            break
+
+    return sch, miss
+
+
+# Multilevel queues
+def run_multilevel_queues(procs, jc, maxt, tq):
+    jobs = generate_jobs(procs, jc, maxt)
+
+    # Find median priority to split into queues
+    priorities = [p['priority'] for p in procs]
+    med = median(priorities) if priorities else 5
+
+    # Split jobs into high and low priority queues
+    high = [j for j in jobs if j['pr'] > med]
+    low = [j for j in jobs if j['pr'] <= med]
+
+    sch = []
+    miss = []
+    t = 0
+
+    # Process high priority queue first, then low priority
+    for q in [sorted(high, key=lambda x: x['r']), sorted(low, key=lambda x: x['r'])]:
+        for job in q:
+            if t < job['r']:
+                t = job['r']
+            st = t
+            en = st + job['e']
+            sch.append((job['job'], st, en, job['pid']))
+            if en > job['dl']:
+                miss.append((job['job'], job['dl'], job['pid']))
+            t = en
+
+    return sch, miss
+
+
+# Minimum Laxity
+def run_minimum_laxity(procs, jc, maxt, tq):
+    jobs = generate_jobs(procs, jc, maxt)
+    rem = sorted(jobs, key=lambda x: x['r'])
+    ready = []
+    t = 0
+    current = None
+    start = 0
+    sch = []
+    miss = []
+
+    while rem or ready or current:
+        while rem and rem[0]['r'] <= t:
+            ready.append(rem.pop(0))
+
+        if current:
+            ready.append(current)
+            current = None
+
+        if ready:
+            # Calculate laxity (slack time) for each job
+            laxities = [(j['dl'] - (t + j['rem']), j) for j in ready]
+            # Select job with minimum laxity
+            current = min(laxities, key=lambda x: x[0])[1]
+            ready.remove(current)
+            start = t
+
+        if not current:
+            t = rem[0]['r'] if rem else maxt
+            continue
+
+        next_arrival = rem[0]['r'] if rem else maxt
+        step = min(current['rem'], next_arrival - t if next_arrival > t else current['rem'])
+        current['rem'] -= step
+        t += step
+
+        if current['rem'] == 0:
+            sch.append((current['job'], start, t, current['pid']))
+            if t > current['dl']:
+                miss.append((current['job'], current['dl'], current['pid']))
+            current = None
+
+        if t >= maxt:
+            break
+
+    return sch, miss
+
+
+# RMS
+def run_rms(procs, jc, maxt, tq):
+    # Rate Monotonic Scheduling (static priority based on shortest period)
+    rms_procs = []
+
+    # Assign RMS priorities - lower period = higher priority
+    for p in procs:
+        p_copy = p.copy()
+        p_copy['priority'] = 10000 / p['period']  # Invert for correct priority direction
+        rms_procs.append(p_copy)
+
+    return run_priority(rms_procs, jc, maxt, tq)
+
+
+# EDF
+def run_edf(procs, jc, maxt, tq):
+    # Earliest Deadline First (dynamic priority by nearest deadline)
+    jobs = generate_jobs(procs, jc, maxt)
+    rem = sorted(jobs, key=lambda x: x['r'])
+    ready = []
+    t = 0
+    sch = []
+    miss = []
+    current = None
+    start = 0
+
+    while rem or ready or current:
+        while rem and rem[0]['r'] <= t:
+            ready.append(rem.pop(0))
+
+        if current:
+            ready.append(current)
+            current = None
+
+        if ready:
+            # Select job with earliest absolute deadline
+            current = min(ready, key=lambda x: x['dl'])
+            ready.remove(current)
+            start = t
+
+        if not current:
+            t = rem[0]['r'] if rem else maxt
+            continue
+
+        next_arrival = rem[0]['r'] if rem else maxt
+        step = min(current['rem'], next_arrival - t if next_arrival > t else current['rem'])
+        current['rem'] -= step
+        t += step
+
+        if current['rem'] == 0:
+            sch.append((current['job'], start, t, current['pid']))
+            if t > current['dl']:
+                miss.append((current['job'], current['dl'], current['pid']))
+            current = None
+
+        if t >= maxt:
+            break
+
+    return sch, miss
+
+
+
+ALGORITHMS = {
+    "FCFS": run_fcfs,
+    "SJN": run_sjn,
+    "SRT": run_srt,
+    "Priority": run_priority,
+    "Round Robin": run_round_robin,
+    "Multilevel Queues": run_multilevel_queues,
+    "ML": run_minimum_laxity,
+    "RMS": run_rms,
+    "EDF": run_edf
+}
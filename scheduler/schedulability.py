@@ -0,0 +1,164 @@
+"""Analytical schedulability tests for the real-time algorithms.
+
+These answer "will any deadline ever be missed?" for the task set repeating
+forever, without simulating it:
+
+* RMS: Liu & Layland utilization bound, then the hyperbolic bound, then
+  exact response-time analysis (RTA)
+* Priority: response-time analysis with the processes' fixed priorities
+* EDF: utilization when every deadline is at least the period, otherwise
+  the processor-demand criterion, checked with QPA (Zhang & Burns)
+
+``check`` picks the tests for an algorithm and returns a dict whose
+``schedulable`` entry is ``True`` (no deadline can be missed), ``False``
+(some deadline will be missed) or ``None`` (no conclusive test applies, so
+simulate).  The tests assume the worst case, all processes released
+together; a ``True`` verdict holds for any arrival offsets and for runs cut
+short by ``jc`` or ``maxt``, while ``False`` is only claimed for synchronous
+task sets.  Processes that equal each other in priority (or period, under
+RMS) are treated as interfering with each other, which is safe but
+pessimistic, so a failed RTA with such ties is inconclusive as well.
+"""
+from math import ceil
+
+# Algorithms with analytical tests
+ANALYZED = ("RMS", "Priority", "EDF")
+
+
+def utilization(procs):
+    return sum(p['execution'] / p['period'] for p in procs)
+
+
+def liu_layland_bound(n):
+    """Utilization bound n(2^(1/n) - 1) of RMS with implicit deadlines."""
+    return n * (2 ** (1 / n) - 1) if n else 1.0
+
+
+def liu_layland(procs):
+    """True if the utilization is within the Liu & Layland bound."""
+    return utilization(procs) <= liu_layland_bound(len(procs))
+
+
+def hyperbolic(procs):
+    """True if the product of (U_i + 1) is at most 2 (Bini, Buttazzo & Buttazzo)."""
+    product = 1.0
+    for p in procs:
+        product *= p['execution'] / p['period'] + 1
+    return product <= 2
+
+
+def response_times(procs, rank):
+    """Worst-case response time of each process under fixed priorities.
+
+    ``rank(p)`` orders processes, lower = higher priority; processes of
+    equal rank interfere with each other.  An entry is ``None`` once the
+    iteration exceeds that process's deadline (it is not schedulable).
+    """
+    times = []
+    for i, p in enumerate(procs):
+        c, d = p['execution'], p['deadline']
+        hp = [q for j, q in enumerate(procs) if j != i and rank(q) <= rank(p)]
+        r = c + sum(q['execution'] for q in hp)
+        while r <= d:
+            nxt = c + sum(-(-r // q['period']) * q['execution'] for q in hp)
+            if nxt == r:
+                break
+            r = nxt
+        times.append(r if r <= d else None)
+    return times
+
+
+def demand(procs, t):
+    """Processor demand: execution of all jobs with release and deadline in [0, t]."""
+    return sum(((t - p['deadline']) // p['period'] + 1) * p['execution']
+               for p in procs if t >= p['deadline'])
+
+
+def busy_period(procs):
+    """Length of the synchronous busy period (utilization must be at most 1)."""
+    w = sum(p['execution'] for p in procs)
+    while True:
+        nxt = sum(ceil(w / p['period']) * p['execution'] for p in procs)
+        if nxt == w:
+            return w
+        w = nxt
+
+
+def _last_deadline_before(procs, t):
+    # Latest absolute deadline strictly before t (synchronous release)
+    best = 0
+    for p in procs:
+        d, period = p['deadline'], p['period']
+        if t > d:
+            best = max(best, d + ((t - d - 1) // period) * period)
+    return best
+
+
+def qpa(procs):
+    """Quick processor-demand analysis for EDF; True if schedulable."""
+    u = utilization(procs)
+    if u > 1:
+        return False
+    dmin = min(p['deadline'] for p in procs)
+    limit = busy_period(procs)
+    if u < 1:
+        la = sum((p['period'] - p['deadline']) * p['execution'] / p['period'] for p in procs)
+        la = max(max(p['deadline'] for p in procs), la / (1 - u))
+        limit = min(limit, ceil(la))
+    t = _last_deadline_before(procs, limit + 1)
+    h = demand(procs, t)
+    while dmin < h <= t:
+        t = h if h < t else _last_deadline_before(procs, t)
+        h = demand(procs, t)
+    return h <= dmin
+
+
+def check(alg, procs):
+    """Run the analytical tests that apply to ``alg``.
+
+    Returns ``{'algorithm', 'test', 'schedulable', 'utilization'}`` plus
+    ``bound`` (utilization bounds) or ``response_times`` (RTA, ``None`` for
+    processes that miss).  ``test`` is ``None`` when nothing applies.
+    """
+    result = {'algorithm': alg, 'test': None, 'schedulable': None, 'utilization': None}
+    if not procs or any(p['period'] <= 0 for p in procs):
+        return result  # Aperiodic processes: nothing to analyze
+    u = utilization(procs)
+    result['utilization'] = u
+    synchronous = len({p['arrival'] for p in procs}) == 1
+    implicit = all(p['deadline'] >= p['period'] for p in procs)
+    constrained = all(p['deadline'] <= p['period'] for p in procs)
+
+    if alg == "EDF":
+        if implicit:
+            result.update(test='Utilization', schedulable=u <= 1)
+        else:
+            ok = qpa(procs)
+            result.update(test='Processor demand', schedulable=ok if ok or synchronous else None)
+        return result
+
+    if alg not in ("RMS", "Priority"):
+        return result
+    if u > 1:
+        result.update(test='Utilization', schedulable=False)
+        return result
+    if alg == "RMS" and implicit:
+        if liu_layland(procs):
+            result.update(test='Liu & Layland', schedulable=True,
+                          bound=liu_layland_bound(len(procs)))
+            return result
+        if hyperbolic(procs):
+            result.update(test='Hyperbolic bound', schedulable=True)
+            return result
+    if not constrained:
+        return result
+    if alg == "RMS":
+        rank = lambda p: p['period']
+    else:
+        rank = lambda p: -p['priority']
+    times = response_times(procs, rank)
+    ok = None not in times
+    ties = len({rank(p) for p in procs}) < len(procs)
+    result.update(test='Response-time analysis', response_times=times,
+                  schedulable=ok if ok or (synchronous and not ties) else None)
+    return result
@@ -0,0 +1,133 @@
+"""Streaming destinations for simulation results.
+
+Pass a sink to ``scheduler.run`` (or any ``run_*`` function) and the engine
+hands it slices and missed deadlines in small batches as the simulation
+produces them, instead of returning two ever-growing lists::
+
+    with ColumnarSink("out/edf") as sink:
+        run("EDF", procs, jc, maxt, tq, sink=sink)
+    cols = open_columns("out/edf")       # read-only memory-mapped arrays
+
+A sink implements ``write(sch, miss)`` for one batch of ``(job, start, end,
+pid)`` slices and ``(job, deadline, pid)`` misses.  The lists are reused by
+the engine after the call, so sinks must copy (or write out) what they keep.
+"""
+import csv
+import json
+import os
+import sys
+from array import array
+from itertools import chain
+
+SLICE_COLUMNS = ('job', 'start', 'end', 'pid')
+MISS_COLUMNS = ('job', 'deadline', 'pid')
+
+
+class Sink:
+    """Base class: counts what it is given.  Use as a context manager."""
+
+    def __init__(self):
+        self.slices = 0
+        self.missed = 0
+
+    def write(self, sch, miss):
+        self.slices += len(sch)
+        self.missed += len(miss)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvSink(Sink):
+    """Slices to one CSV file, missed deadlines to another.
+
+    ``missed_path`` defaults to ``<slices_path stem>.missed.csv``.
+    """
+
+    def __init__(self, slices_path, missed_path=None):
+        super().__init__()
+        if missed_path is None:
+            missed_path = os.path.splitext(slices_path)[0] + '.missed.csv'
+        self.paths = (slices_path, missed_path)
+        self.files = [open(p, 'w', newline='') for p in self.paths]
+        self.writers = [csv.writer(f) for f in self.files]
+        self.writers[0].writerow(SLICE_COLUMNS)
+        self.writers[1].writerow(MISS_COLUMNS)
+
+    def write(self, sch, miss):
+        super().write(sch, miss)
+        self.writers[0].writerows(sch)
+        self.writers[1].writerows(miss)
+
+    def close(self):
+        for f in self.files:
+            f.close()
+
+
+class ColumnarSink(Sink):
+    """One raw little-endian int64 file per column, in a directory.
+
+    Slices go to ``job.i8``, ``start.i8``, ``end.i8`` and ``pid.i8``; missed
+    deadlines to ``missed_job.i8``, ``missed_deadline.i8`` and
+    ``missed_pid.i8``.  ``meta.json`` records the row counts (plus any
+    ``meta`` given) once the sink is closed; ``open_columns`` maps the files
+    back as NumPy arrays.
+    """
+
+    def __init__(self, directory, meta=None):
+        super().__init__()
+        self.meta = dict(meta or {})
+        if sys.byteorder != 'little' or array('q').itemsize != 8:
+            raise OSError("ColumnarSink needs a little-endian platform with 64-bit 'q' arrays")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.names = list(SLICE_COLUMNS) + [f"missed_{c}" for c in MISS_COLUMNS]
+        self.files = [open(os.path.join(directory, f"{name}.i8"), 'wb') for name in self.names]
+
+    def write(self, sch, miss):
+        super().write(sch, miss)
+        for rows, files in ((sch, self.files[:4]), (miss, self.files[4:])):
+            if rows:
+                flat = array('q', chain.from_iterable(rows))
+                for k, f in enumerate(files):
+                    flat[k::len(files)].tofile(f)
+
+    def close(self):
+        for f in self.files:
+            f.close()
+        self.meta.update({'dtype': '<i8', 'slices': self.slices, 'missed': self.missed,
+                          'columns': self.names})
+        with open(os.path.join(self.directory, 'meta.json'), 'w') as f:
+            json.dump(self.meta, f)
+
+
+def read_meta(directory):
+    with open(os.path.join(directory, 'meta.json')) as f:
+        return json.load(f)
+
+
+def open_columns(directory, meta=None):
+    """Map a ``ColumnarSink`` directory as a dict of read-only arrays.
+
+    Columns listed in ``meta['dtypes']`` use that dtype (and file extension)
+    instead of int64.
+    """
+    import numpy as np
+    if meta is None:
+        meta = read_meta(directory)
+    dtypes = meta.get('dtypes', {})
+    cols = {}
+    for name in meta['columns']:
+        n = meta['missed' if name.startswith('missed_') else 'slices']
+        dtype = np.dtype(dtypes.get(name, meta['dtype']))
+        path = os.path.join(directory, f"{name}.{dtype.kind}{dtype.itemsize}")
+        # np.memmap cannot map empty files
+        cols[name] = (np.memmap(path, dtype=dtype, mode='r', shape=(n,)) if n
+                      else np.empty(0, dtype=dtype))
+    return cols
@@ -0,0 +1,291 @@
+"""Schedule statistics shared by the GUI, the CLI and algorithm comparison.
+
+``analyze`` turns a schedule into per-job and per-process arrays in a few
+NumPy passes (one sort, grouped reductions) rather than Python loops, so it
+stays fast for millions of slices and works directly on result-store columns.
+
+Definitions, per job:
+
+* a job is *completed* once its slices add up to its execution time
+* response time = completion - release
+* waiting time  = response time - executed time
+* lateness      = completion - absolute deadline; tardiness = max(lateness, 0)
+
+Per process, *jitter* is the spread (max - min) of its jobs' response times.
+A context switch is any change of job between consecutive slices, and idle
+time is the part of ``[0, last slice end]`` the CPU spends without a slice.
+For a multiprocessor schedule (``core`` gives each slice's core, see
+``scheduler.multicore``) both are counted per core and summed, and a
+*migration* is a job resuming on another core than its previous slice ran on.
+The ``(start, end, kind)`` slices of a run with ``scheduler.overhead`` costs
+count as neither busy nor idle time: their total is the overhead time.
+
+Given the ``SteadyState`` of a run cut short by ``scheduler.hyperperiod``,
+the figures are extrapolated to the full horizon ``maxt``: every job that
+completes in the repeating part, and every context switch in it, is counted
+once per repetition before ``maxt``.
+"""
+import csv
+
+import numpy as np
+
+from .jobs import release_deadline, tuple_columns
+from .overhead import KINDS
+
+PERCENTILES = (50, 95, 99)
+# Per-process columns, in export order
+PROCESS_FIELDS = ('process', 'jobs', 'completed', 'missed', 'avg_response', 'max_response',
+                  'avg_waiting', 'max_tardiness', 'jitter',
+                  'p50_response', 'p95_response', 'p99_response')
+
+
+def _columns(rows, names, width):
+    # Columns of a list of tuples or of a store's Columns
+    if hasattr(rows, 'names'):
+        return [np.asarray(getattr(rows, name)) for name in names]
+    return tuple_columns(rows, width)
+
+
+def _percentiles(values, weights=None):
+    if not len(values) or (weights is not None and not weights.sum()):
+        return [0.0] * len(PERCENTILES)
+    if weights is None:
+        return np.percentile(values, PERCENTILES).tolist()
+    # np.percentile of the values repeated ``weights`` times, without repeating them
+    order = np.argsort(values, kind='stable')
+    values, cum = values[order], np.cumsum(weights[order])
+    rank = np.array(PERCENTILES) / 100 * (cum[-1] - 1)
+    lo = np.floor(rank)
+    below = values[np.searchsorted(cum, lo, side='right')]
+    above = values[np.searchsorted(cum, np.minimum(lo + 1, cum[-1] - 1), side='right')]
+    return (below + (rank - lo) * (above - below)).tolist()
+
+
+def _mean(values, weights):
+    total = weights.sum()
+    return float((values * weights).sum() / total) if total else 0.0
+
+
+def _busy_before(start, end, t):
+    # CPU time of the slices spent before time t
+    return int((np.minimum(end, t) - np.minimum(start, t)).sum())
+
+
+class Analysis:
+    """Per-job, per-process and overall statistics of one schedule.
+
+    Per-job arrays (one entry per job that ran, ordered by process then job):
+    ``pid``, ``job``, ``release``, ``deadline``, ``start``, ``completion``,
+    ``executed``, ``completed``, ``missed``, ``response``, ``waiting``,
+    ``lateness`` and ``tardiness``, plus ``weight``: how many jobs of the full
+    run each one stands for (1 unless ``steady`` is given), and ``ran``: how
+    many of those start before the horizon, finished or not.
+    """
+
+    def __init__(self, sch, miss, procs, steady=None, maxt=None, core=None, cores=1,
+                 overhead=None):
+        self.procs = procs
+        self.steady = steady
+        self.cores = cores
+        job, start, end, pid = _columns(sch, ('job', 'start', 'end', 'pid'), 4)
+        core = (np.zeros(len(job), dtype=np.int64) if core is None
+                else np.asarray(core, dtype=np.int64))
+        mjob, _, mpid = _columns(miss, ('job', 'deadline', 'pid'), 3)
+        self.missed_count = len(mjob)
+        self.slices = len(job)
+        width = 1 + int(max(job.max(initial=0), mjob.max(initial=0)))
+        key = pid * width + job
+        dur = end - start
+
+        # Context switches: job changes between consecutive slices in time order
+        by_time = np.argsort(start, kind='stable')
+        if cores == 1:
+            self.context_switches = int(np.count_nonzero(np.diff(key[by_time])))
+        else:
+            by_core = np.lexsort((start, core))
+            same_core = np.diff(core[by_core]) == 0
+            self.context_switches = int(np.count_nonzero(same_core & (np.diff(key[by_core]) != 0)))
+        self.busy = int(dur.sum())
+        self.makespan = int(end.max(initial=0))
+
+        # Group slices per job (sorted by key, then start) and reduce each group
+        order = np.lexsort((start, key))
+        ks = key[order]
+        first = np.flatnonzero(np.r_[True, ks[1:] != ks[:-1]]) if len(ks) else np.empty(0, int)
+        moved = (ks[1:] == ks[:-1]) & (np.diff(core[order]) != 0)
+        self.migrations = int(np.count_nonzero(moved))
+        self.pid = pid[order][first]
+        self.job = job[order][first]
+        self.start = start[order][first]
+        self.completion = (np.maximum.reduceat(end[order], first) if len(first)
+                           else np.empty(0, dtype=np.int64))
+        self.executed = (np.add.reduceat(dur[order], first) if len(first)
+                         else np.empty(0, dtype=np.int64))
+        self.release, self.deadline = release_deadline(procs, self.job, self.pid)
+        execution = np.array([p['execution'] for p in procs], dtype=np.int64)
+        self.completed = self.executed >= execution[self.pid]
+        self.missed = np.isin(ks[first], mpid * width + mjob)
+        self.response = self.completion - self.release
+        self.waiting = self.response - self.executed
+        self.lateness = self.completion - self.deadline
+        self.tardiness = np.maximum(self.lateness, 0)
+        self.weight = np.ones(len(self.job), dtype=np.int64)
+        self.ran = self.weight
+
+        if steady is not None:
+            self._extrapolate(steady, maxt, job[by_time], start[by_time], end[by_time],
+                              pid[by_time], key[by_time])
+        # Overhead time per kind (dispatch, switch, reload)
+        self.overhead = np.zeros(len(KINDS), dtype=np.int64)
+        if overhead:
+            ostart, oend, okind = _columns(overhead, ('start', 'end', 'kind'), 3)
+            self.overhead = np.bincount(okind, oend - ostart, len(KINDS)).astype(np.int64)
+            self.makespan = max(self.makespan, int(oend.max()))
+        self.idle = self.cores * self.makespan - self.busy - int(self.overhead.sum())
+
+    def _extrapolate(self, steady, maxt, job, start, end, pid, key):
+        # Weights, busy time, makespan and switches of the full run from the
+        # time-sorted slices of one that stopped at steady.end.  Completions in
+        # (start, end] and slices starting in [start, end) form the repeating part
+        a, b, period = steady.start, steady.end, steady.period
+        repeat = self.completion > a
+        if steady.bounded:
+            self.weight[repeat] = steady.copies(self.completion[repeat], maxt)
+            # A job still running at maxt has run but is not completed
+            self.ran = self.weight.copy()
+            self.ran[repeat] = steady.copies(self.start[repeat], maxt - 1)
+        else:
+            # Every job released before maxt runs to completion
+            self.weight[repeat] = steady.copies(self.release[repeat], maxt - 1)
+            self.ran = self.weight
+        # Jobs unfinished at the cut are copies of ones finished in the window
+        self.weight[~self.completed] = 0
+        self.ran[~self.completed] = 0
+        self.missed_count = int(self.weight[self.missed].sum())
+
+        if steady.bounded:
+            k, r = divmod(maxt - a, period)
+            window = _busy_before(start, end, b) - _busy_before(start, end, a)
+            self.busy = k * window + _busy_before(start, end, a + r)
+            if window:
+                # Last busy instant at or before maxt, in the window's phase
+                phase = a + r
+                last = np.minimum(end[start < phase], phase).max(initial=a)
+                if last <= a:
+                    last = np.minimum(end[start < b], b).max() - period
+                self.makespan = int(maxt - (phase - last))
+            horizon = maxt
+        else:
+            self.busy = int((self.weight * self.executed).sum())
+            ran = self.weight > 0
+            last = self.completion[ran] + (self.weight[ran] - 1) * period
+            self.makespan = int(last.max(initial=self.makespan))
+            horizon = self.makespan
+
+        # Switches before the window count once and inside it once per copy.
+        # The one into the window's first slice counts once from the prefix,
+        # then once per later copy if the window's last slice (one period
+        # earlier) belongs to another job
+        changed = np.diff(key) != 0
+        first = int(np.searchsorted(start, a))
+        switches = int(changed[:max(first - 1, 0)].sum())
+        if first < len(start):
+            copies = np.maximum(steady.copies(start[first:], horizon - 1), 0)
+            switches += int((copies[1:] * changed[first:]).sum())
+            if first:
+                switches += int(changed[first - 1])
+            shift = np.array([period // p['period'] if p['period'] > 0 else 0
+                              for p in self.procs], dtype=np.int64)
+            f, last = first, len(start) - 1
+            same = pid[last] == pid[f] and job[last] - shift[pid[last]] == job[f]
+            switches += int(max(copies[0] - 1, 0) * (not same))
+        self.context_switches = switches
+
+    def summary(self):
+        """Overall figures (averages over completed jobs)."""
+        done = self.completed
+        if self.steady is None:
+            n = int(done.sum())
+            response = self.response[done]
+            p50, p95, p99 = _percentiles(response)
+            avg_response = float(response.mean()) if n else 0.0
+            avg_waiting = float(self.waiting[done].mean()) if n else 0.0
+        else:
+            w = self.weight[done]
+            n = int(w.sum())
+            p50, p95, p99 = _percentiles(self.response[done], w)
+            avg_response = _mean(self.response[done], w)
+            avg_waiting = _mean(self.waiting[done], w)
+        return {
+            'jobs': n,
+            'missed': self.missed_count,
+            'miss_ratio': self.missed_count / n if n else 0.0,
+            'avg_response': avg_response,
+            'avg_waiting': avg_waiting,
+            'p50_response': p50,
+            'p95_response': p95,
+            'p99_response': p99,
+            'max_tardiness': int(self.tardiness[done].max(initial=0)),
+            'busy_time': self.busy,
+            'idle_time': self.idle,
+            'context_switches': self.context_switches,
+            'migrations': self.migrations,
+            'overhead_time': int(self.overhead.sum()),
+        }
+
+    def per_process(self):
+        """One dict of ``PROCESS_FIELDS`` per process."""
+        rows = []
+        # Jobs are ordered by process, so each process is one contiguous range
+        bounds = np.searchsorted(self.pid, np.arange(len(self.procs) + 1))
+        for i, p in enumerate(self.procs):
+            sl = slice(bounds[i], bounds[i + 1])
+            done = self.completed[sl]
+            response = self.response[sl][done]
+            n = len(response)
+            if self.steady is None:
+                counts = [int(bounds[i + 1] - bounds[i]), n, int(self.missed[sl].sum())]
+                means = [float(response.mean()) if n else 0.0,
+                         float(self.waiting[sl][done].mean()) if n else 0.0]
+                percentiles = _percentiles(response)
+            else:
+                w = self.weight[sl]
+                counts = [int(self.ran[sl].sum()), int(w[done].sum()),
+                          int(w[self.missed[sl]].sum())]
+                means = [_mean(response, w[done]), _mean(self.waiting[sl][done], w[done])]
+                percentiles = _percentiles(response, w[done])
+            rows.append(dict(zip(PROCESS_FIELDS, [p['name']] + counts + [
+                means[0],
+                int(response.max(initial=0)),
+                means[1],
+                int(self.tardiness[sl][done].max(initial=0)),
+                int(response.max() - response.min()) if n else 0,
+            ] + percentiles)))
+        return rows
+
+    def to_dict(self):
+        return {'summary': self.summary(), 'processes': self.per_process(),
+                'overhead': dict(zip(KINDS, self.overhead.tolist()))}
+
+    def write_csv(self, path):
+        """Per-process statistics as CSV."""
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, PROCESS_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.per_process())
+
+
+def analyze(sch, miss, procs, steady=None, maxt=None, core=None, cores=1, overhead=None):
+    """``Analysis`` of a schedule (lists of tuples or result-store columns).
+
+    Pass the ``SteadyState`` and horizon of a ``run_steady`` result to
+    extrapolate to the full run, the per-slice ``core`` list of a
+    ``scheduler.multicore`` run and its number of ``cores``, or the
+    ``overhead`` slices of a run with ``scheduler.overhead`` costs.
+    """
+    return Analysis(sch, miss, procs, steady, maxt, core, cores, overhead)
+
+
+def summarize(sch, miss, procs, steady=None, maxt=None, overhead=None):
+    """Summary of one schedule (see ``Analysis.summary``)."""
+    return analyze(sch, miss, procs, steady, maxt, overhead=overhead).summary()
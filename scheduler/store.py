@@ -0,0 +1,121 @@
+"""Memory-mapped schedule results.
+
+A result store is a ``ColumnarSink`` directory plus a per-slice ``missed``
+flag (``missed.b1``) and the run's settings in ``meta.json``.  Opening one
+maps the column files read-only, so a 10M-slice run reopens instantly, the
+GUI and statistics code read it without copying, and worker processes share
+it by path: a pickled ``ResultStore`` is just its directory name.
+
+    store = save_result("runs/edf", sch, miss, algorithm="EDF", processes=procs)
+    store = ResultStore("runs/edf")
+    store.schedule.start, store.schedule.missed   # NumPy memmaps
+    store.missed.deadline
+
+Schedules can also be streamed straight into a store with ``ResultSink``.
+"""
+import os
+
+from .sinks import ColumnarSink, open_columns, read_meta
+
+# Slices processed at a time when deriving the per-slice missed flag
+CHUNK = 1 << 20
+
+
+class Columns:
+    """Named equal-length arrays with attribute access.
+
+    Iterating yields row tuples (like the engine's lists), so code written for
+    ``sch``/``miss`` lists keeps working; array code uses the attributes.
+    """
+
+    def __init__(self, names, arrays):
+        self.names = tuple(names)
+        for name, a in zip(self.names, arrays):
+            setattr(self, name, a)
+
+    def __len__(self):
+        return len(getattr(self, self.names[0]))
+
+    def __iter__(self):
+        return zip(*(getattr(self, name).tolist() for name in self.names))
+
+
+class ResultSink(ColumnarSink):
+    """``ColumnarSink`` that finishes the directory as a result store.
+
+    ``meta`` holds the run's settings (algorithm, processes, jobs, ...).
+    """
+
+    def __init__(self, directory, **meta):
+        super().__init__(directory, meta)
+
+    def close(self):
+        import numpy as np
+        for f in self.files:
+            f.close()
+        self.meta.update({'dtype': '<i8', 'slices': self.slices, 'missed': self.missed,
+                          'columns': self.names})
+        cols = open_columns(self.directory, self.meta)
+
+        # A slice is flagged when its (job, pid) missed its deadline
+        width = 1 + int(max(cols['job'].max(initial=0), cols['missed_job'].max(initial=0)))
+        keys = np.sort(cols['missed_pid'] * width + cols['missed_job'])
+        with open(os.path.join(self.directory, 'missed.b1'), 'wb') as f:
+            for i in range(0, self.slices, CHUNK):
+                k = cols['pid'][i:i + CHUNK] * width + cols['job'][i:i + CHUNK]
+                pos = np.minimum(np.searchsorted(keys, k), max(len(keys) - 1, 0))
+                flag = keys[pos] == k if len(keys) else np.zeros(len(k), dtype=bool)
+                flag.tofile(f)
+        del cols
+
+        self.names = self.names[:4] + ['missed'] + self.names[4:]
+        self.meta.update({'columns': self.names, 'dtypes': {'missed': '|b1'}})
+        super().close()
+
+    def store(self):
+        return ResultStore(self.directory)
+
+
+class ResultStore:
+    """Read-only view of a result store directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.meta = read_meta(directory)
+        if 'missed' not in self.meta['columns']:
+            raise ValueError(f"{directory} is not a result store (no missed flag)")
+        cols = open_columns(directory, self.meta)
+        self.schedule = Columns(('job', 'start', 'end', 'pid'),
+                                [cols[k] for k in ('job', 'start', 'end', 'pid')])
+        # Per-slice flag; not part of the row tuples, which match the engine's
+        self.schedule.missed = cols['missed']
+        self.missed = Columns(('job', 'deadline', 'pid'),
+                              [cols[f"missed_{k}"] for k in ('job', 'deadline', 'pid')])
+
+    def __len__(self):
+        return len(self.schedule)
+
+    def __reduce__(self):
+        # Share by path: the receiving process maps the same files
+        return ResultStore, (self.directory,)
+
+
+def _chunks(rows, names):
+    # Lists of row tuples, CHUNK at a time, from a list or from Columns
+    if isinstance(rows, Columns):
+        arrays = [getattr(rows, name) for name in names]
+        for i in range(0, len(rows), CHUNK):
+            yield list(zip(*(a[i:i + CHUNK].tolist() for a in arrays)))
+    else:
+        for i in range(0, len(rows), CHUNK):
+            yield rows[i:i + CHUNK]
+
+
+def save_result(directory, sch, miss, **meta):
+    """Write ``(sch, miss)`` (lists or another store's columns) to a store and open it."""
+    with ResultSink(directory, **meta) as sink:
+        for rows in _chunks(sch, ('job', 'start', 'end', 'pid')):
+            sink.write(rows, [])
+        for rows in _chunks(miss, ('job', 'deadline', 'pid')):
+            sink.write([], rows)
+    return sink.store()
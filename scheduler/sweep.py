@@ -0,0 +1,165 @@
+"""Monte Carlo schedulability sweeps: ``python -m scheduler.sweep``.
+
+Random task sets are drawn at each target utilization with UUniFast, every
+selected algorithm simulates them, and the fraction of task sets with no
+missed deadline (the acceptance ratio) is written per utilization and
+algorithm.
+
+Periods are drawn from ``PERIODS``, whose hyperperiod is 100000, and all
+tasks arrive at 0, so simulating one hyperperiod decides schedulability
+exactly.  Periods are large so that rounding execution times to whole time
+units barely moves the utilization; the number of jobs (and so the cost) only
+depends on the period ratios.
+Work is split into chunks of task sets; each chunk is generated from its own
+seed inside a worker process and only acceptance counts come back.  The
+output CSV is rewritten (atomically) after every finished chunk, so it always
+holds the curves aggregated so far.
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .engine import ALGORITHMS, run
+
+# Periods with a small common hyperperiod relative to the shortest period
+PERIODS = tuple(100 * p for p in (10, 20, 25, 40, 50, 100, 125, 200, 250, 500, 1000))
+HYPERPERIOD = 100000
+
+
+def uunifast(n, u, rng):
+    """Split total utilization ``u`` into ``n`` uniformly distributed shares."""
+    shares = []
+    remaining = u
+    for i in range(1, n):
+        nxt = remaining * rng.random() ** (1 / (n - i))
+        shares.append(remaining - nxt)
+        remaining = nxt
+    shares.append(remaining)
+    return shares
+
+
+def random_taskset(rng, n, u, constrained=False):
+    """Synchronous periodic task set with total utilization close to ``u``.
+
+    Execution times are rounded to whole time units (at least 1), so the
+    actual utilization differs slightly from ``u``.  Deadlines equal periods
+    unless ``constrained``, in which case they are drawn from [e, p].
+    """
+    procs = []
+    for i, share in enumerate(uunifast(n, u, rng)):
+        period = rng.choice(PERIODS)
+        execution = min(period, max(1, round(share * period)))
+        procs.append({
+            'id': i,
+            'name': f"T{i + 1}",
+            'arrival': 0,
+            'period': period,
+            'execution': execution,
+            'deadline': rng.randint(execution, period) if constrained else period,
+            'priority': i + 1,
+            'color': None
+        })
+    return procs
+
+
+def accepted(procs, alg):
+    """True when ``alg`` meets every deadline in one hyperperiod."""
+    if sum(p['execution'] / p['period'] for p in procs) > 1:
+        return False  # Overloaded: no uniprocessor algorithm can cope
+    jc = HYPERPERIOD // min(p['period'] for p in procs)
+    sch, miss = run(alg, procs, jc, HYPERPERIOD, 1)
+    if miss:
+        return False
+    # Jobs still unfinished at the horizon have missed their deadline too
+    done = {}
+    for j, s, e, pid in sch:
+        done[pid, j] = done.get((pid, j), 0) + e - s
+    return all(done.get((p['id'], j), 0) == p['execution']
+               for p in procs for j in range(HYPERPERIOD // p['period']))
+
+
+def run_chunk(seed, u, count, n, algorithms, constrained):
+    """Evaluate ``count`` task sets at utilization ``u``; return accept counts."""
+    rng = random.Random(seed)
+    counts = dict.fromkeys(algorithms, 0)
+    for _ in range(count):
+        procs = random_taskset(rng, n, u, constrained)
+        for alg in algorithms:
+            counts[alg] += accepted(procs, alg)
+    return counts
+
+
+def write_curves(path, totals, accepts, algorithms):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['utilization', 'algorithm', 'tasksets', 'accepted', 'ratio'])
+        for u in sorted(totals):
+            for alg in algorithms:
+                n, a = totals[u], accepts[u][alg]
+                writer.writerow([f"{u:.4f}", alg, n, a, f"{a / n:.6f}" if n else ''])
+    os.replace(tmp, path)
+
+
+def sweep(utilizations, sets, n, algorithms, output, chunk=250, workers=None,
+          seed=0, constrained=False, progress=None):
+    """Run the sweep and return ``(totals, accepts)`` keyed by utilization."""
+    totals = dict.fromkeys(utilizations, 0)
+    accepts = {u: dict.fromkeys(algorithms, 0) for u in utilizations}
+    rng = random.Random(seed)
+    jobs = []
+    for u in utilizations:
+        for start in range(0, sets, chunk):
+            jobs.append((rng.randrange(2 ** 63), u, min(chunk, sets - start)))
+
+    with ProcessPoolExecutor(workers) as ex:
+        pending = {ex.submit(run_chunk, s, u, c, n, algorithms, constrained): (u, c)
+                   for s, u, c in jobs}
+        finished = 0
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                u, c = pending.pop(fut)
+                totals[u] += c
+                for alg, a in fut.result().items():
+                    accepts[u][alg] += a
+                finished += 1
+            write_curves(output, totals, accepts, algorithms)
+            if progress is not None:
+                progress(finished / len(jobs))
+    return totals, accepts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m scheduler.sweep",
+                                     description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--tasks', type=int, default=8, help="tasks per task set")
+    parser.add_argument('--umin', type=float, default=0.5)
+    parser.add_argument('--umax', type=float, default=1.0)
+    parser.add_argument('--ustep', type=float, default=0.05)
+    parser.add_argument('-s', '--sets', type=int, default=1000,
+                        help="task sets per utilization")
+    parser.add_argument('-a', '--algorithms', nargs='+', default=["RMS", "EDF", "ML"],
+                        choices=sorted(ALGORITHMS), metavar='ALG')
+    parser.add_argument('--constrained', action='store_true',
+                        help="draw deadlines from [e, p] instead of d = p")
+    parser.add_argument('--chunk', type=int, default=250, help="task sets per work unit")
+    parser.add_argument('-w', '--workers', type=int, help="worker processes (default: CPUs)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default='acceptance.csv')
+    args = parser.parse_args(argv)
+
+    steps = int(round((args.umax - args.umin) / args.ustep)) + 1
+    utilizations = [round(args.umin + i * args.ustep, 6) for i in range(steps)]
+    sweep(utilizations, args.sets, args.tasks, args.algorithms, args.output,
+          args.chunk, args.workers, args.seed, args.constrained,
+          lambda f: print(f"\r{f * 100:5.1f}%", end='', file=sys.stderr, flush=True))
+    print(f"\nWrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
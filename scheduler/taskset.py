@@ -0,0 +1,182 @@
+"""Task-set files for the headless engine.
+
+A task set is either a JSON document or a CSV file.  JSON files hold either a
+bare list of processes or an object with a ``processes`` list plus optional
+simulation settings::
+
+    {
+        "processes": [
+            {"name": "P1", "arrival": 0, "period": 6, "execution": 2,
+             "deadline": 6, "priority": 1, "color": "#3498db"}
+        ],
+        "jobs": 2, "algorithm": "EDF", "quantum": 2, "max_time": 100
+    }
+
+CSV files have a header row naming the same process fields.  Only ``period``
+and ``execution`` are required; ``arrival`` defaults to 0, ``deadline`` to the
+period, ``priority`` to the row number and ``name`` to ``P<n>``.
+
+Large task sets can also be stored as NumPy ``.npz`` archives: one array per
+process field plus the settings as scalars.  These load as columns (see
+``load_columns``) without building a dict per process.
+"""
+import csv
+import json
+import os
+
+# Settings used when a task-set file does not provide them (GUI defaults)
+DEFAULTS = {
+    'jobs': 2,
+    'algorithm': "FCFS",
+    'quantum': 2,
+    'max_time': 100,
+}
+
+FIELDS = ('name', 'arrival', 'period', 'execution', 'deadline', 'priority', 'color')
+# Integer process fields, stored as int64 columns
+NUMERIC = ('arrival', 'period', 'execution', 'deadline', 'priority')
+
+
+def normalize_processes(rows, start=0):
+    """Turn loosely specified process records into engine process dicts.
+
+    ``start`` offsets ids, default names and priorities, for rows appended
+    after ``start`` existing processes.
+    """
+    procs = []
+    for i, row in enumerate(rows, start):
+        try:
+            period = int(row['period'])
+            execution = int(row['execution'])
+        except KeyError as e:
+            raise ValueError(f"Process {i + 1} is missing field {e}") from None
+
+        def get(key, default):
+            val = row.get(key)
+            return default if val in (None, '') else int(val)
+
+        procs.append({
+            'id': i,
+            'name': row.get('name') or f"P{i + 1}",
+            'arrival': get('arrival', 0),
+            'period': period,
+            'execution': execution,
+            'deadline': get('deadline', period),
+            'priority': get('priority', i + 1),
+            'color': row.get('color') or None
+        })
+    return procs
+
+
+def parse_processes(text, start=0):
+    """Parse CSV text (e.g. pasted from a spreadsheet) into process dicts.
+
+    With a header row the columns are named as in task-set files.  Without
+    one, two columns are ``period, execution`` and more are taken in process
+    table order: ``arrival, period, execution, deadline, priority``.
+    Commas, semicolons and tabs are accepted as delimiters.
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return []
+    delimiter = max('\t,;', key=lines[0].count)
+    rows = [[cell.strip() for cell in row] for row in csv.reader(lines, delimiter=delimiter)]
+    if any(cell.lower() in FIELDS for cell in rows[0]):
+        header = [cell.lower() for cell in rows[0]]
+        rows = [dict(zip(header, row)) for row in rows[1:]]
+    else:
+        positional = ('arrival', 'period', 'execution', 'deadline', 'priority')
+        rows = [dict(zip(('period', 'execution') if len(row) == 2 else positional, row))
+                for row in rows]
+    return normalize_processes(rows, start)
+
+
+def process_columns(procs):
+    """Process dicts as columns: int64 arrays for ``NUMERIC``, lists for the rest."""
+    import numpy as np
+    cols = {k: np.array([p[k] for p in procs], dtype=np.int64).reshape(-1) for k in NUMERIC}
+    cols['name'] = [p.get('name') or f"P{i + 1}" for i, p in enumerate(procs)]
+    cols['color'] = [p.get('color') or None for p in procs]
+    return cols
+
+
+def column_processes(cols):
+    """Inverse of ``process_columns``."""
+    rows = zip(*(cols[k].tolist() for k in NUMERIC))
+    return [dict(zip(NUMERIC, vals), id=i, name=name, color=color)
+            for i, (vals, name, color) in enumerate(zip(rows, cols['name'], cols['color']))]
+
+
+def _is_npz(path):
+    return os.path.splitext(path)[1].lower() == '.npz'
+
+
+def load_columns(path):
+    """Load a task-set file as ``(columns, settings)`` (see ``process_columns``)."""
+    if not _is_npz(path):
+        procs, settings = load_taskset(path)
+        return process_columns(procs), settings
+    import numpy as np
+    settings = dict(DEFAULTS)
+    with np.load(path, allow_pickle=False) as data:
+        try:
+            cols = {k: data[k].astype(np.int64) for k in NUMERIC}
+        except KeyError as e:
+            raise ValueError(f"Task-set archive is missing field {e}") from None
+        n = len(cols['period'])
+        cols['name'] = (data['name'].tolist() if 'name' in data
+                        else [f"P{i + 1}" for i in range(n)])
+        cols['color'] = ([c or None for c in data['color'].tolist()] if 'color' in data
+                         else [None] * n)
+        settings.update({k: data[k].item() for k in DEFAULTS if k in data})
+    return cols, settings
+
+
+def save_taskset(path, procs, settings):
+    """Write processes (dicts or ``process_columns`` columns) and settings.
+
+    ``.npz`` paths get a compressed NumPy archive, anything else JSON.
+    """
+    settings = {k: settings[k] for k in DEFAULTS if k in settings}
+    if _is_npz(path):
+        import numpy as np
+        cols = procs if isinstance(procs, dict) else process_columns(procs)
+        # Write through a file object so numpy does not append another ".npz"
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f, **{k: cols[k] for k in NUMERIC},
+                name=np.array(cols['name'], dtype=str),
+                color=np.array([c or '' for c in cols['color']], dtype=str),
+                **settings)
+        return
+    if isinstance(procs, dict):
+        procs = column_processes(procs)
+    # One process per line keeps the file readable and, unlike indent=, lets
+    # every line go through the C encoder
+    encode = json.JSONEncoder().encode
+    lines = ['  ' + encode({k: p[k] for k in FIELDS if p.get(k) is not None}) for p in procs]
+    lines = [',\n'.join(lines)] if lines else []
+    with open(path, 'w') as f:
+        f.write('{\n "processes": [\n' + ''.join(line + '\n' for line in lines) + ' ]')
+        f.write(''.join(f',\n {encode(k)}: {encode(v)}' for k, v in settings.items()))
+        f.write('\n}\n')
+
+
+def load_taskset(path):
+    """Load a task-set file and return ``(procs, settings)``."""
+    if _is_npz(path):
+        cols, settings = load_columns(path)
+        return column_processes(cols), settings
+    settings = dict(DEFAULTS)
+    if os.path.splitext(path)[1].lower() == '.csv':
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+    else:
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            rows = data.get('processes', [])
+            settings.update({k: data[k] for k in DEFAULTS if k in data})
+        else:
+            rows = data
+    return normalize_processes(rows), settings
@@ -0,0 +1,67 @@
+import os
+
+from scheduler.cache import ResultCache, cached_run, fingerprint
+from scheduler.engine import run
+from scheduler.hyperperiod import SteadyState
+
+PROCS = [{'id': 0, 'name': "P1", 'arrival': 0, 'period': 4, 'execution': 1, 'deadline': 4,
+          'priority': 1, 'color': None},
+         {'id': 1, 'name': "P2", 'arrival': 1, 'period': 6, 'execution': 2, 'deadline': 5,
+          'priority': 2, 'color': None}]
+
+
+def with_field(key, value):
+    return [dict(PROCS[0], **{key: value})] + PROCS[1:]
+
+
+def test_fingerprint_covers_only_what_changes_the_schedule():
+    key = fingerprint("EDF", PROCS, 5, 100, 2)
+    assert fingerprint("EDF", with_field('name', "Sensor"), 5, 100, 2) == key
+    assert fingerprint("EDF", with_field('color', "#ff0000"), 5, 100, 2) == key
+    changed = [fingerprint("RMS", PROCS, 5, 100, 2), fingerprint("EDF", PROCS, 6, 100, 2),
+               fingerprint("EDF", PROCS, 5, 101, 2), fingerprint("EDF", PROCS, 5, 100, 3),
+               fingerprint("EDF", PROCS, 5, 100, 2, steady=True)]
+    changed += [fingerprint("EDF", with_field(k, 3), 5, 100, 2)
+                for k in ('arrival', 'period', 'execution', 'deadline', 'priority')]
+    changed += [fingerprint("EDF", PROCS, 5, 100, 2, options={'recheck': 2})]
+    assert len({key, *changed}) == len(changed) + 1
+    assert fingerprint("EDF", PROCS, 5, 100, 2, options={}) == key
+
+
+def test_memory_tier_is_lru_bounded_by_entries_and_slices():
+    cache = ResultCache(maxsize=2, max_slices=10)
+    cache.put('a', [(0, 0, 1, 0)] * 4, [])
+    cache.put('b', [(0, 0, 1, 0)] * 4, [])
+    assert cache.get('a') is not None  # now most recently used
+    cache.put('c', [(0, 0, 1, 0)] * 1, [])
+    assert list(cache.entries) == ['a', 'c'] and cache.slices == 5
+    # The newest result is kept even when it alone exceeds max_slices
+    cache.put('d', [(0, 0, 1, 0)] * 20, [])
+    assert list(cache.entries) == ['d'] and cache.slices == 20
+    assert cache.get('b') is None and (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cached_run_hits_and_matches_run():
+    cache = ResultCache()
+    expected = run("EDF", PROCS, 5, 100, 2)
+    assert cached_run(cache, "EDF", PROCS, 5, 100, 2) == expected + (None,)
+    renamed = with_field('name', "Sensor")
+    assert cached_run(cache, "EDF", renamed, 5, 100, 2) == expected + (None,)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    directory = str(tmp_path)
+    sch, miss, steady = cached_run(ResultCache(directory=directory), "EDF", PROCS, 10**6,
+                                   10**6, 2, steady=True)
+    assert isinstance(steady, SteadyState)
+    assert not [name for name in os.listdir(directory) if name.endswith('.tmp')]
+
+    cache = ResultCache(directory=directory)
+    hit = cached_run(cache, "EDF", PROCS, 10**6, 10**6, 2, steady=True)
+    assert cache.hits == 1
+    assert list(hit[0]) == sch and list(hit[1]) == miss
+    assert hit[2].to_dict() == steady.to_dict()
+    # Clearing memory falls back to the disk copy
+    cache.clear()
+    assert cache.get(fingerprint("EDF", PROCS, 10**6, 10**6, 2, True)) is not None
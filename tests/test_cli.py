@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+from scheduler.__main__ import main
+from scheduler.taskset import save_taskset
+
+PROCS = [{'id': 0, 'name': "P1", 'arrival': 0, 'period': 100, 'execution': 6, 'deadline': 100,
+          'priority': 1, 'color': None},
+         {'id': 1, 'name': "P2", 'arrival': 0, 'period': 100, 'execution': 6, 'deadline': 100,
+          'priority': 2, 'color': None}]
+
+
+@pytest.fixture
+def taskset(tmp_path):
+    path = str(tmp_path / "tasks.json")
+    save_taskset(path, PROCS, {'jobs': 1, 'algorithm': "MLFQ", 'quantum': 2, 'max_time': 50})
+    return path
+
+
+def schedule(capsys, *argv):
+    main(list(argv))
+    doc = json.loads(capsys.readouterr().out)
+    return [(s['start'], s['end'], s['pid']) for s in doc['schedule']]
+
+
+def test_mlfq_flags(taskset, capsys):
+    assert schedule(capsys, taskset, '--mlfq-quanta', '2,4', '--mlfq-boost', '0') == [
+        (0, 2, 0), (2, 4, 1), (4, 8, 0), (8, 12, 1)]
+    assert schedule(capsys, taskset, '--mlfq-levels', '1') == [
+        (0, 2, 0), (2, 4, 1), (4, 6, 0), (6, 8, 1), (8, 10, 0), (10, 12, 1)]
+
+
+@pytest.mark.parametrize('argv', [['--mlfq-quanta', '2,0'], ['--mlfq-boost', '-1'],
+                                  ['--mlfq-levels', '0'], ['--mlfq-quanta', 'x'],
+                                  ['--mlfq-levels', '2', '--mlfq-quanta', '1,2'],
+                                  ['--mlfq-levels', '2', '--steady'], ['-q', '0']])
+def test_rejects_bad_mlfq_flags(taskset, argv):
+    with pytest.raises(SystemExit):
+        main([taskset] + argv)
+
+
+@pytest.mark.parametrize('argv', [['--stream', 'out', '--steady'], ['--compare', '--steady'],
+                                  ['--analyze', '--steady'], ['--analyze', '--compare'],
+                                  ['--analyze', '--stream', 'out'],
+                                  ['--compare', '--stream', 'out'],
+                                  ['--stream', 'out', '--cache', 'c'],
+                                  ['--compare', '--cache', 'c'], ['--analyze', '--cache', 'c'],
+                                  ['--cores', '2', '--cache', 'c'],
+                                  ['--switch-cost', '1', '--cache', 'c']])
+def test_rejects_ignored_combinations(taskset, argv):
+    with pytest.raises(SystemExit):
+        main([taskset] + argv)
+
+
+def test_cache_keys_algorithm_options(taskset, tmp_path, capsys):
+    cache = str(tmp_path / "cache")
+    plain = schedule(capsys, taskset, '--cache', cache)
+    assert schedule(capsys, taskset, '--cache', cache) == plain
+    custom = schedule(capsys, taskset, '--cache', cache, '--mlfq-levels', '1')
+    assert custom != plain
+    assert schedule(capsys, taskset, '--mlfq-levels', '1') == custom
+    assert len(os.listdir(cache)) == 2
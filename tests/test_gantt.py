@@ -0,0 +1,24 @@
+import numpy as np
+
+from scheduler.gantt import _Row
+
+
+def make_row(start, end):
+    start, end = np.array(start), np.array(end)
+    return _Row(np.arange(len(start)), start, end, np.zeros(len(start), bool), 0)
+
+
+def test_visible_finds_slices_hidden_behind_a_long_one():
+    # The first slice outlasts the next two, so ``end`` is not sorted
+    start, end = [0, 1, 2, 3, 20], [10, 2, 3, 12, 21]
+    row = make_row(start, end)
+    for x0, x1 in [(5, 6), (11, 13), (0, 1), (15, 25)]:
+        lo, hi = row.visible(x0, x1)
+        hit = [i for i in range(len(start)) if start[i] < x1 and end[i] > x0]
+        assert set(hit) <= set(range(lo, hi))
+
+
+def test_visible_without_overlap():
+    row = make_row([0, 2, 4], [1, 3, 5])
+    assert row.visible(2.5, 4.5) == (1, 3)
+    assert row.visible(5, 6) == (3, 3)
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from scheduler.bench import random_taskset
+from scheduler.engine import run
+from scheduler.hyperperiod import STEADY_ALGORITHMS, hyperperiod, run_steady, utilization
+from scheduler.stats import analyze
+
+
+def tasksets(count):
+    # Schedulable periodic sets with short hyperperiods and horizons off the cycle
+    seed = 0
+    while count:
+        r = random.Random(seed)
+        seed += 1
+        procs = random_taskset(r, r.randint(2, 5))
+        h = hyperperiod(procs)
+        if utilization(procs) > 1 or h > 500:
+            continue
+        count -= 1
+        yield procs, r.randint(1, 40) * h + r.randint(0, h)
+
+
+@pytest.mark.parametrize('alg', sorted(STEADY_ALGORITHMS))
+def test_steady_statistics_match_full_run(alg):
+    for procs, maxt in tasksets(60):
+        sch, miss, steady = run_steady(alg, procs, 10**6, maxt, 3)
+        analysis = analyze(sch, miss, procs, steady, maxt)
+        full = analyze(*run(alg, procs, 10**6, maxt, 3), procs)
+        assert analysis.summary() == full.summary()
+        for row, expected in zip(analysis.per_process(), full.per_process()):
+            assert row == pytest.approx(expected)
+
+
+def test_sjn_runs_in_full():
+    procs, maxt = next(tasksets(1))
+    assert run_steady("SJN", procs, 10**6, maxt, 3)[2] is None
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from scheduler.bench import random_taskset
+from scheduler.engine import run
+from scheduler.incremental import RESUMABLE, Simulation, first_affected
+
+EDITS = ('arrival', 'period', 'execution', 'deadline', 'priority')
+
+
+def edit(rng, procs):
+    # One field of one process changed, the way the process table edits it
+    procs = [dict(p) for p in procs]
+    p = rng.choice(procs)
+    key = rng.choice(EDITS)
+    if key == 'execution':
+        p[key] = max(1, p[key] + rng.choice((-1, 1)))
+    else:
+        p[key] = max(1, p[key] + rng.randint(-3, 3))
+    return procs
+
+
+@pytest.mark.parametrize('alg', sorted(RESUMABLE) + ["MLFQ"])
+def test_update_matches_full_run(alg):
+    rng = random.Random(alg)
+    for _ in range(10):
+        procs = random_taskset(rng, rng.randint(2, 6))
+        sim = Simulation(alg, procs, 50, 600, 3, interval=25)
+        assert sim.run() == run(alg, procs, 50, 600, 3)
+        for _ in range(5):
+            procs = edit(rng, procs)
+            assert sim.update(procs) == run(alg, procs, 50, 600, 3)
+
+
+def test_update_resumes_from_a_checkpoint():
+    procs = random_taskset(random.Random(7), 4)
+    procs[0]['arrival'] = 300
+    sim = Simulation("EDF", procs, 50, 600, 3, interval=25)
+    sim.run()
+    assert sim.resumed_at == 0
+    edited = [dict(p) for p in procs]
+    edited[0]['execution'] += 1
+    assert first_affected(procs, edited, "EDF") == 300
+    assert sim.update(edited) == run("EDF", edited, 50, 600, 3)
+    assert 0 < sim.resumed_at < 300
+
+
+def test_cosmetic_edits_change_nothing():
+    procs = random_taskset(random.Random(1), 3)
+    renamed = [dict(p, name=f"Task {i}", color="#000000") for i, p in enumerate(procs)]
+    assert first_affected(procs, renamed, "EDF") is None
+    # Priority only matters to priority-driven algorithms
+    reprioritized = [dict(p, priority=p['priority'] + 1) for p in procs]
+    assert first_affected(procs, reprioritized, "EDF") is None
+    assert first_affected(procs, reprioritized, "Priority") is not None
+    sim = Simulation("EDF", procs, 20, 200, 2)
+    sch, miss = sim.run()
+    assert sim.update(renamed) == (sch, miss)
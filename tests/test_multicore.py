@@ -0,0 +1,28 @@
+import pytest
+
+from scheduler.multicore import run_global, run_multicore
+
+
+def proc(i, arrival, execution, deadline):
+    return {'id': i, 'name': f"P{i}", 'arrival': arrival, 'period': 0,
+            'execution': execution, 'deadline': deadline, 'priority': 1}
+
+
+def test_release_preempts_running_job_while_a_core_is_idle():
+    # At t=1 one core is free: P1 takes it and P2 must displace P0
+    procs = [proc(0, 0, 10, 100), proc(1, 1, 2, 3), proc(2, 1, 2, 3)]
+    sch, miss, core = run_multicore("EDF", procs, 1, 100, 2, cores=2)
+    assert miss == []
+    assert sorted(sch) == [(0, 0, 1, 0), (0, 1, 3, 1), (0, 1, 3, 2), (0, 3, 12, 0)]
+
+
+def test_global_rejects_options():
+    with pytest.raises(ValueError):
+        run_global("ML", [proc(0, 0, 1, 5)], 1, 10, 2, recheck=2)
+
+
+def test_partitioned_honours_options():
+    procs = [proc(0, 0, 4, 10), proc(1, 0, 4, 10)]
+    sch, miss, core = run_multicore("Minimum Laxity", procs, 1, 100, 2, 2, "first-fit",
+                                    recheck=1)
+    assert miss == []
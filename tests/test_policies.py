@@ -0,0 +1,60 @@
+import pytest
+
+from scheduler.engine import run
+from scheduler.policies import MLFQ
+
+PROCS = [{'id': 0, 'name': "P1", 'arrival': 0, 'period': 5, 'execution': 3, 'deadline': 5,
+          'priority': 1}]
+
+
+def proc(i, arrival, execution):
+    return {'id': i, 'name': f"P{i + 1}", 'arrival': arrival, 'period': 1000,
+            'execution': execution, 'deadline': 1000, 'priority': 1}
+
+
+def mlfq(procs, **options):
+    sch, _ = run("MLFQ", procs, 1, 100, 2, **options)
+    return sch
+
+
+def test_mlfq_demotes_after_a_used_up_quantum():
+    # Both use up the top quantum of 2, then run 4 at a time one level down
+    sch = mlfq([proc(0, 0, 6), proc(1, 0, 6)], quanta=[2, 4], boost=0)
+    assert sch == [(0, 0, 2, 0), (0, 2, 4, 1), (0, 4, 8, 0), (0, 8, 12, 1)]
+
+
+def test_mlfq_higher_level_preempts_lower():
+    # P2 arrives in the top level while P1 runs one level down
+    sch = mlfq([proc(0, 0, 10), proc(1, 3, 2)], quanta=[2, 8], boost=0)
+    assert sch == [(0, 0, 2, 0), (0, 2, 3, 0), (0, 3, 5, 1), (0, 5, 12, 0)]
+
+
+def test_mlfq_boost_returns_jobs_to_the_top_level():
+    procs = [proc(0, 0, 30), proc(1, 0, 30)]
+    # Without a boost P2 waits in the bottom level and runs in one slice
+    assert mlfq(procs, quanta=[1, 100], boost=0)[-1] == (0, 31, 60, 1)
+    # Boosted at t=10, it starts again with the top-level quantum
+    assert mlfq(procs, quanta=[1, 100], boost=10)[-2:] == [(0, 31, 32, 1), (0, 32, 60, 1)]
+
+
+def test_mlfq_levels_default_to_doubling_quanta():
+    sch = mlfq([proc(0, 0, 7), proc(1, 0, 7)], levels=2, boost=0)
+    assert sch[:4] == [(0, 0, 2, 0), (0, 2, 4, 1), (0, 4, 8, 0), (0, 8, 12, 1)]
+
+
+@pytest.mark.parametrize('options', [{'quanta': [2, 0]}, {'quanta': [1.5]}, {'boost': -1},
+                                     {'levels': 0}, {'quanta': [1] * 257}])
+def test_mlfq_rejects_bad_quanta(options):
+    with pytest.raises(ValueError):
+        run("MLFQ", PROCS, 3, 50, 2, **options)
+
+
+def test_mlfq_rejects_zero_quantum():
+    with pytest.raises(ValueError):
+        run("MLFQ", PROCS, 3, 50, 0)
+
+
+def test_mlfq_check():
+    MLFQ.check([1, 2, 4], 0)
+    with pytest.raises(ValueError):
+        MLFQ.check([1, 2, 4], -5)
@@ -0,0 +1,79 @@
+import random
+
+import numpy as np
+import pytest
+
+from scheduler.bench import random_taskset
+from scheduler.engine import run
+from scheduler.stats import PERCENTILES, _percentiles, analyze, summarize
+
+
+def brute_force(sch, procs):
+    # Per-job figures the slow way: {(pid, job): (response, waiting)} for completed jobs
+    executed, completion = {}, {}
+    for j, s, e, pid in sch:
+        executed[pid, j] = executed.get((pid, j), 0) + e - s
+        completion[pid, j] = max(completion.get((pid, j), 0), e)
+    jobs = {}
+    for (pid, j), done in executed.items():
+        p = procs[pid]
+        if done >= p['execution']:
+            response = completion[pid, j] - (p['arrival'] + j * p['period'])
+            jobs[pid, j] = (response, response - done)
+    return jobs
+
+
+@pytest.mark.parametrize('alg', ["FCFS", "SRT", "Round Robin", "EDF"])
+def test_summary_matches_brute_force(alg):
+    for seed in range(20):
+        r = random.Random(seed)
+        procs = random_taskset(r, r.randint(1, 8))
+        sch, miss = run(alg, procs, 10, 300, 3)
+        jobs = brute_force(sch, procs)
+        summary = summarize(sch, miss, procs)
+        response = [resp for resp, _ in jobs.values()]
+        assert summary['jobs'] == len(jobs)
+        assert summary['missed'] == len(miss)
+        assert summary['avg_response'] == pytest.approx(np.mean(response) if jobs else 0.0)
+        assert summary['avg_waiting'] == pytest.approx(
+            np.mean([w for _, w in jobs.values()]) if jobs else 0.0)
+        assert [summary[f"p{q}_response"] for q in PERCENTILES] == pytest.approx(
+            np.percentile(response, PERCENTILES).tolist() if jobs else [0.0] * 3)
+        assert summary['busy_time'] == sum(e - s for _, s, e, _ in sch)
+        ordered = sorted(sch, key=lambda x: x[1])
+        assert summary['context_switches'] == sum(
+            (a[0], a[3]) != (b[0], b[3]) for a, b in zip(ordered, ordered[1:]))
+
+
+def test_weighted_percentiles_match_repeated_values():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        values = rng.integers(0, 100, rng.integers(1, 30))
+        weights = rng.integers(0, 5, len(values))
+        if not weights.sum():
+            continue
+        assert _percentiles(values, weights) == pytest.approx(
+            np.percentile(np.repeat(values, weights), PERCENTILES).tolist())
+
+
+def test_per_process_rows():
+    procs = [{'id': 0, 'name': "P1", 'arrival': 0, 'period': 4, 'execution': 2, 'deadline': 3,
+              'priority': 1},
+             {'id': 1, 'name': "P2", 'arrival': 0, 'period': 6, 'execution': 3, 'deadline': 4,
+              'priority': 2}]
+    sch, miss = run("FCFS", procs, 3, 20, 2)
+    rows = analyze(sch, miss, procs).per_process()
+    jobs = brute_force(sch, procs)
+    for pid, row in enumerate(rows):
+        response = [resp for (p, _), (resp, _) in jobs.items() if p == pid]
+        assert row['process'] == procs[pid]['name']
+        assert row['completed'] == len(response)
+        assert row['missed'] == sum(p == pid for _, _, p in miss)
+        assert row['max_response'] == max(response)
+        assert row['jitter'] == max(response) - min(response)
+
+
+def test_empty_schedule():
+    summary = summarize([], [], [])
+    assert summary['jobs'] == 0 and summary['avg_response'] == 0.0
+    assert summary['p99_response'] == 0.0
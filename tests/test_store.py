@@ -0,0 +1,50 @@
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from scheduler.bench import random_taskset
+from scheduler.engine import run
+from scheduler.sinks import ColumnarSink
+from scheduler.store import ResultSink, ResultStore, save_result
+
+PROCS = random_taskset(random.Random(3), 5)
+
+
+def test_save_and_reopen(tmp_path):
+    sch, miss = run("EDF", PROCS, 20, 400, 2)
+    directory = str(tmp_path / "edf")
+    save_result(directory, sch, miss, algorithm="EDF", processes=PROCS)
+    store = ResultStore(directory)
+    assert isinstance(store.schedule.start, np.memmap)
+    assert list(store.schedule) == sch and list(store.missed) == miss
+    assert store.meta['algorithm'] == "EDF" and store.meta['processes'] == PROCS
+    # A slice is flagged when its job missed its deadline
+    late = {(j, pid) for j, _, pid in miss}
+    assert store.schedule.missed.tolist() == [(j, pid) in late for j, _, _, pid in sch]
+
+
+def test_shared_by_path_and_copied(tmp_path):
+    sch, miss = run("Round Robin", PROCS, 20, 400, 2)
+    store = save_result(str(tmp_path / "rr"), sch, miss)
+    clone = pickle.loads(pickle.dumps(store))
+    assert clone.directory == store.directory and len(clone) == len(sch)
+    # Another store's columns are copied chunk by chunk
+    copy = save_result(str(tmp_path / "copy"), store.schedule, store.missed)
+    assert list(copy.schedule) == sch and list(copy.missed) == miss
+
+
+def test_streamed_store_matches_run(tmp_path):
+    sch, miss = run("SRT", PROCS, 20, 400, 2)
+    with ResultSink(str(tmp_path / "srt"), algorithm="SRT") as sink:
+        run("SRT", PROCS, 20, 400, 2, sink=sink)
+    store = sink.store()
+    assert list(store.schedule) == sch and list(store.missed) == miss
+
+
+def test_rejects_plain_columnar_directory(tmp_path):
+    with ColumnarSink(str(tmp_path / "raw")) as sink:
+        sink.write([(0, 0, 1, 0)], [])
+    with pytest.raises(ValueError):
+        ResultStore(str(tmp_path / "raw"))
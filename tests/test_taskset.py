@@ -0,0 +1,55 @@
+import pytest
+
+from scheduler.taskset import (DEFAULTS, load_columns, load_taskset, parse_processes,
+                               process_columns, save_taskset)
+
+PROCS = [
+    {'id': 0, 'name': "P1", 'arrival': 0, 'period': 6, 'execution': 2, 'deadline': 6,
+     'priority': 1, 'color': "#3498db"},
+    {'id': 1, 'name': "Sensor", 'arrival': 3, 'period': 10, 'execution': 4, 'deadline': 8,
+     'priority': 2, 'color': None},
+]
+SETTINGS = {'jobs': 5, 'algorithm': "EDF", 'quantum': 3, 'max_time': 250}
+
+
+@pytest.mark.parametrize('suffix', ['.json', '.npz'])
+def test_round_trip(tmp_path, suffix):
+    path = str(tmp_path / f"tasks{suffix}")
+    save_taskset(path, PROCS, SETTINGS)
+    assert load_taskset(path) == (PROCS, SETTINGS)
+
+
+@pytest.mark.parametrize('suffix', ['.json', '.npz'])
+def test_columns_round_trip(tmp_path, suffix):
+    path = str(tmp_path / f"tasks{suffix}")
+    save_taskset(path, process_columns(PROCS), SETTINGS)
+    cols, settings = load_columns(path)
+    assert settings == SETTINGS
+    expected = process_columns(PROCS)
+    assert cols['name'] == expected['name'] and cols['color'] == expected['color']
+    for key in ('arrival', 'period', 'execution', 'deadline', 'priority'):
+        assert cols[key].tolist() == expected[key].tolist()
+
+
+def test_csv_defaults(tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text("period,execution,deadline\n6,2,\n10,4,8\n")
+    procs, settings = load_taskset(str(path))
+    assert settings == DEFAULTS
+    assert [(p['name'], p['arrival'], p['deadline'], p['priority']) for p in procs] == [
+        ("P1", 0, 6, 1), ("P2", 0, 8, 2)]
+
+
+def test_bare_list_and_missing_field(tmp_path):
+    path = tmp_path / "tasks.json"
+    path.write_text('[{"period": 4, "execution": 1}]')
+    assert load_taskset(str(path))[0][0]['deadline'] == 4
+    path.write_text('[{"period": 4}]')
+    with pytest.raises(ValueError, match="execution"):
+        load_taskset(str(path))
+
+
+def test_parse_processes():
+    assert [p['period'] for p in parse_processes("6\t2\n10\t4")] == [6, 10]
+    procs = parse_processes("0;6;2;5;1\n1;10;4;9;2", start=2)
+    assert [(p['id'], p['name'], p['deadline']) for p in procs] == [(2, "P3", 5), (3, "P4", 9)]